@@ -0,0 +1,87 @@
+"""
+The integration end to end (real SDK websocket client included) against the stand-in server.
+
+    python -m benchmarks.bench_e2e --scenario steady flaky auth_expiry --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from custom_components.ge_home.const import CONF_API_BASE_URL
+from custom_components.ge_home.metrics import RollingSamples
+
+from .bench_fleet import LATENCY_SAMPLES, _ms, _print_table
+from .harness import async_running_integration
+from .standin_server import SCENARIOS, Scenario, StandInServer
+
+SAMPLE_INTERVAL = 0.1
+
+async def async_run(scenario: Scenario, duration: float) -> Dict[str, Any]:
+    server = StandInServer(scenario)
+    base_url = await server.async_start()
+    try:
+        async with ClientSession() as session:
+            started = time.monotonic()
+            async with async_running_integration(
+                scenario.appliances,
+                data={CONF_API_BASE_URL: base_url},
+                patches=[patch("custom_components.ge_home.update_coordinator.async_get_clientsession", return_value=session)]
+            ) as (hass, coordinator):
+                setup_time = time.monotonic() - started
+                metrics = coordinator.metrics
+                metrics.update_latency = latency = RollingSamples(LATENCY_SAMPLES)
+                messages_before = metrics.messages.total
+                writes_before = metrics.state_writes.total
+
+                # sample availability to see how long outages last
+                samples = available = 0
+                run_start = time.monotonic()
+                while time.monotonic() - run_start < duration:
+                    await asyncio.sleep(SAMPLE_INTERVAL)
+                    samples += 1
+                    available += coordinator.available
+                elapsed = time.monotonic() - run_start
+
+                messages = metrics.messages.total - messages_before
+                writes = metrics.state_writes.total - writes_before
+                reconnects = metrics.reconnects
+    finally:
+        await server.async_stop()
+
+    return {
+        "scenario": scenario.name,
+        "appliances": scenario.appliances,
+        "setup_s": round(setup_time, 3),
+        "messages_per_s": round(messages / elapsed, 1),
+        "writes_per_s": round(writes / elapsed, 1),
+        "latency_p50_ms": _ms(latency.percentile(50)),
+        "latency_p95_ms": _ms(latency.percentile(95)),
+        "latency_p99_ms": _ms(latency.percentile(99)),
+        "available_pct": round(100 * available / max(samples, 1), 1),
+        "reconnects": reconnects,
+        **server.as_dict(),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run each scenario for")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results: List[Dict[str, Any]] = [asyncio.run(async_run(SCENARIOS[name], args.duration)) for name in args.scenario]
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Time to recover from outages, by kind of outage.
+
+    python -m benchmarks.bench_faults --scenario drop server_error auth_failure --trials 20
+
+Each trial takes a simulated fleet from steady state through one fault and measures the
+time until the coordinator is connected again (recovery) and until every appliance has
+delivered fresh data (fresh data).  The coordinator's real backoff is used, with its
+delays scaled by --backoff-scale to keep runs short.  The "unscaled" columns project the
+times at the real delays.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+from unittest.mock import patch
+
+from gehomesdk import GeAppliance, GeAuthFailedError, GeGeneralServerError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.ge_home import update_coordinator
+from custom_components.ge_home.const import MAX_RETRY_DELAY, MIN_RETRY_DELAY
+from custom_components.ge_home.devices import ApplianceApi
+
+from .bench_fleet import _print_table
+from .fleet import FakeGeClient, Fleet
+from .harness import async_running_integration, fleet_patches
+
+class Fault(NamedTuple):
+    """What goes wrong in a trial, after the connection drops"""
+    name: str
+    # login attempts that fail with a server error, then with an auth error
+    server_errors: int = 0
+    auth_errors: int = 0
+    # share of appliances missing from the first roster after reconnecting, and for how long
+    roster_missing: float = 0.0
+    roster_delay: float = 0.0
+    # initial updates after reconnecting arrive spread over this many seconds
+    initial_update_delay: float = 0.0
+
+FAULTS: Dict[str, Fault] = {
+    "drop": Fault("drop"),
+    "server_error": Fault("server_error", server_errors=2),
+    "auth_failure": Fault("auth_failure", auth_errors=1),
+    "partial_roster": Fault("partial_roster", roster_missing=0.3, roster_delay=2.0),
+    "slow_initial": Fault("slow_initial", initial_update_delay=3.0),
+}
+
+TRIAL_TIMEOUT = 30.0
+
+class FaultyClient(FakeGeClient):
+    """The fake client, failing the way the fleet's current fault says"""
+
+    def __init__(self, fleet: "FaultyFleet", *args: Any, **kwargs: Any):
+        super().__init__(fleet, *args, **kwargs)
+        self._faults = fleet
+
+    async def _async_do_full_login_flow(self) -> Dict[str, str]:
+        faults = self._faults
+        if faults.server_errors:
+            faults.server_errors -= 1
+            raise GeGeneralServerError("injected server error")
+        if faults.auth_errors:
+            faults.auth_errors -= 1
+            raise GeAuthFailedError("injected auth failure")
+        return await super()._async_do_full_login_flow()
+
+    async def async_send_roster(self) -> None:
+        faults = self._faults
+        if faults.missing:
+            missing = faults.missing
+            faults.missing = set()
+            await self._async_send_partial_roster(missing)
+            self._faults.background(self._async_send_later(faults.fault.roster_delay))
+            return
+        await super().async_send_roster()
+
+    async def _async_send_partial_roster(self, missing: Set[str]) -> None:
+        present = {mac: virtual for mac, virtual in self._fleet.appliances.items() if mac not in missing}
+        saved = self._fleet.appliances
+        self._fleet.appliances = present
+        try:
+            await super().async_send_roster()
+        finally:
+            self._fleet.appliances = saved
+
+    async def _async_send_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self.connected:
+            await super().async_send_roster()
+
+    async def async_request_update(self, appliance: GeAppliance) -> None:
+        delay = self._faults.initial_update_delay
+        if delay:
+            self._faults.background(self._async_request_update_later(appliance, random.uniform(0, delay)))
+        else:
+            await super().async_request_update(appliance)
+
+    async def _async_request_update_later(self, appliance: GeAppliance, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self.connected:
+            await super().async_request_update(appliance)
+
+class FaultyFleet(Fleet):
+    """A fleet whose clients fail on cue: arm a fault, then drop the connection"""
+
+    def __init__(self, count: int):
+        super().__init__(count)
+        self.fault = FAULTS["drop"]
+        self.server_errors = 0
+        self.auth_errors = 0
+        self.missing: Set[str] = set()
+        self.initial_update_delay = 0.0
+        self._tasks: Set[asyncio.Task] = set()
+
+    def create_client(self, username: str, password: str, region: str = "US", **kwargs: Any) -> FakeGeClient:
+        self.client = FaultyClient(self, username, password, region, **kwargs)
+        return self.client
+
+    def arm(self, fault: Fault) -> None:
+        self.fault = fault
+        self.server_errors = fault.server_errors
+        self.auth_errors = fault.auth_errors
+        macs = list(self.appliances)
+        self.missing = set(random.sample(macs, int(len(macs) * fault.roster_missing)))
+        self.initial_update_delay = fault.initial_update_delay
+
+    def disarm(self) -> None:
+        self.arm(FAULTS["drop"])
+
+    def background(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+class TrialResult(NamedTuple):
+    recovery: Optional[float]
+    fresh_data: Optional[float]
+    backoff: float
+    attempts: int
+    devices_removed: int
+
+def _device_count(hass: Any, coordinator: Any) -> int:
+    registry = dr.async_get(hass)
+    return len(dr.async_entries_for_config_entry(registry, coordinator._config_entry.entry_id))
+
+async def async_trial(hass: Any, coordinator: Any, fleet: FaultyFleet, fault: Fault, fresh: Dict[str, float], delays: List[float], timeout: float) -> TrialResult:
+    """Drop the connection with the fault armed, and time the way back."""
+    client = fleet.client
+    assert client is not None
+    devices = _device_count(hass, coordinator)
+    fleet.arm(fault)
+    delays.clear()
+    started = time.monotonic()
+    await client.disconnect()
+
+    recovery = fresh_data = None
+    while time.monotonic() - started < timeout:
+        await asyncio.sleep(0.005)
+        now = time.monotonic()
+        if recovery is None and fleet.client is not client and coordinator.connected:
+            recovery = now - started
+        if recovery is not None and all(fresh.get(mac, 0) > started for mac in fleet.appliances):
+            fresh_data = max(fresh[mac] for mac in fleet.appliances) - started
+            break
+
+    result = TrialResult(recovery, fresh_data, sum(delays), len(delays), devices - _device_count(hass, coordinator))
+    fleet.disarm()
+    if fresh_data is None:
+        # the coordinator gave up (or is still trying), restart it for the next trial
+        await coordinator._ensure_client_running()
+        await asyncio.sleep(0.5)
+    await hass.async_block_till_done()
+    return result
+
+async def async_run(fault: Fault, appliances: int, trials: int, backoff_scale: float, timeout: float = TRIAL_TIMEOUT) -> Dict[str, Any]:
+    fleet = FaultyFleet(appliances)
+    fresh: Dict[str, float] = {}
+    delays: List[float] = []
+
+    original_update = ApplianceApi.on_device_update
+    def on_device_update(api: ApplianceApi, *args: Any, **kwargs: Any) -> Any:
+        fresh[api.mac_addr] = time.monotonic()
+        return original_update(api, *args, **kwargs)
+
+    # an appliance dropped from the roster comes back through a new API, built from its fresh state
+    original_add = update_coordinator.GeHomeUpdateCoordinator._maybe_add_appliance_api
+    def maybe_add_appliance_api(coordinator: Any, appliance: GeAppliance) -> None:
+        fresh[appliance.mac_addr] = time.monotonic()
+        original_add(coordinator, appliance)
+
+    original_delay = update_coordinator.GeHomeUpdateCoordinator._get_retry_delay
+    def get_retry_delay(coordinator: Any) -> float:
+        delay = original_delay(coordinator)
+        delays.append(delay)
+        return delay
+
+    patches = fleet_patches(fleet) + [
+        patch.object(ApplianceApi, "on_device_update", on_device_update),
+        patch.object(update_coordinator.GeHomeUpdateCoordinator, "_maybe_add_appliance_api", maybe_add_appliance_api),
+        patch.object(update_coordinator.GeHomeUpdateCoordinator, "_get_retry_delay", get_retry_delay),
+        patch.object(update_coordinator, "MIN_RETRY_DELAY", MIN_RETRY_DELAY * backoff_scale),
+        patch.object(update_coordinator, "MAX_RETRY_DELAY", MAX_RETRY_DELAY * backoff_scale),
+    ]
+    async with async_running_integration(appliances, patches=patches) as (hass, coordinator):
+        results = [await async_trial(hass, coordinator, fleet, fault, fresh, delays, timeout) for _ in range(trials)]
+
+    def unscaled(value: Optional[float], backoff: float) -> Optional[float]:
+        return value + backoff * (1 / backoff_scale - 1) if value is not None else None
+
+    recovered = [r for r in results if r.recovery is not None]
+    return {
+        "scenario": fault.name,
+        "trials": trials,
+        "recovered": len(recovered),
+        "attempts_mean": round(statistics.mean(r.attempts for r in results), 1),
+        # devices deleted from the registry along the way, which takes their entities with them
+        "devices_removed": sum(r.devices_removed for r in results),
+        **_distribution("recovery", [r.recovery for r in results]),
+        **_distribution("fresh_data", [r.fresh_data for r in results]),
+        **_distribution("recovery_unscaled", [unscaled(r.recovery, r.backoff) for r in results]),
+        **_distribution("fresh_data_unscaled", [unscaled(r.fresh_data, r.backoff) for r in results]),
+    }
+
+def _distribution(name: str, values: List[Optional[float]]) -> Dict[str, Any]:
+    done = sorted(v for v in values if v is not None)
+    if not done:
+        return {f"{name}_p50_s": None, f"{name}_p95_s": None, f"{name}_max_s": None}
+    return {
+        f"{name}_p50_s": round(statistics.median(done), 3),
+        f"{name}_p95_s": round(done[min(len(done) - 1, int(0.95 * len(done)))], 3),
+        f"{name}_max_s": round(done[-1], 3),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="+", choices=list(FAULTS), default=list(FAULTS))
+    parser.add_argument("--appliances", type=int, default=20)
+    parser.add_argument("--trials", type=int, default=20, help="faults per scenario")
+    parser.add_argument("--backoff-scale", type=float, default=0.01, help="factor applied to the retry delays")
+    parser.add_argument("--timeout", type=float, default=TRIAL_TIMEOUT, help="seconds before a trial counts as not recovered")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    results = [
+        asyncio.run(async_run(FAULTS[name], args.appliances, args.trials, args.backoff_scale, args.timeout))
+        for name in args.scenario
+    ]
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Update throughput and latency for fleets of simulated appliances.
+
+    python -m benchmarks.bench_fleet --appliances 1 50 500 --rate 1 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List
+
+from custom_components.ge_home.metrics import RollingSamples
+
+from .fleet import Fleet
+from .harness import async_running_integration, fleet_patches
+
+LATENCY_SAMPLES = 1_000_000
+
+async def async_run(appliances: int, rate: float, duration: float) -> Dict[str, Any]:
+    """Drive one fleet and report what the coordinator made of it."""
+    fleet = Fleet(appliances)
+    started = time.monotonic()
+    async with async_running_integration(appliances, patches=fleet_patches(fleet)) as (hass, coordinator):
+        setup_time = time.monotonic() - started
+        entities = sum(len(api.entities) for api in coordinator.appliance_apis.values())
+
+        metrics = coordinator.metrics
+        metrics.update_latency = latency = RollingSamples(LATENCY_SAMPLES)
+        writes_before = metrics.state_writes.total
+
+        drive_start = time.monotonic()
+        sent = await fleet.async_drive(rate, duration)
+        await hass.async_block_till_done()
+        elapsed = time.monotonic() - drive_start
+
+        writes = metrics.state_writes.total - writes_before
+
+    return {
+        "appliances": appliances,
+        "entities": entities,
+        "setup_s": round(setup_time, 3),
+        "updates": sent,
+        "updates_per_s": round(sent / elapsed, 1),
+        "writes": writes,
+        "writes_per_s": round(writes / elapsed, 1),
+        "latency_p50_ms": _ms(latency.percentile(50)),
+        "latency_p95_ms": _ms(latency.percentile(95)),
+        "latency_p99_ms": _ms(latency.percentile(99)),
+        "latency_max_ms": _ms(latency.percentile(100)),
+    }
+
+def _ms(value: Any) -> Any:
+    return round(value * 1000, 2) if value is not None else None
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    columns = list(results[0])
+    widths = [max(len(c), *(len(str(r[c])) for r in results)) for c in columns]
+    print("  ".join(c.rjust(w) for c, w in zip(columns, widths)))
+    for result in results:
+        print("  ".join(str(result[c]).rjust(w) for c, w in zip(columns, widths)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--appliances", type=int, nargs="+", default=[1, 50, 500], help="fleet sizes to run")
+    parser.add_argument("--rate", type=float, default=1.0, help="updates per appliance per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to drive updates for")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = [asyncio.run(async_run(count, args.rate, args.duration)) for count in args.appliances]
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Microbenchmarks of the entity properties Home Assistant reads on every state write,
+for every entity of one appliance per device API.
+
+    python -m benchmarks.bench_properties --json results.json
+    python -m benchmarks.bench_properties --baseline benchmarks/baselines/properties.json
+    python -m benchmarks.bench_properties --update-baseline
+
+Only properties the integration implements are timed (HA's defaults aren't ours to tune).
+Results are keyed by device API, entity class and property, in nanoseconds per access.
+Device APIs without a recorded fixture run on a synthetic state.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import timeit
+from collections import defaultdict
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from gehomesdk import ErdApplianceType
+from homeassistant.helpers.entity import Entity
+
+from custom_components.ge_home.devices import ApplianceApi, get_appliance_api_type
+
+from .fleet import ApplianceFixture, Fleet, load_fixtures
+from .harness import async_running_integration, fleet_patches
+
+BASELINE = Path(__file__).parent / "baselines" / "properties.json"
+
+HOT_PROPERTIES = (
+    "available",
+    "native_value",
+    "native_unit_of_measurement",
+    "is_on",
+    "icon",
+    "current_option",
+    "options",
+    "extra_state_attributes",
+    "hvac_mode",
+    "hvac_action",
+    "target_temperature",
+    "current_temperature",
+    "fan_mode",
+    "current_operation",
+    "native_min_value",
+    "native_max_value",
+)
+
+# regressions smaller than this are noise at this scale
+MIN_REGRESSION_NS = 200
+
+def _implemented_here(entity: Entity, prop: str) -> bool:
+    """Whether the integration (rather than Home Assistant) provides the property."""
+    for cls in type(entity).__mro__:
+        if prop in cls.__dict__:
+            return isinstance(cls.__dict__[prop], property) and cls.__module__.startswith("custom_components.")
+    return False
+
+def time_property(entity: Entity, prop: str, number: int, repeat: int) -> Optional[float]:
+    """Best-of-repeat nanoseconds per access, or None if the property raises."""
+    getter = attrgetter(prop)
+    try:
+        getter(entity)
+    except Exception:
+        return None
+    timer = timeit.Timer(lambda: getter(entity))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+def appliance_per_api(fixtures: Dict[ErdApplianceType, ApplianceFixture]) -> Dict[ErdApplianceType, ApplianceFixture]:
+    """One appliance type for each device API, preferring types with a recorded fixture."""
+    chosen: Dict[type, ErdApplianceType] = {}
+    for appliance_type in [*fixtures, *ErdApplianceType]:
+        api_type = get_appliance_api_type(appliance_type)
+        if api_type is not ApplianceApi:
+            chosen.setdefault(api_type, appliance_type)
+    return {
+        appliance_type: fixtures.get(appliance_type) or ApplianceFixture.synthetic(appliance_type)
+        for appliance_type in chosen.values()
+    }
+
+async def async_run(number: int, repeat: int) -> Dict[str, float]:
+    fixtures = appliance_per_api(load_fixtures())
+    fleet = Fleet(len(fixtures), fixtures=fixtures)
+    samples: Dict[Tuple[str, str, str], List[float]] = defaultdict(list)
+    async with async_running_integration(len(fixtures), patches=fleet_patches(fleet)) as (hass, coordinator):
+        for api in coordinator.appliance_apis.values():
+            for entity in api.entities:
+                if not getattr(entity, "added", False):
+                    continue
+                for prop in HOT_PROPERTIES:
+                    if not _implemented_here(entity, prop):
+                        continue
+                    ns = time_property(entity, prop, number, repeat)
+                    if ns is not None:
+                        samples[(type(api).__name__, type(entity).__name__, prop)].append(ns)
+
+    # entities of one class on one API differ only in their ERD, the median is representative
+    return {
+        f"{api}/{entity}.{prop}": round(statistics.median(values), 1)
+        for (api, entity, prop), values in sorted(samples.items())
+    }
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[Tuple[str, Any, Any, str]]:
+    rows = []
+    for key in sorted(set(results) | set(baseline)):
+        now, before = results.get(key), baseline.get(key)
+        if now is None or before is None:
+            rows.append((key, before, now, "removed" if now is None else "new"))
+            continue
+        change = now / before - 1 if before else 0.0
+        if now - before > MIN_REGRESSION_NS and change > tolerance:
+            rows.append((key, before, now, f"REGRESSION +{change:.0%}"))
+        elif before - now > MIN_REGRESSION_NS and -change > tolerance:
+            rows.append((key, before, now, f"improved {change:.0%}"))
+    return rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="accesses per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per property (the best is kept)")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--baseline", help="results file to compare against, exits non-zero on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown over the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to benchmarks/baselines/properties.json")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(async_run(args.number, args.repeat))
+    width = max(len(k) for k in results)
+    for key, ns in results.items():
+        print(f"{key.ljust(width)}  {ns:>10.1f} ns")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        BASELINE.parent.mkdir(exist_ok=True)
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            rows = compare(results, json.load(f), args.tolerance)
+        for key, before, now, verdict in rows:
+            print(f"{verdict}: {key} {before} -> {now} ns")
+        if any(verdict.startswith("REGRESSION") for *_, verdict in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
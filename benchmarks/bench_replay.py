@@ -0,0 +1,129 @@
+"""
+Deterministic regression runs: replays recorded traffic through the integration and
+reports the CPU time it took and the state writes it made.
+
+    python -m benchmarks.bench_replay recording.jsonl.gz --json results.json
+    python -m benchmarks.bench_replay recording.jsonl.gz --baseline results.json --tolerance 0.2
+
+Recordings come from the ge_home.start_recording service, or from a simulated fleet:
+
+    python -m benchmarks.bench_replay --record fleet.jsonl.gz --appliances 50 --rate 1 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from .bench_fleet import _print_table
+from .fleet import Fleet
+from .harness import async_running_integration, fleet_patches
+from .replay import Recording, Replayer
+
+REPLAY_TIMEOUT = 3600
+
+async def async_replay(path: Path, speed: float) -> Dict[str, Any]:
+    """Replay one recording, from setting up the integration to the last recorded event."""
+    recording = Recording.load(path)
+    replayer = Replayer(recording, speed)
+    patches = [
+        patch("custom_components.ge_home.update_coordinator.GeWebsocketClient", replayer.create_client),
+        patch("custom_components.ge_home.update_coordinator.async_get_clientsession", lambda hass: None),
+        # outages are already in the recording's timing, don't wait them out twice
+        patch("custom_components.ge_home.update_coordinator.GeHomeUpdateCoordinator._get_retry_delay", return_value=0.0),
+    ]
+
+    started = time.monotonic()
+    cpu_started = time.process_time()
+    async with async_running_integration(recording.appliances, patches=patches) as (hass, coordinator):
+        await replayer.async_wait(REPLAY_TIMEOUT)
+        await hass.async_block_till_done()
+        cpu = time.process_time() - cpu_started
+        elapsed = time.monotonic() - started
+        metrics = coordinator.metrics
+        entities = sum(len(api.entities) for api in coordinator.appliance_apis.values())
+        result = {
+            "recording": path.name,
+            "speed": speed,
+            "appliances": len(coordinator.appliance_apis),
+            "entities": entities,
+            "events": len(recording.events),
+            "messages": metrics.messages.total,
+            "writes": metrics.state_writes.total,
+            "reconnects": metrics.reconnects,
+            "commands": replayer.writes,
+            "polls": replayer.update_requests,
+            "wall_s": round(elapsed, 3),
+            "cpu_s": round(cpu, 3),
+        }
+    return result
+
+async def async_record(path: Path, appliances: int, rate: float, duration: float) -> None:
+    """Record a simulated fleet through the integration's own recorder."""
+    fleet = Fleet(appliances)
+    async with async_running_integration(appliances, patches=fleet_patches(fleet)) as (hass, coordinator):
+        coordinator.start_recording(duration + 60)
+        await fleet.async_drive(rate, duration)
+        await hass.async_block_till_done()
+        recorded = await coordinator.recorder.async_stop()
+        shutil.copyfile(recorded, path)
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """What regressed against the baseline: CPU time beyond the tolerance, or any change in writes."""
+    by_name = {b["recording"]: b for b in baseline}
+    problems = []
+    for result in results:
+        base = by_name.get(result["recording"])
+        if base is None:
+            problems.append(f"{result['recording']}: not in the baseline")
+            continue
+        if result["cpu_s"] > base["cpu_s"] * (1 + tolerance):
+            problems.append(f"{result['recording']}: CPU time {result['cpu_s']}s, baseline {base['cpu_s']}s")
+        for key in ("messages", "writes", "commands"):
+            if result[key] != base[key]:
+                problems.append(f"{result['recording']}: {key} {result[key]}, baseline {base[key]}")
+    return problems
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="*", type=Path, help="recordings to replay")
+    parser.add_argument("--speed", type=float, default=0.0, help="playback speed, 0 (the default) for as fast as possible")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--baseline", help="results file to compare against, exits non-zero on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed CPU time increase over the baseline")
+    parser.add_argument("--record", type=Path, help="record a simulated fleet to this file instead of replaying")
+    parser.add_argument("--appliances", type=int, default=50, help="fleet size when recording")
+    parser.add_argument("--rate", type=float, default=1.0, help="updates per appliance per second when recording")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to record for")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.record:
+        asyncio.run(async_record(args.record, args.appliances, args.rate, args.duration))
+        print(f"Recorded {args.appliances} appliances for {args.duration:.0f}s to {args.record}")
+        return
+    if not args.recordings:
+        parser.error("no recordings to replay")
+
+    results = [asyncio.run(async_replay(path, args.speed)) for path in args.recordings]
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
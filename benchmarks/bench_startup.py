@@ -0,0 +1,88 @@
+"""
+Time to all entities, and where it goes, for fleets of simulated appliances.
+
+    python -m benchmarks.bench_startup --appliances 10 100 500
+    python -m benchmarks.bench_startup --baseline startup.json --tolerance 0.25
+
+Fails (exits non-zero) if time to all entities is over the budget for a fleet size,
+or more than --tolerance over the baseline's when one is given.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from custom_components.ge_home.metrics import STARTUP_PHASES
+
+from .bench_fleet import _print_table
+from .fleet import Fleet
+from .harness import async_running_integration, fleet_patches
+
+# seconds to all entities, generous enough for a slow CI machine
+STARTUP_BUDGETS = {10: 5.0, 100: 10.0, 500: 30.0}
+SETTLE_TIMEOUT = 300
+
+async def async_run(appliances: int) -> Dict[str, Any]:
+    fleet = Fleet(appliances)
+    started = time.monotonic()
+    async with async_running_integration(appliances, patches=fleet_patches(fleet)) as (hass, coordinator):
+        deadline = time.monotonic() + SETTLE_TIMEOUT
+        while not coordinator.startup.complete and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        startup = coordinator.startup.as_dict()
+        wall = time.monotonic() - started
+
+    return {
+        "appliances": appliances,
+        "entities": startup["entities"],
+        "to_entities_s": startup["total_s"],
+        **{phase: startup["phases_s"][phase] for phase in STARTUP_PHASES},
+        # includes starting Home Assistant and settling, for reference only
+        "wall_s": round(wall, 3),
+    }
+
+def check(results: List[Dict[str, Any]], baseline: Optional[List[Dict[str, Any]]], tolerance: float) -> List[str]:
+    """Fleet sizes whose time to all entities is over budget, or regressed against the baseline."""
+    by_size = {b["appliances"]: b for b in baseline or []}
+    problems = []
+    for result in results:
+        appliances, took = result["appliances"], result["to_entities_s"]
+        budget = STARTUP_BUDGETS.get(appliances)
+        if budget is not None and took > budget:
+            problems.append(f"{appliances} appliances: {took}s to all entities, budget {budget}s")
+        base = by_size.get(appliances)
+        if base is not None and took > base["to_entities_s"] * (1 + tolerance):
+            problems.append(f"{appliances} appliances: {took}s to all entities, baseline {base['to_entities_s']}s")
+    return problems
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--appliances", type=int, nargs="+", default=sorted(STARTUP_BUDGETS), help="fleet sizes to run")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed increase over the baseline")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = [asyncio.run(async_run(count)) for count in args.appliances]
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    problems = check(results, baseline, args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Synthetic fleet of GE appliances, served by a fake client instead of SmartHQ"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from gehomesdk import (
+    EVENT_APPLIANCE_STATE_CHANGE,
+    EVENT_APPLIANCE_UPDATE_RECEIVED,
+    EVENT_GOT_APPLIANCE_LIST,
+    ErdApplianceType,
+    ErdCode,
+    ErdCodeType,
+    GeAppliance,
+    GeBaseClient,
+    GeClientState,
+)
+from gehomesdk.erd.erd_configuration import _configuration
+
+_LOGGER = logging.getLogger(__name__)
+
+# the encoder swallows decoding errors, so synthetic values are checked against the converters themselves
+_ERD_CONFIGURATION = {entry.erd_code: entry for entry in _configuration}
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+class ApplianceFixture:
+    """
+    The raw ERD values of one appliance, in the format written by the export_capture
+    service: the first received message is the full state, the rest are the deltas
+    that get cycled through to generate updates.
+    """
+
+    def __init__(self, name: str, state: Dict[str, str], deltas: List[Dict[str, str]]):
+        self.name = name
+        self.state = state
+        self.deltas = deltas or [{}]
+
+    @property
+    def appliance_type(self) -> ErdApplianceType:
+        return ErdApplianceType(self.state[ErdCode.APPLIANCE_TYPE.value].upper())
+
+    @classmethod
+    def load(cls, path: Path) -> "ApplianceFixture":
+        received = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry.get("dir") == "rx":
+                        received.append(entry["erds"])
+        if not received:
+            raise ValueError(f"No received messages in {path}")
+
+        # codes only seen in later messages are still part of the state
+        state = dict(received[0])
+        for erds in received[1:]:
+            for code, value in erds.items():
+                state.setdefault(code, value)
+        return cls(path.stem, state, received[1:])
+
+    @classmethod
+    def minimal(cls, appliance_type: ErdApplianceType) -> "ApplianceFixture":
+        """Just enough state to identify an appliance, for types without a recorded fixture."""
+        state = {
+            ErdCode.APPLIANCE_TYPE.value: appliance_type.value,
+            ErdCode.MODEL_NUMBER.value: "0BENCHMARK".encode().hex().ljust(64, "0"),
+        }
+        return cls(appliance_type.name.lower(), state, [])
+
+    @classmethod
+    def synthetic(cls, appliance_type: ErdApplianceType) -> "ApplianceFixture":
+        """
+        A state with a value for every ERD the SDK can decode, so an appliance type
+        without a recorded fixture still gets every entity its API supports.  The
+        values are just the first that decode, not anything a real appliance reports.
+        """
+        fixture = cls.minimal(appliance_type)
+        # codes the SDK can't decode come through as bytes, which no entity expects
+        state = {code.value: _decodable_value(code) for code in ErdCode if code in _ERD_CONFIGURATION}
+        state.update(_SYNTHETIC_OVERRIDES)
+        state.update(fixture.state)
+        fixture.state = state
+        return fixture
+
+# raw values to try, shortest first: most converters accept a byte of 1 (a "true" or
+# the first non-default enum member), composite and string values need more bytes
+_CANDIDATE_VALUES = [fill * n for fill in ("01", "00") for n in (1, 2, 4, 8, 16, 32)]
+
+class _ErrorCounter(logging.Handler):
+    """Counts the errors logged by converters that fall back to a default value"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+# bitfields of what the appliance supports, where a 1 would leave just the first option
+_SYNTHETIC_OVERRIDES = {
+    ErdCode.HOOD_FAN_SPEED_AVAILABILITY.value: "1f",
+    ErdCode.HOOD_LIGHT_LEVEL_AVAILABILITY.value: "17",
+}
+
+def _decodable_value(code: ErdCode) -> str:
+    entry = _ERD_CONFIGURATION[code]
+    sdk_logger = logging.getLogger("gehomesdk")
+    errors = _ErrorCounter()
+    sdk_logger.addHandler(errors)
+    propagate, sdk_logger.propagate = sdk_logger.propagate, False
+    try:
+        for raw in _CANDIDATE_VALUES:
+            logged = errors.count
+            try:
+                value = entry.erd_decode(raw)
+            except Exception:
+                continue
+            if value is not None and errors.count == logged:
+                return raw
+    finally:
+        sdk_logger.removeHandler(errors)
+        sdk_logger.propagate = propagate
+    return _CANDIDATE_VALUES[0]
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> Dict[ErdApplianceType, ApplianceFixture]:
+    """Load every fixture in a directory, keyed by appliance type."""
+    fixtures = {}
+    for path in sorted(directory.glob("*.jsonl")):
+        fixture = ApplianceFixture.load(path)
+        fixtures[fixture.appliance_type] = fixture
+    return fixtures
+
+class VirtualAppliance:
+    """The cloud's view of one simulated appliance"""
+
+    def __init__(self, mac_addr: str, fixture: ApplianceFixture):
+        self.mac_addr = mac_addr
+        self.fixture = fixture
+        self.state = dict(fixture.state)
+        # give every appliance its own serial number, or they'd all be one device in HA
+        self.state[ErdCode.SERIAL_NUMBER.value] = ("0" + mac_addr).encode().hex().ljust(64, "0")
+        self.online = True
+        self._next_delta = 0
+
+    def next_update(self) -> Dict[str, str]:
+        delta = self.fixture.deltas[self._next_delta % len(self.fixture.deltas)]
+        self._next_delta += 1
+        self.state.update(delta)
+        return dict(delta)
+
+class FakeGeClient(GeBaseClient):
+    """
+    Stands in for GeWebsocketClient: "connects" instantly, serves the fleet's roster and
+    state, and echoes ERD writes back as updates the way the real service does.
+    """
+
+    client_priority = 2
+
+    def __init__(
+        self,
+        fleet: "Fleet",
+        username: str,
+        password: str,
+        region: str = "US",
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        **kwargs: Any
+    ):
+        super().__init__(username, password, region, event_loop)
+        self._fleet = fleet
+        self.writes = 0
+        self.update_requests = 0
+
+    def _initialize_event_handlers(self) -> None:
+        super()._initialize_event_handlers()
+        self.add_event_handler(EVENT_APPLIANCE_STATE_CHANGE, self._maybe_trigger_appliance_init_event)
+
+    async def _async_do_full_login_flow(self) -> Dict[str, str]:
+        return {"userId": "benchmark", "endpoint": "fake://benchmark"}
+
+    async def _async_do_refresh_login_flow(self) -> Dict[str, str]:
+        return await self._async_do_full_login_flow()
+
+    async def _async_run_client(self) -> None:
+        await self._set_state(GeClientState.CONNECTING)
+        await self._set_connected()
+        await self.async_send_roster()
+        await self._disconnect_requested.wait()
+
+    async def _disconnect(self) -> None:
+        pass
+
+    async def async_send_roster(self) -> None:
+        """Send the appliance list, like the client does on connecting."""
+        items = []
+        for virtual in self._fleet.appliances.values():
+            items.append({"applianceId": virtual.mac_addr, "online": "ONLINE" if virtual.online else "OFFLINE"})
+            if virtual.mac_addr in self.appliances:
+                await self._set_appliance_availability(self.appliances[virtual.mac_addr], virtual.online)
+                continue
+            appliance = GeAppliance(virtual.mac_addr, self)
+            if virtual.online:
+                appliance.set_available()
+            self.appliances[virtual.mac_addr] = appliance
+            await self.async_request_update(appliance)
+        await self.async_event(EVENT_GOT_APPLIANCE_LIST, items)
+
+    async def async_push_update(self, mac_addr: str, updates: Dict[ErdCodeType, str]) -> None:
+        """Deliver raw ERD values for an appliance, as the websocket client would."""
+        try:
+            appliance = self.appliances[mac_addr]
+        except KeyError:
+            return
+        state_changes = appliance.update_erd_values(updates)
+        if state_changes:
+            await self.async_event(EVENT_APPLIANCE_STATE_CHANGE, [appliance, state_changes])
+        await self.async_event(EVENT_APPLIANCE_UPDATE_RECEIVED, [appliance, updates])
+
+    async def async_set_erd_value(self, appliance: GeAppliance, erd_code: ErdCodeType, erd_value: Any) -> None:
+        self.writes += 1
+        virtual = self._fleet.appliances[appliance.mac_addr]
+        raw_code = erd_code.value if isinstance(erd_code, ErdCode) else erd_code
+        virtual.state[raw_code] = erd_value
+        await self.async_push_update(appliance.mac_addr, {raw_code: erd_value})
+
+    async def async_request_update(self, appliance: GeAppliance) -> None:
+        self.update_requests += 1
+        virtual = self._fleet.appliances.get(appliance.mac_addr)
+        if virtual is not None and virtual.online:
+            await self.async_push_update(appliance.mac_addr, dict(virtual.state))
+
+class Fleet:
+    """
+    N virtual appliances spread across the fixture appliance types.
+
+    Pass create_client in place of GeWebsocketClient, then drive update streams with
+    async_drive once the integration is running.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        appliance_types: Optional[Iterable[ErdApplianceType]] = None,
+        fixtures: Optional[Dict[ErdApplianceType, ApplianceFixture]] = None
+    ):
+        fixtures = dict(fixtures or load_fixtures())
+        types = list(appliance_types) if appliance_types else list(fixtures)
+        for appliance_type in types:
+            if appliance_type not in fixtures:
+                _LOGGER.warning("No fixture for %s, simulating it with a minimal state", appliance_type)
+                fixtures[appliance_type] = ApplianceFixture.minimal(appliance_type)
+
+        self.appliances: Dict[str, VirtualAppliance] = {}
+        for i in range(count):
+            mac_addr = f"FA{i:010X}"
+            self.appliances[mac_addr] = VirtualAppliance(mac_addr, fixtures[types[i % len(types)]])
+        self.client: Optional[FakeGeClient] = None
+        self.updates_sent = 0
+
+    def create_client(self, username: str, password: str, region: str = "US", **kwargs: Any) -> FakeGeClient:
+        """Drop-in replacement for the GeWebsocketClient constructor."""
+        self.client = FakeGeClient(self, username, password, region, **kwargs)
+        return self.client
+
+    async def async_drive(self, rate: float, duration: float, tick: float = 0.01) -> int:
+        """
+        Send updates at `rate` per appliance per second for `duration` seconds, round-robin
+        across the fleet.  Returns the number of updates sent.
+        """
+        if self.client is None:
+            raise RuntimeError("The fleet has no client yet")
+
+        macs = list(self.appliances)
+        total_rate = rate * len(macs)
+        sent = 0
+        start = time.monotonic()
+        while (elapsed := time.monotonic() - start) < duration:
+            due = int(elapsed * total_rate) - sent
+            for _ in range(due):
+                virtual = self.appliances[macs[sent % len(macs)]]
+                await self.client.async_push_update(virtual.mac_addr, virtual.next_update())
+                sent += 1
+            await asyncio.sleep(tick)
+
+        self.updates_sent += sent
+        return sent
@@ -0,0 +1,114 @@
+"""A bare Home Assistant instance running the integration against a simulated fleet"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from unittest.mock import patch
+
+from homeassistant import config_entries, loader
+from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    category_registry as cr,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    frame,
+    issue_registry as ir,
+    label_registry as lr,
+)
+from homeassistant.setup import async_setup_component
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
+
+from custom_components.ge_home.const import DOMAIN
+from custom_components.ge_home.update_coordinator import GeHomeUpdateCoordinator
+
+from .fleet import Fleet
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SETUP_TIMEOUT = 300
+
+@asynccontextmanager
+async def async_running_hass() -> AsyncIterator[HomeAssistant]:
+    """A running Home Assistant with just the core registries, in a scratch config dir."""
+    with tempfile.TemporaryDirectory(prefix="ge_home_bench_") as config_dir:
+        os.symlink(REPO_ROOT / "custom_components", Path(config_dir) / "custom_components")
+
+        hass = HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        hass.config.units = US_CUSTOMARY_SYSTEM
+        loader.async_setup(hass)
+        frame.async_setup(hass)
+        await asyncio.gather(
+            ar.async_load(hass), cr.async_load(hass), dr.async_load(hass), er.async_load(hass),
+            fr.async_load(hass), ir.async_load(hass), lr.async_load(hass)
+        )
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await hass.async_start()
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+def fleet_patches(fleet: Fleet) -> List[Any]:
+    """Patches that put a simulated fleet in place of SmartHQ."""
+    return [
+        patch("custom_components.ge_home.update_coordinator.GeWebsocketClient", fleet.create_client),
+        # the fake client never logs in, so it doesn't need a session (or the network component);
+        # a plain function rather than a mock, which would keep every call
+        patch("custom_components.ge_home.update_coordinator.async_get_clientsession", lambda hass: None),
+    ]
+
+@asynccontextmanager
+async def async_running_integration(
+    appliance_count: int,
+    data: Optional[Dict[str, Any]] = None,
+    options: Optional[Dict[str, Any]] = None,
+    patches: Iterable[Any] = ()
+) -> AsyncIterator[Tuple[HomeAssistant, GeHomeUpdateCoordinator]]:
+    """Set up the integration (with the given patches in place), and wait for every appliance's entities."""
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+    async with async_running_hass() as hass, AsyncExitStack() as stack:
+        for p in patches:
+            stack.enter_context(p)
+
+        assert await async_setup_component(hass, DOMAIN, {})
+        entry = config_entries.ConfigEntry(
+            domain=DOMAIN,
+            data={CONF_USERNAME: "benchmark", CONF_PASSWORD: "benchmark", CONF_REGION: "US", **(data or {})},
+            options=options or {},
+            title="benchmark",
+            unique_id="benchmark",
+            source=config_entries.SOURCE_USER,
+            version=3,
+            minor_version=1,
+            discovery_keys=MappingProxyType({}),
+            subentries_data=None,
+        )
+        await hass.config_entries.async_add(entry)
+        coordinator: GeHomeUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+        await async_wait_for_entities(hass, coordinator, appliance_count)
+        try:
+            yield hass, coordinator
+        finally:
+            await hass.config_entries.async_unload(entry.entry_id)
+
+async def async_wait_for_entities(
+    hass: HomeAssistant, coordinator: GeHomeUpdateCoordinator, appliance_count: int, timeout: float = SETUP_TIMEOUT
+) -> None:
+    """Wait until every appliance has an API and the platforms have added their entities."""
+    deadline = time.monotonic() + timeout
+    while not (coordinator.initialized and len(coordinator.appliance_apis) >= appliance_count):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{appliance_count} appliances not ready within {timeout}s")
+        await asyncio.sleep(0.01)
+    # the ready signal only schedules the entities to be added
+    await hass.async_block_till_done()
@@ -0,0 +1,166 @@
+"""Replays a recording made with the ge_home.start_recording service through a fake client"""
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from gehomesdk import (
+    EVENT_APPLIANCE_STATE_CHANGE,
+    EVENT_APPLIANCE_UPDATE_RECEIVED,
+    EVENT_GOT_APPLIANCE_LIST,
+    ErdCodeType,
+    GeAppliance,
+    GeBaseClient,
+    GeClientState,
+)
+
+from custom_components.ge_home.const import RECORDING_VERSION
+from custom_components.ge_home.recorder import RECORD_DISCONNECTED, RECORD_ROSTER, RECORD_UPDATE
+
+_LOGGER = logging.getLogger(__name__)
+
+class Recording:
+    """The header and events of a recording file"""
+
+    def __init__(self, header: Dict[str, Any], events: List[list]):
+        self.header = header
+        self.events = events
+
+    @property
+    def appliances(self) -> int:
+        """How many appliances sent updates (and so should end up with entities)."""
+        return len({e[2] for e in self.events if e[1] == RECORD_UPDATE})
+
+    @property
+    def updates(self) -> int:
+        return sum(1 for e in self.events if e[1] == RECORD_UPDATE)
+
+    @classmethod
+    def load(cls, path: Path) -> "Recording":
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != RECORDING_VERSION:
+                raise ValueError(f"Unsupported recording version {header.get('version')} in {path}")
+            events = [json.loads(line) for line in f if line.strip()]
+        return cls(header, events)
+
+class Replayer:
+    """
+    Plays a recording back to the coordinator.  Pass create_client in place of
+    GeWebsocketClient: each client continues the recording where the last one was
+    disconnected, so recorded disconnects go through the coordinator's real reconnect path.
+
+    speed scales the recorded timing (2.0 plays twice as fast), 0 plays as fast as possible.
+    """
+
+    def __init__(self, recording: Recording, speed: float = 1.0):
+        self.recording = recording
+        self.speed = speed
+        self.position = 0
+        self.clients = 0
+        self.writes = 0
+        self.update_requests = 0
+        self.finished = asyncio.Event()
+
+    def create_client(self, username: str, password: str, region: str = "US", **kwargs: Any) -> "ReplayClient":
+        """Drop-in replacement for the GeWebsocketClient constructor."""
+        self.clients += 1
+        return ReplayClient(self, username, password, region, **kwargs)
+
+    async def async_wait(self, timeout: Optional[float] = None) -> None:
+        await asyncio.wait_for(self.finished.wait(), timeout)
+
+class ReplayClient(GeBaseClient):
+    """A client whose traffic comes from a recording instead of the websocket"""
+
+    client_priority = 2
+
+    def __init__(
+        self,
+        replayer: Replayer,
+        username: str,
+        password: str,
+        region: str = "US",
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        **kwargs: Any
+    ):
+        super().__init__(username, password, region, event_loop)
+        self._replayer = replayer
+
+    def _initialize_event_handlers(self) -> None:
+        super()._initialize_event_handlers()
+        self.add_event_handler(EVENT_APPLIANCE_STATE_CHANGE, self._maybe_trigger_appliance_init_event)
+
+    async def _async_do_full_login_flow(self) -> Dict[str, str]:
+        return {"userId": "replay", "endpoint": "replay://"}
+
+    async def _async_do_refresh_login_flow(self) -> Dict[str, str]:
+        return await self._async_do_full_login_flow()
+
+    async def _async_run_client(self) -> None:
+        await self._set_state(GeClientState.CONNECTING)
+        await self._set_connected()
+        play = asyncio.create_task(self._async_play())
+        try:
+            await self._disconnect_requested.wait()
+        finally:
+            play.cancel()
+
+    async def _disconnect(self) -> None:
+        pass
+
+    async def _async_play(self) -> None:
+        replayer = self._replayer
+        events = replayer.recording.events
+        speed = replayer.speed
+        # the gap before the first event is this client's connect time, don't wait for it
+        last_t = events[replayer.position][0] if replayer.position < len(events) else 0.0
+        while replayer.position < len(events):
+            t, kind, *payload = events[replayer.position]
+            replayer.position += 1
+            if speed:
+                await asyncio.sleep(max(t - last_t, 0) / speed)
+            else:
+                await asyncio.sleep(0)
+            last_t = t
+
+            if kind == RECORD_ROSTER:
+                await self._async_send_roster(payload[0])
+            elif kind == RECORD_UPDATE:
+                await self._async_push_update(payload[0], payload[1])
+            elif kind == RECORD_DISCONNECTED:
+                await self.disconnect()
+                return
+            # connects are the coordinator's doing, nothing to replay
+        replayer.finished.set()
+
+    async def _async_send_roster(self, roster: List[list]) -> None:
+        items = []
+        for mac_addr, online in roster:
+            items.append({"applianceId": mac_addr, "online": "ONLINE" if online else "OFFLINE"})
+            appliance = self.appliances.get(mac_addr)
+            if appliance is None:
+                appliance = self.appliances[mac_addr] = GeAppliance(mac_addr, self)
+            await self._set_appliance_availability(appliance, online)
+        await self.async_event(EVENT_GOT_APPLIANCE_LIST, items)
+
+    async def _async_push_update(self, mac_addr: str, updates: Dict[ErdCodeType, str]) -> None:
+        appliance = self.appliances.get(mac_addr)
+        if appliance is None:
+            return
+        state_changes = appliance.update_erd_values(updates)
+        if state_changes:
+            await self.async_event(EVENT_APPLIANCE_STATE_CHANGE, [appliance, state_changes])
+        await self.async_event(EVENT_APPLIANCE_UPDATE_RECEIVED, [appliance, updates])
+
+    async def async_set_erd_value(self, appliance: GeAppliance, erd_code: ErdCodeType, erd_value: Any) -> None:
+        # the recording already has whatever the service sent back
+        self._replayer.writes += 1
+
+    async def async_request_update(self, appliance: GeAppliance) -> None:
+        self._replayer.update_requests += 1
@@ -0,0 +1,191 @@
+"""
+Memory soak across reconnects, and the memory cost of appliances and entities.
+
+    python -m benchmarks.soak_reconnect --cycles 1000 --appliances 10
+    python -m benchmarks.soak_reconnect --footprint 10 100
+
+Each cycle drops the fake client's connection and waits for the coordinator to reconnect
+and every appliance to be initialized again.  After a warm-up, it fails (exits non-zero)
+if RSS, traced memory or live objects grew by more than the LIMITS, or tasks, clients or
+appliances were left behind.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+from gehomesdk import GeAppliance
+
+from custom_components.ge_home.const import CAPTURE_SIZE
+
+from .fleet import FakeGeClient, Fleet
+from .harness import async_running_integration, fleet_patches
+
+RECONNECT_TIMEOUT = 10
+# every reconnect adds a full state to each appliance's message capture, so
+# warm up until those (bounded) buffers are full
+WARMUP_CYCLES = CAPTURE_SIZE + 50
+
+LIMITS = {
+    "rss_growth_mb": 20.0,
+    "traced_growth_bytes_per_cycle": 2048,
+    "objects_growth_per_cycle": 5.0,
+    "tasks_growth": 0,
+    "live_clients": 2,
+}
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        # peak rather than current, but still catches growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def snapshot() -> Dict[str, Any]:
+    gc.collect()
+    objects = gc.get_objects()
+    return {
+        "rss_mb": round(_rss_mb(), 1),
+        "traced_bytes": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        "objects": len(objects),
+        "tasks": len(asyncio.all_tasks()),
+        "live_clients": sum(isinstance(o, FakeGeClient) for o in objects),
+        "live_appliances": sum(isinstance(o, GeAppliance) for o in objects),
+    }
+
+def _types() -> Counter:
+    gc.collect()
+    return Counter(type(o).__qualname__ for o in gc.get_objects())
+
+async def async_reconnect(hass: Any, coordinator: Any, fleet: Fleet) -> float:
+    """Drop the connection, and wait for the coordinator to be back with every appliance."""
+    old = fleet.client
+    assert old is not None
+    started = time.monotonic()
+    await old.disconnect()
+    while (
+        fleet.client is old
+        or not coordinator.connected
+        or not all(a.initialized for a in fleet.client.appliances.values())
+    ):
+        if time.monotonic() - started > RECONNECT_TIMEOUT:
+            raise TimeoutError(f"Not reconnected within {RECONNECT_TIMEOUT}s")
+        await asyncio.sleep(0.001)
+    await hass.async_block_till_done()
+    return time.monotonic() - started
+
+async def async_soak(appliances: int, cycles: int, warmup: int) -> Dict[str, Any]:
+    fleet = Fleet(appliances)
+    patches = fleet_patches(fleet) + [
+        # reconnect straight away, the backoff isn't what's being tested
+        patch("custom_components.ge_home.update_coordinator.GeHomeUpdateCoordinator._get_retry_delay", lambda self: 0.0),
+    ]
+    async with async_running_integration(appliances, patches=patches) as (hass, coordinator):
+        # trace the warm-up too, or whatever replaces its allocations looks like growth
+        tracemalloc.start()
+        for _ in range(warmup):
+            await async_reconnect(hass, coordinator, fleet)
+
+        before, types_before = snapshot(), _types()
+        durations = [await async_reconnect(hass, coordinator, fleet) for _ in range(cycles)]
+        after, types_after = snapshot(), _types()
+        tracemalloc.stop()
+
+        entities = sum(len(api.entities) for api in coordinator.appliance_apis.values())
+
+    growth = {
+        "rss_growth_mb": round(after["rss_mb"] - before["rss_mb"], 1),
+        "traced_growth_bytes_per_cycle": round((after["traced_bytes"] - before["traced_bytes"]) / cycles),
+        "objects_growth_per_cycle": round((after["objects"] - before["objects"]) / cycles, 2),
+        "tasks_growth": after["tasks"] - before["tasks"],
+        "live_clients": after["live_clients"],
+    }
+    return {
+        "appliances": appliances,
+        "entities": entities,
+        "cycles": cycles,
+        "reconnect_p50_ms": round(statistics.median(durations) * 1000, 1),
+        "reconnect_max_ms": round(max(durations) * 1000, 1),
+        "before": before,
+        "after": after,
+        "growth": growth,
+        "growing_types": dict((types_after - types_before).most_common(10)),
+    }
+
+def check(result: Dict[str, Any]) -> List[str]:
+    problems = [
+        f"{key} {value} over the limit of {LIMITS[key]}"
+        for key, value in result["growth"].items()
+        if value > LIMITS[key]
+    ]
+    if result["after"]["live_appliances"] > result["appliances"]:
+        problems.append(f"{result['after']['live_appliances']} live appliances for {result['appliances']}")
+    return problems
+
+async def async_measure(appliances: int) -> Tuple[int, int, float]:
+    """Traced memory with the integration set up for a fleet, and its entity count."""
+    gc.collect()
+    tracemalloc.start()
+    fleet = Fleet(appliances)
+    async with async_running_integration(appliances, patches=fleet_patches(fleet)) as (hass, coordinator):
+        await hass.async_block_till_done()
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0]
+        rss = _rss_mb()
+        entities = sum(len(api.entities) for api in coordinator.appliance_apis.values())
+    tracemalloc.stop()
+    return entities, traced, rss
+
+def footprint(small: int, large: int) -> Dict[str, Any]:
+    """Memory per appliance and per entity, from the difference between two fleet sizes."""
+    small_entities, small_traced, small_rss = asyncio.run(async_measure(small))
+    large_entities, large_traced, large_rss = asyncio.run(async_measure(large))
+    traced = large_traced - small_traced
+    return {
+        "fleet_sizes": [small, large],
+        "entities": [small_entities, large_entities],
+        "bytes_per_appliance": round(traced / (large - small)),
+        "bytes_per_entity": round(traced / (large_entities - small_entities)),
+        # RSS only grows, so run the smaller fleet first; rougher than the traced numbers
+        "rss_mb_per_100_appliances": round((large_rss - small_rss) / (large - small) * 100, 1),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=1000, help="disconnect/reconnect cycles")
+    parser.add_argument("--warmup", type=int, default=WARMUP_CYCLES, help="cycles before measuring")
+    parser.add_argument("--appliances", type=int, default=10, help="fleet size for the soak")
+    parser.add_argument("--footprint", type=int, nargs=2, metavar=("SMALL", "LARGE"), help="measure memory per appliance and entity instead")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    if args.footprint:
+        result = footprint(*args.footprint)
+        problems = []
+    else:
+        result = asyncio.run(async_soak(args.appliances, args.cycles, args.warmup))
+        problems = check(result)
+
+    print(json.dumps(result, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    for problem in problems:
+        print(f"LEAK {problem}")
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
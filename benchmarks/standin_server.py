@@ -0,0 +1,296 @@
+"""
+A local stand-in for the SmartHQ login, appliance list and websocket pub/sub endpoints.
+
+    python -m benchmarks.standin_server --scenario flaky --port 8765
+
+Point an integration at it by setting api_base_url in the config entry's data.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import secrets
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from aiohttp import WSMsgType, web
+
+from .fleet import Fleet, VirtualAppliance
+
+_LOGGER = logging.getLogger(__name__)
+
+USER_ID = "standin-user"
+PUBLISH_TICK = 0.05
+
+class Scenario(NamedTuple):
+    """What the server does once a client connects"""
+    name: str
+    appliances: int = 10
+    # updates per appliance per second, spread evenly
+    update_rate: float = 0.1
+    # every burst_interval seconds, burst_size extra updates at once
+    burst_size: int = 0
+    burst_interval: float = 0.0
+    # seconds before answering each websocket API request
+    response_delay: float = 0.0
+    # close every websocket after this many seconds
+    drop_interval: float = 0.0
+    # access tokens expire after this many seconds, and connections using them are cut
+    token_lifetime: float = 3600.0
+
+SCENARIOS: Dict[str, Scenario] = {
+    "steady": Scenario("steady", appliances=50, update_rate=1.0),
+    "large": Scenario("large", appliances=500, update_rate=0.2),
+    "bursty": Scenario("bursty", appliances=100, update_rate=0.1, burst_size=2000, burst_interval=5.0),
+    "slow": Scenario("slow", appliances=50, update_rate=0.5, response_delay=2.0),
+    "flaky": Scenario("flaky", appliances=50, update_rate=0.5, drop_interval=20.0),
+    "auth_expiry": Scenario("auth_expiry", appliances=50, update_rate=0.5, token_lifetime=30.0),
+}
+
+class StandInServer:
+    """Serves a simulated fleet over the same protocol as SmartHQ, misbehaving as the scenario says"""
+
+    def __init__(self, scenario: Scenario, fleet: Optional[Fleet] = None):
+        self.scenario = scenario
+        self.fleet = fleet or Fleet(scenario.appliances)
+        self.base_url = ""
+        self.logins = 0
+        self.refreshes = 0
+        self.connections = 0
+        self.drops = 0
+        self.expiries = 0
+        self.updates_published = 0
+        self.writes = 0
+        self._tokens: Dict[str, float] = {}
+        self._refresh_tokens: Set[str] = set()
+        self._sockets: Set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/oauth2/token", self._handle_token)
+        app.router.add_get("/v1/websocket", self._handle_websocket_credentials)
+        app.router.add_get("/ws", self._handle_websocket)
+        return app
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def async_stop(self) -> None:
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "logins": self.logins,
+            "refreshes": self.refreshes,
+            "connections": self.connections,
+            "drops": self.drops,
+            "expiries": self.expiries,
+            "updates_published": self.updates_published,
+            "writes": self.writes,
+        }
+
+    #region Login
+
+    def _issue_token(self) -> Dict[str, Any]:
+        access_token = secrets.token_hex(16)
+        refresh_token = secrets.token_hex(16)
+        self._tokens[access_token] = time.monotonic() + self.scenario.token_lifetime
+        self._refresh_tokens.add(refresh_token)
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "expires_in": int(self.scenario.token_lifetime),
+            "token_type": "Bearer",
+        }
+
+    def _token_valid(self, token: str) -> bool:
+        return self._tokens.get(token, 0) > time.monotonic()
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        data = await request.post()
+        grant_type = data.get("grant_type")
+        if grant_type == "password" and data.get("username") and data.get("password"):
+            self.logins += 1
+        elif grant_type == "refresh_token" and data.get("refresh_token") in self._refresh_tokens:
+            self._refresh_tokens.discard(data["refresh_token"])
+            self.refreshes += 1
+        else:
+            return web.json_response({"error": "invalid_grant"}, status=401)
+        return web.json_response(self._issue_token())
+
+    async def _handle_websocket_credentials(self, request: web.Request) -> web.Response:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not self._token_valid(token):
+            return web.json_response({"error": "invalid_token"}, status=401)
+        host = request.host
+        return web.json_response({"endpoint": f"ws://{host}/ws?token={token}", "userId": USER_ID})
+
+    #endregion
+
+    #region Websocket
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        token = request.query.get("token", "")
+        if not self._token_valid(token):
+            raise web.HTTPUnauthorized()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        self._sockets.add(ws)
+        publisher = asyncio.create_task(self._async_publish(ws, token))
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                request_dict = json.loads(msg.data)
+                if request_dict.get("kind") == "websocket#api":
+                    # answer in the background so slow responses don't hold up reading
+                    asyncio.create_task(self._async_respond(ws, request_dict))
+        finally:
+            publisher.cancel()
+            self._sockets.discard(ws)
+        return ws
+
+    async def _async_respond(self, ws: web.WebSocketResponse, request_dict: Dict[str, Any]) -> None:
+        if self.scenario.response_delay:
+            await asyncio.sleep(self.scenario.response_delay)
+        response = self._api_response(request_dict)
+        if response is not None and not ws.closed:
+            await ws.send_json(response)
+
+    def _api_response(self, request_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        method = request_dict.get("method")
+        path: str = request_dict.get("path", "")
+        parts = path.strip("/").split("/")
+        response = {"kind": "websocket#api", "id": request_dict.get("id"), "success": True, "code": 200}
+
+        if method == "GET" and parts == ["v1", "appliance"]:
+            response["body"] = {
+                "kind": "appliance#applianceList",
+                "userId": USER_ID,
+                "items": [self._roster_item(virtual) for virtual in self.fleet.appliances.values()],
+            }
+            return response
+
+        virtual = self.fleet.appliances.get(parts[2].upper()) if len(parts) > 3 else None
+        if virtual is None:
+            return None
+
+        if method == "GET" and parts[3] == "erd":
+            response["body"] = {
+                "kind": "appliance#erdList",
+                "userId": USER_ID,
+                "applianceId": virtual.mac_addr,
+                "items": [self._erd_item(code, value) for code, value in virtual.state.items()],
+            }
+        elif method == "GET" and parts[3] == "feature":
+            response["body"] = {
+                "kind": "appliance#applianceFeature",
+                "userId": USER_ID,
+                "applianceId": virtual.mac_addr,
+                "features": [],
+            }
+        elif method == "POST" and parts[3] == "erd":
+            self.writes += 1
+            body = request_dict.get("body", {})
+            virtual.state[body.get("erd", parts[4]).lower()] = body.get("value")
+        else:
+            return None
+        return response
+
+    def _roster_item(self, virtual: VirtualAppliance) -> Dict[str, str]:
+        return {
+            "applianceId": virtual.mac_addr,
+            "type": virtual.fixture.appliance_type.name,
+            "brand": "GE",
+            "jid": f"{virtual.mac_addr}_{USER_ID}",
+            "nickname": virtual.fixture.name,
+            "online": "ONLINE" if virtual.online else "OFFLINE",
+        }
+
+    def _erd_item(self, code: str, value: str) -> Dict[str, str]:
+        return {"erd": code, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "value": value}
+
+    async def _async_publish(self, ws: web.WebSocketResponse, token: str) -> None:
+        """Push update streams (and any scripted misbehaviour) down one connection."""
+        scenario = self.scenario
+        macs = list(self.fleet.appliances)
+        started = last_burst = time.monotonic()
+        published = 0
+        try:
+            while not ws.closed:
+                await asyncio.sleep(PUBLISH_TICK)
+                now = time.monotonic()
+
+                if scenario.drop_interval and now - started > scenario.drop_interval:
+                    self.drops += 1
+                    await ws.close()
+                    return
+                if not self._token_valid(token):
+                    self.expiries += 1
+                    await ws.send_json({"kind": "websocket#api", "success": False, "code": 401, "reason": "Access token expired"})
+                    await ws.close()
+                    return
+
+                due = int((now - started) * scenario.update_rate * len(macs)) - published
+                if scenario.burst_size and now - last_burst > scenario.burst_interval:
+                    last_burst = now
+                    await self._async_send_updates(ws, macs, published, scenario.burst_size)
+                await self._async_send_updates(ws, macs, published, due)
+                published += due
+        except ConnectionResetError:
+            pass
+
+    async def _async_send_updates(self, ws: web.WebSocketResponse, macs: List[str], offset: int, count: int) -> None:
+        for i in range(count):
+            virtual = self.fleet.appliances[macs[(offset + i) % len(macs)]]
+            for code, value in virtual.next_update().items():
+                await ws.send_json({
+                    "kind": "publish#erd",
+                    "userId": USER_ID,
+                    "resource": f"/appliance/{virtual.mac_addr}/erd/{code}",
+                    "item": {"applianceId": virtual.mac_addr, "erd": code, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "value": value},
+                })
+                self.updates_published += 1
+
+    #endregion
+
+async def _async_serve(scenario: Scenario, host: str, port: int) -> None:
+    server = StandInServer(scenario)
+    base_url = await server.async_start(host, port)
+    print(f"Serving {scenario.appliances} appliances ({scenario.name}) at {base_url}")
+    try:
+        while True:
+            await asyncio.sleep(10)
+            print(server.as_dict())
+    finally:
+        await server.async_stop()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=list(SCENARIOS), default="steady")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_serve(SCENARIOS[args.scenario], args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
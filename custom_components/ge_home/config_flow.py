@@ -22,7 +22,15 @@
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_REGION
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, VALIDATE_DATA_TIMEOUT, CONFIG_FLOW_VERSION
+from .const import (
+    DOMAIN,
+    VALIDATE_DATA_TIMEOUT,
+    CONFIG_FLOW_VERSION,
+    CONF_CALLBACK_BUDGET,
+    CONF_TRACE_SAMPLE_RATE,
+    DEFAULT_CALLBACK_BUDGET,
+    DEFAULT_TRACE_SAMPLE_RATE
+)
 from .exceptions import HaAuthError, HaCannotConnect, HaMfaRequired, HaTermsRequired
 
 _LOGGER = logging.getLogger(__name__)
@@ -101,6 +109,11 @@ class GeHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = CONFIG_FLOW_VERSION
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_PUSH
 
+    @staticmethod
+    @core.callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry):
+        return GeHomeOptionsFlow()
+
     async def _async_validate_input(self, user_input: dict):
         """Map validation to HA-friendly error codes."""
         try:
@@ -169,4 +182,26 @@ async def async_step_reauth(self, user_input: Optional[dict] = None):
             errors=errors
         )
 
+class GeHomeOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options for GE Home."""
+
+    async def async_step_init(self, user_input: Optional[Dict] = None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
 
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_CALLBACK_BUDGET,
+                        default=options.get(CONF_CALLBACK_BUDGET, DEFAULT_CALLBACK_BUDGET)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=10000)),
+                    vol.Required(
+                        CONF_TRACE_SAMPLE_RATE,
+                        default=options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE)
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0)),
+                }
+            )
+        )
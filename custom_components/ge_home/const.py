@@ -6,11 +6,45 @@
 CONNECTION_NOTIFICATION_ID = "ge_home_connection"
 CONFIG_FLOW_VERSION = 3
 
+# not set by the config flow: points the client at a SmartHQ stand-in server for testing
+CONF_API_BASE_URL = "api_base_url"
+
 HA_REFRESH_INTERVAL = 60
 STATE_UPDATE_INTERVAL = 30
+APPLIANCE_TASK_TIMEOUT = 15
+APPLIANCE_TASK_MAX_BACKOFF = 600
+APPLIANCE_TASK_MAX_FAILURES = 5
+APPLIANCE_TASK_MAX_RESTARTS = 5
 CLIENT_START_TIMEOUT = 30
 INITIAL_UPDATE_TIMEOUT = 10
+STARTUP_SETTLE_INTERVAL = 0.5
+STARTUP_SETTLE_TIMEOUT = 300
+CLIENT_STOP_TIMEOUT = 5
 VALIDATE_DATA_TIMEOUT = 10
+COMMAND_COALESCE_WINDOW = 0.5
+COMMAND_MERGE_HOLD = 10
+COMMAND_CONFIRM_TIMEOUT = 15
+COMMAND_SEND_TIMEOUT = 10
+OFFLINE_COMMAND_TTL = 300
+OFFLINE_QUEUE_SIZE = 20
+CAPTURE_SIZE = 200
+
+CONF_CALLBACK_BUDGET = "callback_budget_ms"
+DEFAULT_CALLBACK_BUDGET = 100
+WATCHDOG_WARNING_INTERVAL = 300
+
+ERD_TRACE_RATE = 10
+ERD_TRACE_BURST = 50
+
+CONF_TRACE_SAMPLE_RATE = "trace_sample_rate"
+DEFAULT_TRACE_SAMPLE_RATE = 0.0
+TRACE_FILE_NAME = "ge_home_trace.json"
+TRACE_FILE_MAX_BYTES = 10 * 1024 * 1024
+TRACE_FLUSH_EVENTS = 1000
+TRACE_FLUSH_INTERVAL = 10
+
+LOG_DEDUP_INTERVAL = 300
+LOG_DEDUP_MAX_KEYS = 1000
 
 MIN_RETRY_DELAY = 15
 MAX_RETRY_DELAY = 1800
@@ -22,3 +56,20 @@
 SERVICE_SET_TIMER = "set_timer"
 SERVICE_CLEAR_TIMER = "clear_timer"
 SERVICE_SET_INT_VALUE = "set_int_value"
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_STOP_PROFILING = "stop_profiling"
+SERVICE_SET_RENDER_TIMING = "set_render_timing"
+SERVICE_GET_RENDER_COSTS = "get_render_costs"
+SERVICE_SET_ERD_TRACE = "set_erd_trace"
+SERVICE_DUMP_APPLIANCE = "dump_appliance"
+SERVICE_EXPORT_CAPTURE = "export_capture"
+SERVICE_START_RECORDING = "start_recording"
+SERVICE_STOP_RECORDING = "stop_recording"
+
+PROFILING_DEFAULT_DURATION = 60
+PROFILING_MAX_DURATION = 1800
+
+RECORDING_VERSION = 1
+RECORDING_DEFAULT_DURATION = 600
+RECORDING_MAX_DURATION = 86400
+RECORDING_MAX_EVENTS = 500000
@@ -33,7 +33,7 @@
 
 def get_appliance_api_type(appliance_type: ErdApplianceType) -> Type:
     """Get the appropriate appliance type"""
-    _LOGGER.debug(f"Found device type: {appliance_type}")
+    _LOGGER.debug("Found device type: %s", appliance_type)
     known_types = {
         ErdApplianceType.OVEN: OvenApi,
         ErdApplianceType.COOKTOP: CooktopApi,
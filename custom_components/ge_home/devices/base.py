@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from propcache.api import cached_property
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
@@ -17,8 +18,15 @@
     ErdBrand
 )
 
+from .capture import MessageCapture
+from .command_queue import ApplianceCommandQueue, ErdWriteResult, WRITE_QUEUED
+from .confirmation import ErdConfirmationTracker
+from .offline_queue import OfflineCommandQueue, OFFLINE_REPLACE
 from .const import BRAND_FIRST_LETTER_MAP, BRAND_SPECIAL_PREFIXES
 from ..const import DOMAIN
+from ..exceptions import HaCommandNotConfirmed
+from ..metrics import LatencyHistogram
+from ..profiling import profiled
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +47,11 @@ def __init__(self, coordinator: DataUpdateCoordinator, appliance: GeAppliance):
         self.coordinator = coordinator
         self.initial_update = False
         self._entities: Dict[str, Entity] = {}
+        self._command_queue = ApplianceCommandQueue(self)
+        self._confirmations = ErdConfirmationTracker(self)
+        self._offline_queue = OfflineCommandQueue(self)
+        self._capture = MessageCapture(self)
+        self._erd_updated: Dict[ErdCodeType, float] = {}
 
     @property
     def hass(self) -> HomeAssistant:
@@ -58,6 +71,22 @@ def appliance(self) -> GeAppliance:
     def appliance(self, value: GeAppliance):
         self._appliance = value
 
+    @property
+    def command_queue(self) -> ApplianceCommandQueue:
+        return self._command_queue
+
+    @property
+    def confirmations(self) -> ErdConfirmationTracker:
+        return self._confirmations
+
+    @property
+    def offline_queue(self) -> OfflineCommandQueue:
+        return self._offline_queue
+
+    @property
+    def capture(self) -> MessageCapture:
+        return self._capture
+
     @property
     def available(self) -> bool:
         #Note - online will be there since we're using the GE coordinator
@@ -65,6 +94,11 @@ def available(self) -> bool:
         #working.
         return self.appliance.available and self.coordinator.online # type: ignore
 
+    @property
+    def can_send(self) -> bool:
+        """Whether commands can be sent to the appliance right now"""
+        return self.appliance.available and self.appliance.client.available
+
     @cached_property
     def serial_number(self) -> str:
         return self.appliance.get_erd_value(ErdCode.SERIAL_NUMBER)
@@ -224,6 +258,155 @@ def build_entities_list(self) -> None:
             if entity.unique_id is not None and entity.unique_id not in self._entities:
                 self._entities[entity.unique_id] = entity
 
+    def get_erd_value(self, code: ErdCodeType) -> Any:
+        """Get an ERD value, preferring a requested value that the appliance hasn't confirmed yet."""
+        code = self.appliance.translate_erd_code(code)
+        if self._confirmations.has_pending(code):
+            return self._confirmations.get_value(code)
+        return self.appliance.get_erd_value(code)
+
+    async def async_set_erd_value(
+        self,
+        code: ErdCodeType,
+        value: Any,
+        optimistic: bool = False,
+        offline_ttl: Optional[float] = None,
+        offline_policy: str = OFFLINE_REPLACE
+    ) -> None:
+        """
+        Write an ERD value through the command queue (coalesced with other pending writes
+        to the same ERD).  If optimistic, the value is shown right away and rolled back if
+        the appliance doesn't confirm it.  If the appliance can't be reached, the write is
+        held in the offline queue (see offline_queue) and replayed once it's back.
+        """
+        code = self.appliance.translate_erd_code(code)
+        if not self.can_send:
+            self._offline_queue.add([(code, value)], offline_ttl, offline_policy)
+            return
+        await self._async_write(code, value, optimistic)
+
+    async def async_set_and_confirm(self, code: ErdCodeType, value: Any, timeout: Optional[float] = None) -> None:
+        """
+        Write an ERD value and wait until the appliance reports it back.  Raises
+        HaCommandNotConfirmed if that doesn't happen within the timeout.
+        """
+        code = self.appliance.translate_erd_code(code)
+        if not self.can_send:
+            raise HaCommandNotConfirmed(f"{code} was not sent: {self.mac_addr} is offline")
+        self._confirmations.track(code, value, timeout, optimistic=False)
+        try:
+            await self._command_queue.async_set_erd_value(code, value)
+        except Exception as err:
+            self._confirmations.rollback(code, f"write failed ({err})")
+            raise
+        await self._confirmations.async_wait(code)
+
+    async def async_merge_erd_value(self, code: ErdCodeType, optimistic: bool = False, **fields: Any) -> None:
+        """Change individual fields of a composite ERD value, merging with any other pending changes to it."""
+        code = self.appliance.translate_erd_code(code)
+        value = self._command_queue.merge_erd_value(code, fields)
+        if not self.can_send:
+            self._offline_queue.add([(code, value)])
+            return
+        await self._async_write(code, value, optimistic, merged=True)
+
+    @profiled
+    async def async_set_erd_values(
+        self,
+        writes: Iterable[Tuple[ErdCodeType, Any]],
+        optimistic: bool = False,
+        offline_ttl: Optional[float] = None,
+        offline_policy: str = OFFLINE_REPLACE
+    ) -> List[ErdWriteResult]:
+        """Write an ordered batch of ERD values as a single unit, returning the outcome of each write."""
+        writes = [(self.appliance.translate_erd_code(code), value) for code, value in writes]
+        if not self.can_send:
+            self._offline_queue.add(writes, offline_ttl, offline_policy)
+            return [ErdWriteResult(code, value, WRITE_QUEUED, 0.0) for code, value in writes]
+
+        if optimistic:
+            for code, value in writes:
+                self._confirmations.track(code, value)
+            self.refresh_entity_state()
+
+        results = await self._command_queue.async_set_erd_values(writes)
+
+        for result in results:
+            if optimistic and not result.success:
+                self._confirmations.rollback(result.erd_code, f"write {result.status}")
+        return results
+
+    async def async_replay_offline_commands(self) -> None:
+        """Send anything that was queued while the appliance was offline."""
+        if self._offline_queue.depth:
+            await self._offline_queue.async_replay()
+
+    async def async_request_update(self) -> None:
+        """Request a full state update at background priority."""
+        await self._command_queue.async_request_update()
+
+    def on_device_update(self, update_data: Dict[ErdCodeType, Any]) -> None:
+        """Called by the coordinator whenever the appliance reports ERD values."""
+        self._capture.record_update(update_data)
+        now = time.monotonic()
+        for code in update_data:
+            self._erd_updated[code] = now
+        self._command_queue.on_erd_update(update_data.keys())
+        self._confirmations.on_erd_update(update_data.keys())
+
+    def get_erd_update_ages(self) -> Dict[str, float]:
+        """Seconds since each ERD was last reported, by ERD name."""
+        now = time.monotonic()
+        translate = self.appliance.translate_erd_code
+        return {
+            getattr(translate(code), "name", str(code)): round(now - updated, 1)
+            for code, updated in self._erd_updated.items()
+        }
+
+    @property
+    def appliance_type_name(self) -> str:
+        appliance_type = self.appliance.appliance_type
+        return appliance_type.name if appliance_type is not None else ErdApplianceType.UNKNOWN.name
+
+    def record_command_latency(self, elapsed: Optional[float], failed: bool = False) -> None:
+        """Record the time it took for a command to be confirmed (None if it timed out, or failed)."""
+        #Note - see available above re: the coordinator type hints
+        histograms: Dict[str, LatencyHistogram] = self.coordinator.command_latency # type: ignore
+        histogram = histograms.get(self.appliance_type_name)
+        if histogram is None:
+            histogram = histograms[self.appliance_type_name] = LatencyHistogram()
+
+        if failed:
+            histogram.record_failure()
+        elif elapsed is None:
+            histogram.record_timeout()
+        else:
+            histogram.record(elapsed)
+
+    def refresh_entity_state(self) -> None:
+        """Write the current state of this appliance's entities to HA."""
+        #Note - see available above re: the coordinator type hints
+        self.coordinator._update_entity_state(self.entities) # type: ignore
+
+    async def async_shutdown(self) -> None:
+        """Stop any background work for this appliance."""
+        await self._command_queue.async_stop()
+        self._confirmations.clear()
+        self._offline_queue.clear()
+
+    @profiled
+    async def _async_write(self, code: ErdCodeType, value: Any, optimistic: bool, merged: bool = False) -> None:
+        if optimistic:
+            self._confirmations.track(code, value)
+            self.refresh_entity_state()
+
+        try:
+            await self._command_queue.async_set_erd_value(code, value, merged=merged)
+        except Exception as err:
+            if optimistic:
+                self._confirmations.rollback(code, f"write failed ({err})")
+            raise
+
     def try_get_erd_value(self, code: ErdCodeType):
         try:
             return self.appliance.get_erd_value(code)
@@ -252,7 +435,7 @@ def _infer_brand_from_model(self, model: str) -> Optional[ErdBrand]:
         for prefix, brand_or_idx in BRAND_SPECIAL_PREFIXES.items():
             if m.startswith(prefix):
                 if isinstance(brand_or_idx, ErdBrand):
-                    _LOGGER.debug(f"Model '{m}': inferred brand '{brand_or_idx.name}' from prefix '{prefix}'")
+                    _LOGGER.debug("Model '%s': inferred brand '%s' from prefix '%s'", m, brand_or_idx.name, prefix)
                     return brand_or_idx
 
                 idx = brand_or_idx
@@ -260,18 +443,18 @@ def _infer_brand_from_model(self, model: str) -> Optional[ErdBrand]:
                     brand_letter = m[idx]
                     brand = BRAND_FIRST_LETTER_MAP.get(brand_letter)
                     if brand:
-                        _LOGGER.debug(f"Model '{m}': inferred brand '{brand.name}' from prefix '{prefix}' at position {idx + 1}")
+                        _LOGGER.debug("Model '%s': inferred brand '%s' from prefix '%s' at position %s", m, brand.name, prefix, idx + 1)
                         return brand
-                _LOGGER.debug(f"Model '{m}': prefix '{prefix}' found but brand letter at position {idx + 1} not recognized")
+                _LOGGER.debug("Model '%s': prefix '%s' found but brand letter at position %s not recognized", m, prefix, idx + 1)
                 return None
 
         # Try general
         first_letter = m[0]
         brand = BRAND_FIRST_LETTER_MAP.get(first_letter)
         if brand:
-            _LOGGER.debug(f"Model '{m}': inferred brand '{brand.name}' from first letter '{first_letter}'")
+            _LOGGER.debug("Model '%s': inferred brand '%s' from first letter '%s'", m, brand.name, first_letter)
             return brand
 
         # Log and return
-        _LOGGER.debug(f"Model '{m}': could not infer brand (first letter '{first_letter}' not in mapping)")
+        _LOGGER.debug("Model '%s': could not infer brand (first letter '%s' not in mapping)", m, first_letter)
         return None
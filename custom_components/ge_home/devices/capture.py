@@ -0,0 +1,59 @@
+"""Always-on capture of the latest raw messages to and from an appliance"""
+
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple, TYPE_CHECKING
+
+from gehomesdk import ErdCodeType
+
+from ..const import CAPTURE_SIZE
+
+if TYPE_CHECKING:
+    from .base import ApplianceApi
+
+CAPTURE_RX = "rx"
+CAPTURE_TX = "tx"
+CAPTURE_POLL = "poll"
+
+class MessageCapture:
+    """
+    Ring buffer of the last updates received from, and commands sent to, an appliance.
+
+    Entries are kept as (timestamp, direction, payload) tuples and only turned into
+    something readable when exported, so capturing costs next to nothing.
+    """
+
+    def __init__(self, api: "ApplianceApi", size: int = CAPTURE_SIZE):
+        self._api = api
+        self._entries: Deque[Tuple[float, str, Any]] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record_update(self, update_data: Dict[ErdCodeType, Any]) -> None:
+        self._entries.append((time.time(), CAPTURE_RX, update_data))
+
+    def record_write(self, erd_code: ErdCodeType, value: Any) -> None:
+        self._entries.append((time.time(), CAPTURE_TX, (erd_code, value)))
+
+    def record_poll(self) -> None:
+        self._entries.append((time.time(), CAPTURE_POLL, None))
+
+    def to_jsonl(self) -> List[str]:
+        """The captured messages as JSON lines, oldest first."""
+        return [json.dumps(self._format(entry), default=str) for entry in list(self._entries)]
+
+    def _format(self, entry: Tuple[float, str, Any]) -> Dict[str, Any]:
+        timestamp, direction, payload = entry
+        line: Dict[str, Any] = {"ts": round(timestamp, 3), "dir": direction}
+        if direction == CAPTURE_RX:
+            line["erds"] = {str(code): value for code, value in payload.items()}
+        elif direction == CAPTURE_TX:
+            erd_code, value = payload
+            line["erd"] = str(getattr(erd_code, "value", erd_code))
+            try:
+                line["value"] = self._api.appliance.encode_erd_value(erd_code, value)
+            except Exception:
+                line["value"] = str(value)
+        return line
@@ -65,4 +65,4 @@ async def start_brewing(self) -> None:
         new_mode = ErdCcmBrewSettings(self._brew_cups_entity.native_value,
                                       self._brew_strengh_entity.brew_strength,
                                       self._brew_temperature_entity.native_value)
-        await self.appliance.async_set_erd_value(ErdCode.CCM_BREW_SETTINGS, new_mode)
\ No newline at end of file
+        await self.async_set_erd_value(ErdCode.CCM_BREW_SETTINGS, new_mode)
\ No newline at end of file
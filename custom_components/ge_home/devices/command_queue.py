@@ -0,0 +1,379 @@
+"""Outbound command queue for a single appliance"""
+
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from gehomesdk import ErdCodeType
+
+from ..const import COMMAND_COALESCE_WINDOW, COMMAND_MERGE_HOLD, COMMAND_SEND_TIMEOUT
+from ..profiling import profiled
+
+if TYPE_CHECKING:
+    from .base import ApplianceApi
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_USER = 0
+PRIORITY_POLL = 10
+
+POLL_KEY = "poll"
+BATCH_KEY = "batch"
+
+WRITE_SENT = "sent"
+WRITE_FAILED = "failed"
+WRITE_SKIPPED = "skipped"
+WRITE_QUEUED = "queued"
+
+def _is_batch_key(key: Hashable) -> bool:
+    return isinstance(key, tuple) and key[0] == BATCH_KEY
+
+class ErdWriteResult(NamedTuple):
+    """Outcome of a single write within a batch"""
+    erd_code: ErdCodeType
+    value: Any
+    status: str
+    elapsed: float
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the write was sent, or held to be sent once the appliance is back online"""
+        return self.status in (WRITE_SENT, WRITE_QUEUED)
+
+class _PendingCommand:
+    """A queued command, possibly standing in for several coalesced requests"""
+
+    __slots__ = ("key", "priority", "seq", "due", "send", "value", "waiters")
+
+    def __init__(self, key: Hashable, priority: int, seq: int, due: float, send: Callable[[], Awaitable[Any]]):
+        self.key = key
+        self.priority = priority
+        self.seq = seq
+        self.due = due
+        self.send = send
+        self.value: Any = None
+        self.waiters: List[asyncio.Future] = []
+
+class ApplianceCommandQueue:
+    """
+    Serializes the outbound commands for a single appliance.
+
+    Writes to an ERD that was written within the last coalescing window are held
+    until the window closes, and any further writes to that ERD in the meantime
+    replace the held value (last write wins).  When several commands are ready,
+    user commands are dispatched ahead of background poll requests.
+    """
+
+    def __init__(self, api: "ApplianceApi", coalesce_window: float = COMMAND_COALESCE_WINDOW):
+        self._api = api
+        self._coalesce_window = coalesce_window
+        self._pending: Dict[Hashable, _PendingCommand] = {}
+        self._last_dispatch: Dict[Hashable, float] = {}
+        self._merge_hold: Dict[ErdCodeType, Tuple[Any, float]] = {}
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._sending: Optional[Tuple[_PendingCommand, asyncio.Task]] = None
+        self._in_flight = 0
+        self._coalesced = 0
+        self._dispatched = 0
+        self._failed = 0
+        self._batches = 0
+        self._batch_writes = 0
+        self._batch_time = 0.0
+        self._last_batch_time = 0.0
+        self._merges = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands currently being sent"""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of commands waiting to be sent"""
+        return len(self._pending)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of requests that were merged into an already queued command"""
+        return self._coalesced
+
+    @property
+    def dispatched(self) -> int:
+        return self._dispatched
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    @property
+    def batches(self) -> int:
+        return self._batches
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "failed": self.failed,
+            "batches": self._batches,
+            "batch_writes": self._batch_writes,
+            "batch_time_total": round(self._batch_time, 4),
+            "batch_time_last": round(self._last_batch_time, 4),
+            "merges": self._merges,
+        }
+
+    async def async_set_erd_value(
+        self,
+        erd_code: ErdCodeType,
+        value: Any,
+        priority: int = PRIORITY_USER,
+        merged: bool = False
+    ) -> None:
+        """
+        Queue a write of an ERD value and wait until it has been sent.  Set merged
+        for values built by merge_erd_value, so later merges build on top of it.
+        """
+        erd_code = self._api.appliance.translate_erd_code(erd_code)
+        await self._enqueue_write(erd_code, value, priority, merged)
+
+    def merge_erd_value(self, erd_code: ErdCodeType, fields: Dict[str, Any]) -> Any:
+        """
+        Apply individual field changes to a composite (named tuple) ERD value.
+
+        The fields are applied on top of the latest value we know of: a write still
+        waiting in the queue, then one we sent that the appliance hasn't reported back
+        yet, and only then the appliance's cached value.  Provided the result is queued
+        before yielding to the loop, concurrent changes to different fields end up in
+        one pending value that is written once, rather than each change overwriting the
+        other with stale fields.
+        """
+        erd_code = self._api.appliance.translate_erd_code(erd_code)
+        self._merges += 1
+        return self._get_merge_base(erd_code)._replace(**fields)
+
+    def on_erd_update(self, erd_codes: Iterable[ErdCodeType]) -> None:
+        """Called with the ERDs the appliance just reported, so their cached values can be trusted again."""
+        if not self._merge_hold:
+            return
+        translate = self._api.appliance.translate_erd_code
+        for erd_code in erd_codes:
+            self._merge_hold.pop(translate(erd_code), None)
+
+    async def async_set_erd_values(self, writes: Iterable[Tuple[ErdCodeType, Any]], priority: int = PRIORITY_USER) -> List[ErdWriteResult]:
+        """
+        Queue an ordered batch of ERD writes that is dispatched as one unit.
+
+        The writes are sent back to back without anything else interleaved, and without
+        waiting for the appliance to respond to each.  If a write fails, the remaining
+        writes are skipped since they usually depend on the earlier ones.  Any writes
+        to the same ERDs still waiting in the queue are superseded by the batch.
+        """
+        translate = self._api.appliance.translate_erd_code
+        writes = [(translate(code), value) for code, value in writes]
+
+        async def send():
+            return await self._async_send_batch(writes)
+
+        key = (BATCH_KEY, next(self._seq))
+        return await self._enqueue(key, priority, send, supersedes=[code for code, _ in writes])
+
+    async def async_request_update(self, priority: int = PRIORITY_POLL) -> None:
+        """Queue a request for a full state update and wait until it has been sent."""
+
+        async def send():
+            self._api.capture.record_poll()
+            await self._api.appliance.async_request_update()
+
+        await self._enqueue(POLL_KEY, priority, send)
+
+    async def async_stop(self) -> None:
+        """Stop the worker and cancel anything still waiting to be sent."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for cmd in self._pending.values():
+            for waiter in cmd.waiters:
+                waiter.cancel()
+        self._pending.clear()
+        self._merge_hold.clear()
+
+    async def async_abandon_poll(self) -> None:
+        """
+        Give up on a stuck poll request: drop it if it's still waiting, or stop sending
+        it if it's being sent.  Other commands are left to go out as usual.
+        """
+        cmd = self._pending.pop(POLL_KEY, None)
+        if cmd is not None:
+            for waiter in cmd.waiters:
+                waiter.cancel()
+
+        if self._sending is not None and self._sending[0].key == POLL_KEY:
+            send = self._sending[1]
+            send.cancel()
+            await asyncio.wait([send])
+
+    def _get_merge_base(self, erd_code: ErdCodeType) -> Any:
+        cmd = self._pending.get(erd_code)
+        if cmd is not None and cmd.value is not None:
+            return cmd.value
+
+        held = self._merge_hold.get(erd_code)
+        if held is not None:
+            value, expiry = held
+            if time.monotonic() < expiry:
+                return value
+            del self._merge_hold[erd_code]
+
+        return self._api.appliance.get_erd_value(erd_code)
+
+    def _enqueue_write(self, erd_code: ErdCodeType, value: Any, priority: int, merged: bool = False) -> asyncio.Future:
+        async def send():
+            self._api.capture.record_write(erd_code, value)
+            await self._api.appliance.async_set_erd_value(erd_code, value)
+            self._api.confirmations.on_sent(erd_code, value)
+            if merged:
+                self._merge_hold[erd_code] = (value, time.monotonic() + COMMAND_MERGE_HOLD)
+
+        waiter = self._enqueue(erd_code, priority, send)
+        cmd = self._pending[erd_code]
+        cmd.value = value
+        return waiter
+
+    def _enqueue(
+        self,
+        key: Hashable,
+        priority: int,
+        send: Callable[[], Awaitable[Any]],
+        supersedes: Iterable[Hashable] = ()
+    ) -> asyncio.Future:
+        waiter = self._api.hass.loop.create_future()
+
+        superseded = [self._pending.pop(k) for k in supersedes if k in self._pending]
+
+        cmd = self._pending.get(key)
+        if cmd is not None:
+            # still waiting to go out, so just replace what will be sent
+            cmd.send = send
+            cmd.priority = min(cmd.priority, priority)
+            self._coalesced += 1
+        else:
+            now = time.monotonic()
+            last = self._last_dispatch.get(key)
+            due = now if last is None else max(now, last + self._coalesce_window)
+            cmd = _PendingCommand(key, priority, next(self._seq), due, send)
+            self._pending[key] = cmd
+
+        cmd.waiters.append(waiter)
+        for old in superseded:
+            # anyone waiting on the replaced writes is released once this command is sent
+            cmd.waiters.extend(old.waiters)
+            self._coalesced += 1
+        self._wake.set()
+        self._ensure_worker()
+        return waiter
+
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = self._api.hass.loop.create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        try:
+            while self._pending:
+                now = time.monotonic()
+                ready = [c for c in self._pending.values() if c.due <= now]
+                if not ready:
+                    # wait for the next window to close, or for something new to arrive
+                    self._wake.clear()
+                    delay = min(c.due for c in self._pending.values()) - now
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                    continue
+
+                cmd = min(ready, key=lambda c: (c.priority, c.seq))
+                del self._pending[cmd.key]
+                await self._async_dispatch(cmd)
+        finally:
+            self._task = None
+
+    @profiled
+    async def _async_dispatch(self, cmd: _PendingCommand) -> None:
+        self._in_flight += 1
+        # batch keys are one-off, _async_send_batch stamps the ERDs it writes instead
+        if not _is_batch_key(cmd.key):
+            self._last_dispatch[cmd.key] = time.monotonic()
+        # sent in a task of its own, so a stuck poll can be abandoned without stopping the worker
+        send = self._api.hass.loop.create_task(cmd.send())
+        self._sending = (cmd, send)
+        try:
+            # a send that never returns would otherwise hold up this appliance's queue for good
+            result = await asyncio.wait_for(send, COMMAND_SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            # nobody should be left waiting on this command, whether the worker is being
+            # stopped or just this command was abandoned
+            for waiter in cmd.waiters:
+                waiter.cancel()
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            _LOGGER.debug("Command %s for %s abandoned", cmd.key, self._api.appliance.mac_addr)
+        except Exception as err:
+            self._failed += 1
+            if isinstance(err, asyncio.TimeoutError):
+                _LOGGER.warning("Command %s for %s not sent within %ss, abandoning it", cmd.key, self._api.appliance.mac_addr, COMMAND_SEND_TIMEOUT)
+            else:
+                _LOGGER.debug("Command %s for %s failed: %s", cmd.key, self._api.appliance.mac_addr, err)
+            for waiter in cmd.waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+        else:
+            for waiter in cmd.waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+        finally:
+            self._sending = None
+            self._in_flight -= 1
+            self._dispatched += 1
+
+    async def _async_send_batch(self, writes: List[Tuple[ErdCodeType, Any]]) -> List[ErdWriteResult]:
+        results: List[ErdWriteResult] = []
+        failed = False
+        batch_start = time.monotonic()
+
+        for erd_code, value in writes:
+            if failed:
+                results.append(ErdWriteResult(erd_code, value, WRITE_SKIPPED, 0.0))
+                continue
+
+            start = time.monotonic()
+            self._api.capture.record_write(erd_code, value)
+            try:
+                await self._api.appliance.async_set_erd_value(erd_code, value)
+            except Exception as err:
+                failed = True
+                _LOGGER.warning("Batch write of %s to %s failed: %s", erd_code, self._api.appliance.mac_addr, err)
+                results.append(ErdWriteResult(erd_code, value, WRITE_FAILED, time.monotonic() - start, err))
+            else:
+                results.append(ErdWriteResult(erd_code, value, WRITE_SENT, time.monotonic() - start))
+                self._api.confirmations.on_sent(erd_code, value)
+            self._last_dispatch[erd_code] = time.monotonic()
+
+        elapsed = time.monotonic() - batch_start
+        self._batches += 1
+        self._batch_writes += len(writes)
+        self._batch_time += elapsed
+        self._last_batch_time = elapsed
+        if failed:
+            self._failed += 1
+        _LOGGER.debug("Sent batch of %d writes to %s in %.1f ms", len(writes), self._api.appliance.mac_addr, elapsed * 1000)
+
+        return results
@@ -0,0 +1,170 @@
+"""Tracking of optimistic ERD values until the appliance confirms them"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from gehomesdk import ErdCodeType
+
+from ..const import COMMAND_CONFIRM_TIMEOUT
+from ..exceptions import HaCommandNotConfirmed
+
+if TYPE_CHECKING:
+    from .base import ApplianceApi
+
+_LOGGER = logging.getLogger(__name__)
+
+class _PendingValue:
+    """A value we've asked the appliance to take, but haven't seen reported back yet"""
+
+    __slots__ = ("value", "timeout", "handle", "optimistic", "started", "sent", "waiters")
+
+    def __init__(self, value: Any, timeout: float, handle: asyncio.TimerHandle, optimistic: bool):
+        self.value = value
+        self.timeout = timeout
+        self.handle = handle
+        self.optimistic = optimistic
+        self.started = time.monotonic()
+        self.sent = False
+        self.waiters: List[asyncio.Future] = []
+
+    def resolve(self, err: Optional[Exception] = None) -> None:
+        self.handle.cancel()
+        for waiter in self.waiters:
+            if waiter.done():
+                continue
+            if err is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(err)
+
+class ErdConfirmationTracker:
+    """
+    Holds requested ERD values so entities can show them right away.
+
+    A pending value is confirmed (and dropped) once the appliance reports the ERD
+    after the write went out, even with a different value: appliances round or clamp
+    some values (set-points, say), and the reported value is the one to show.  Before
+    the write goes out, only a report of the same value confirms it, since anything
+    else is a stale report.  If the ERD isn't reported within the timeout, or the
+    write fails, the pending value is rolled back and the entities go back to showing
+    what the appliance last reported.  The time to confirmation (or the timeout, or
+    the failure) is recorded against the appliance type's command latency histogram.
+    """
+
+    def __init__(self, api: "ApplianceApi", timeout: float = COMMAND_CONFIRM_TIMEOUT):
+        self._api = api
+        self._timeout = timeout
+        self._pending: Dict[ErdCodeType, _PendingValue] = {}
+        self._confirmed = 0
+        self._adjusted = 0
+        self._rolled_back = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending,
+            "confirmed": self._confirmed,
+            "adjusted": self._adjusted,
+            "rolled_back": self._rolled_back,
+        }
+
+    def has_pending(self, erd_code: ErdCodeType) -> bool:
+        """Whether there's a pending value that should be shown for an ERD."""
+        pending = self._pending.get(erd_code)
+        return pending is not None and pending.optimistic
+
+    def get_value(self, erd_code: ErdCodeType) -> Any:
+        """Get the pending value for an ERD (raises KeyError if there isn't one)."""
+        return self._pending[erd_code].value
+
+    def track(self, erd_code: ErdCodeType, value: Any, timeout: Optional[float] = None, optimistic: bool = True) -> None:
+        """Start (or restart) tracking a requested value."""
+        timeout = timeout or self._timeout
+        self._cancel(erd_code)
+
+        handle = self._api.hass.loop.call_later(timeout, self._expire, erd_code)
+        self._pending[erd_code] = _PendingValue(value, timeout, handle, optimistic)
+
+    async def async_wait(self, erd_code: ErdCodeType) -> None:
+        """Wait for a tracked value to be confirmed (raises HaCommandNotConfirmed otherwise)."""
+        pending = self._pending.get(erd_code)
+        if pending is None:
+            return
+
+        waiter = self._api.hass.loop.create_future()
+        pending.waiters.append(waiter)
+        await waiter
+
+    def on_sent(self, erd_code: ErdCodeType, value: Any) -> None:
+        """Called once a write has gone out, so the next report of the ERD is the appliance's answer to it."""
+        pending = self._pending.get(erd_code)
+        # a newer value that's still waiting to be sent doesn't count
+        if pending is not None and pending.value == value:
+            pending.sent = True
+
+    def rollback(self, erd_code: ErdCodeType, reason: str) -> None:
+        """Drop a pending value whose write failed."""
+        if erd_code in self._pending:
+            self._api.record_command_latency(None, failed=True)
+        self._rollback(erd_code, reason)
+
+    def _rollback(self, erd_code: ErdCodeType, reason: str) -> None:
+        pending = self._pending.pop(erd_code, None)
+        if pending is None:
+            return
+
+        pending.resolve(HaCommandNotConfirmed(f"{erd_code} was not confirmed: {reason}"))
+        self._rolled_back += 1
+        _LOGGER.warning(
+            "Rolling back %s on %s (requested %s): %s",
+            erd_code, self._api.appliance.mac_addr, pending.value, reason
+        )
+        if pending.optimistic:
+            self._api.refresh_entity_state()
+
+    def on_erd_update(self, erd_codes: Iterable[ErdCodeType]) -> None:
+        """Check reported ERDs against the pending values."""
+        if not self._pending:
+            return
+
+        translate = self._api.appliance.translate_erd_code
+        for erd_code in erd_codes:
+            erd_code = translate(erd_code)
+            pending = self._pending.get(erd_code)
+            if pending is None:
+                continue
+            reported = self._api.try_get_erd_value(erd_code)
+            if reported != pending.value:
+                if not pending.sent:
+                    continue
+                # the appliance took the write, but normalized the value
+                self._adjusted += 1
+                _LOGGER.debug(
+                    "%s on %s reported as %s (requested %s)",
+                    erd_code, self._api.appliance.mac_addr, reported, pending.value
+                )
+            del self._pending[erd_code]
+            pending.resolve()
+            self._confirmed += 1
+            self._api.record_command_latency(time.monotonic() - pending.started)
+
+    def clear(self) -> None:
+        for pending in self._pending.values():
+            pending.resolve(HaCommandNotConfirmed("appliance shut down"))
+        self._pending.clear()
+
+    def _cancel(self, erd_code: ErdCodeType) -> None:
+        pending = self._pending.pop(erd_code, None)
+        if pending is not None:
+            pending.resolve(HaCommandNotConfirmed(f"{erd_code} was superseded by a newer value"))
+
+    def _expire(self, erd_code: ErdCodeType) -> None:
+        pending = self._pending.get(erd_code)
+        if pending is not None:
+            self._api.record_command_latency(None)
+            self._rollback(erd_code, f"not confirmed within {pending.timeout:.0f}s")
@@ -0,0 +1,131 @@
+"""Holding area for commands issued while an appliance can't be reached"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from gehomesdk import ErdCodeType
+
+from ..const import OFFLINE_COMMAND_TTL, OFFLINE_QUEUE_SIZE
+
+if TYPE_CHECKING:
+    from .base import ApplianceApi
+
+_LOGGER = logging.getLogger(__name__)
+
+# a newer command replaces any queued command for the same ERD(s)
+OFFLINE_REPLACE = "replace"
+# keep every command, they're replayed in order
+OFFLINE_APPEND = "append"
+# keep the command already queued for the ERD(s) and drop the newer one
+OFFLINE_KEEP_FIRST = "keep_first"
+
+class OfflineCommand:
+    """One or more ERD writes waiting for the appliance to come back"""
+
+    __slots__ = ("writes", "expires", "policy")
+
+    def __init__(self, writes: List[Tuple[ErdCodeType, Any]], expires: float, policy: str):
+        self.writes = writes
+        self.expires = expires
+        self.policy = policy
+
+    @property
+    def erd_codes(self) -> List[ErdCodeType]:
+        return [code for code, _ in self.writes]
+
+class OfflineCommandQueue:
+    """
+    Bounded FIFO of commands for a single appliance that is offline.
+
+    Each command has a time to live and is silently dropped (and counted) if it
+    expires before it could be replayed.  When the queue is full, the oldest
+    command is dropped to make room.
+    """
+
+    def __init__(self, api: "ApplianceApi", max_size: int = OFFLINE_QUEUE_SIZE):
+        self._api = api
+        self._queue: Deque[OfflineCommand] = deque()
+        self._max_size = max_size
+        self._queued = 0
+        self._expired = 0
+        self._dropped = 0
+        self._replayed = 0
+        self._replaying = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "depth": self.depth,
+            "queued": self._queued,
+            "expired": self._expired,
+            "dropped": self._dropped,
+            "replayed": self._replayed,
+        }
+
+    def add(self, writes: List[Tuple[ErdCodeType, Any]], ttl: Optional[float] = None, policy: str = OFFLINE_REPLACE) -> None:
+        """Queue writes to be replayed once the appliance is reachable again."""
+        self._purge_expired()
+
+        codes = set(code for code, _ in writes)
+        if policy == OFFLINE_KEEP_FIRST and any(codes.intersection(c.erd_codes) for c in self._queue):
+            _LOGGER.debug("Already have a queued command for %s on %s, dropping the new one", codes, self._api.mac_addr)
+            self._dropped += 1
+            return
+        if policy == OFFLINE_REPLACE:
+            kept = deque(c for c in self._queue if not codes.intersection(c.erd_codes))
+            self._dropped += len(self._queue) - len(kept)
+            self._queue = kept
+
+        if len(self._queue) >= self._max_size:
+            self._queue.popleft()
+            self._dropped += 1
+
+        expires = time.monotonic() + (ttl or OFFLINE_COMMAND_TTL)
+        self._queue.append(OfflineCommand(writes, expires, policy))
+        self._queued += 1
+        _LOGGER.info("%s is offline, queued %s for replay", self._api.mac_addr, codes)
+
+    async def async_replay(self) -> None:
+        """Send the queued commands in order, stopping if the appliance goes away again."""
+        if self._replaying:
+            return
+
+        self._replaying = True
+        try:
+            await self._async_replay()
+        finally:
+            self._replaying = False
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+    async def _async_replay(self) -> None:
+        while self._queue:
+            if not self._api.can_send:
+                return
+
+            cmd = self._queue.popleft()
+            if cmd.expires < time.monotonic():
+                self._expired += 1
+                continue
+
+            _LOGGER.debug("Replaying queued command %s for %s", cmd.erd_codes, self._api.mac_addr)
+            self._replayed += 1
+            try:
+                if len(cmd.writes) == 1:
+                    await self._api.command_queue.async_set_erd_value(*cmd.writes[0])
+                else:
+                    await self._api.command_queue.async_set_erd_values(cmd.writes)
+            except Exception as err:
+                _LOGGER.warning("Could not replay queued command %s for %s: %s", cmd.erd_codes, self._api.mac_addr, err)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        kept = deque(c for c in self._queue if c.expires >= now)
+        self._expired += len(self._queue) - len(kept)
+        self._queue = kept
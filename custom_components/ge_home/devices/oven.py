@@ -77,7 +77,7 @@ def get_all_entities(self) -> List[Entity]:
             ErdCode.WARMING_DRAWER_STATE
         )
 
-        _LOGGER.debug(f"Oven Config: {oven_config}")
+        _LOGGER.debug("Oven Config: %s", oven_config)
         oven_entities = []
 
         if oven_config.has_lower_oven:
@@ -0,0 +1,103 @@
+"""Diagnostics support for GE Home"""
+
+from collections import Counter
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntry
+from gehomesdk import ErdCode
+
+from .const import DOMAIN
+from .devices import ApplianceApi
+from .update_coordinator import GeHomeUpdateCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "mac_addr", "title", "unique_id", ErdCode.SERIAL_NUMBER.name}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GeHomeUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return async_redact_data({
+        "entry": entry.as_dict(),
+        "connection": {
+            "connected": coordinator.connected,
+            "available": coordinator.available,
+            "online": coordinator.online,
+            "initialized": coordinator.initialized,
+        },
+        "roster": [
+            {
+                "mac_addr": appliance.mac_addr,
+                "appliance_type": appliance.appliance_type.name if appliance.appliance_type else None,
+                "available": appliance.available,
+                "initialized": appliance.initialized,
+            }
+            for appliance in coordinator.appliances
+        ],
+        "appliances": [_get_appliance_diagnostics(coordinator, api) for api in coordinator.appliance_apis.values()],
+        "performance": _get_performance_diagnostics(hass, entry, coordinator),
+    }, TO_REDACT)
+
+async def async_get_device_diagnostics(hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry) -> Dict[str, Any]:
+    """Return diagnostics for a device."""
+    coordinator: GeHomeUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    ids = set(ident for domain, ident in device.identifiers if domain == DOMAIN)
+    if coordinator.hub_id in ids:
+        return async_redact_data(_get_performance_diagnostics(hass, entry, coordinator), TO_REDACT)
+
+    for mac_addr in ids:
+        api = coordinator.appliance_apis.get(mac_addr)
+        if api is not None:
+            return async_redact_data(_get_appliance_diagnostics(coordinator, api, include_values=True), TO_REDACT)
+    return {}
+
+def _get_appliance_diagnostics(coordinator: GeHomeUpdateCoordinator, api: ApplianceApi, include_values: bool = False) -> Dict[str, Any]:
+    ages = api.get_erd_update_ages()
+    erds: Dict[str, Dict[str, Any]] = {}
+    for code in api.appliance.known_properties:
+        name = getattr(code, "name", str(code))
+        erds[name] = {"last_update_age": ages.get(name)}
+        if include_values:
+            erds[name]["value"] = str(api.try_get_erd_value(code))
+
+    return {
+        "mac_addr": api.mac_addr,
+        "appliance_type": api.appliance_type_name,
+        "api_type": type(api).__name__,
+        "available": api.available,
+        "entities": len(api.entities),
+        "erds": erds,
+        "command_queue": api.command_queue.as_dict(),
+        "confirmations": api.confirmations.as_dict(),
+        "offline_queue": api.offline_queue.as_dict(),
+        "tasks": coordinator.supervisor.health(api.mac_addr),
+    }
+
+def _get_performance_diagnostics(hass: HomeAssistant, entry: ConfigEntry, coordinator: GeHomeUpdateCoordinator) -> Dict[str, Any]:
+    registry = er.async_get(hass)
+    platforms = Counter(e.domain for e in er.async_entries_for_config_entry(registry, entry.entry_id))
+    apis = coordinator.appliance_apis.values()
+
+    return {
+        "coordinator": coordinator.metrics.as_dict(),
+        "startup": coordinator.startup.as_dict(),
+        "polling": coordinator.polling_schedule,
+        "callback_watchdog": coordinator.watchdog.as_dict(),
+        "ingest": coordinator.ingest.as_dict(),
+        "command_latency": {
+            appliance_type: histogram.as_dict()
+            for appliance_type, histogram in coordinator.command_latency.items()
+        },
+        "command_coalescing": {
+            "coalesced": sum(api.command_queue.coalesced for api in apis),
+            "dispatched": sum(api.command_queue.dispatched for api in apis),
+            "batches": sum(api.command_queue.batches for api in apis),
+        },
+        "entities_per_platform": dict(platforms),
+        "render_costs": coordinator.render_costs.as_dict(redact=True),
+    }
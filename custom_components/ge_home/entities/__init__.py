@@ -11,4 +11,5 @@
 from .opal_ice_maker import *
 from .ccm import *
 from .dehumidifier import *
-from .laundry import *
\ No newline at end of file
+from .laundry import *
+from .hub import *
\ No newline at end of file
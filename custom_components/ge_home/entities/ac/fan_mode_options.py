@@ -18,7 +18,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdAcFanSetting[value.upper().replace(" ","_")]
         except:
-            _LOGGER.warning(f"Could not set fan mode to {value}")
+            _LOGGER.warning("Could not set fan mode to %s", value)
             return self._default
 
     def to_option_string(self, value: Any) -> Optional[str]:
@@ -35,7 +35,7 @@ def to_option_string(self, value: Any) -> Optional[str]:
         if(isinstance(mapped, ErdAcFanSetting)):
            return mapped.stringify()
 
-        _LOGGER.warning(f"Could not determine fan mode mapping for {value}")
+        _LOGGER.warning("Could not determine fan mode mapping for %s", value)
         return self._default.stringify()
 
 class AcFanOnlyFanModeOptionsConverter(AcFanModeOptionsConverter):
@@ -25,7 +25,7 @@ def from_option_string(self, value: str) -> Any:
                 }.get(hvac)
 
         except ValueError:
-            _LOGGER.warning(f"Could not set HVAC mode to {value.upper()}")
+            _LOGGER.warning("Could not set HVAC mode to %s", value.upper())
             return ErdAcOperationMode.COOL
     
     def to_option_string(self, value: Any) -> Optional[str]:
@@ -39,7 +39,7 @@ def to_option_string(self, value: Any) -> Optional[str]:
         if(isinstance(mapped, HVACMode)):
             return mapped
 
-        _LOGGER.warning(f"Could not determine operation mode mapping for {value}")
+        _LOGGER.warning("Could not determine operation mode mapping for %s", value)
         return HVACMode.COOL
   
 class GeBiacClimate(GeClimate):
@@ -119,7 +119,7 @@ def current_operation_setting(self) -> Optional[AdvantiumCookSetting]:
         try:
             return ADVANTIUM_OPERATION_MODE_COOK_SETTING_MAPPING[self.current_operation_mode]
         except:
-            _LOGGER.warning(f"Unable to determine operation setting, mode = {self.current_operation_mode}")
+            _LOGGER.warning("Unable to determine operation setting, mode = %s", self.current_operation_mode)
             return None
             
     @property
@@ -185,7 +185,7 @@ async def async_set_operation_mode(self, operation_mode: str):
             mode = AdvantiumOperationMode(operation_mode)
             setting = ADVANTIUM_OPERATION_MODE_COOK_SETTING_MAPPING[mode]
         except:
-            _LOGGER.debug(f"Attempted to set mode to {operation_mode}, unknown.")
+            _LOGGER.debug("Attempted to set mode to %s, unknown.", operation_mode)
             return
 
         #determine the target temp for this mode
@@ -218,7 +218,7 @@ async def async_set_operation_mode(self, operation_mode: str):
         )
         _LOGGER.debug("New ErdAdvantiumCookSetting: %s", new_cook_mode)
 
-        await self.appliance.async_set_erd_value(ErdCode.ADVANTIUM_COOK_SETTING, new_cook_mode)
+        await self.api.async_set_erd_value(ErdCode.ADVANTIUM_COOK_SETTING, new_cook_mode)
 
     async def async_set_temperature(self, **kwargs):
         """Set the cook temperature"""
@@ -242,15 +242,13 @@ async def async_set_temperature(self, **kwargs):
         #should only need to update
         action = AdvantiumCookAction.UPDATED
 
-        #construct the new mode based on the existing mode
-        current_cook_mode = self.current_cook_setting
-        new_cook_mode = current_cook_mode._replace(
+        #update the existing mode (merged with any change still pending)
+        await self.api.async_merge_erd_value(
+            ErdCode.ADVANTIUM_COOK_SETTING,
             d = randrange(255),
             target_temperature = target_temp,
             cook_action = action,
-        )
-
-        await self.appliance.async_set_erd_value(ErdCode.ADVANTIUM_COOK_SETTING, new_cook_mode)            
+        )            
 
     def _ensure_operation_mode(self):
         cook_status = self.current_cook_status
@@ -23,7 +23,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdCcmBrewStrength[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set brew strength to {value.upper()}")
+            _LOGGER.warning("Could not set brew strength to %s", value.upper())
             return self._default
 
     def to_option_string(self, value: ErdCcmBrewStrength) -> Optional[str]:
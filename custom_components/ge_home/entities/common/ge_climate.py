@@ -110,16 +110,16 @@ def supported_features(self):
 
     @property
     def is_on(self) -> bool:
-        return self.appliance.get_erd_value(self.power_status_erd_code) == ErdOnOff.ON
+        return self.api.get_erd_value(self.power_status_erd_code) == ErdOnOff.ON
 
     @property
     def target_temperature(self) -> float | None: # type: ignore
         measurement_system = self.appliance.get_erd_value(ErdCode.TEMPERATURE_UNIT)
         if measurement_system == ErdMeasurementUnits.METRIC:
-            targ = float(self.appliance.get_erd_value(self.target_temperature_erd_code))
+            targ = float(self.api.get_erd_value(self.target_temperature_erd_code))
             targ = round( ((targ - 32.0) * (5/9)) / 2 ) * 2 
             return (9 * targ) / 5 + 32
-        return float(self.appliance.get_erd_value(self.target_temperature_erd_code))
+        return float(self.api.get_erd_value(self.target_temperature_erd_code))
 
     @property
     def current_temperature(self) -> float | None: # type: ignore
@@ -143,7 +143,7 @@ def hvac_mode(self) -> HVACMode | None: # type: ignore
         if not self.is_on:
             return HVACMode.OFF       
         try:
-            hm = self._hvac_mode_converter.to_option_string(self.appliance.get_erd_value(self.hvac_mode_erd_code))
+            hm = self._hvac_mode_converter.to_option_string(self.api.get_erd_value(self.hvac_mode_erd_code))
             return HVACMode(hm)
         except:
             return None
@@ -155,8 +155,8 @@ def hvac_modes(self) -> List[HVACMode]:
     @property
     def fan_mode(self) -> str | None: # type: ignore
         if self.hvac_mode == HVACMode.FAN_ONLY:
-            return self._fan_only_fan_mode_converter.to_option_string(self.appliance.get_erd_value(self.fan_mode_erd_code))
-        return self._fan_mode_converter.to_option_string(self.appliance.get_erd_value(self.fan_mode_erd_code))
+            return self._fan_only_fan_mode_converter.to_option_string(self.api.get_erd_value(self.fan_mode_erd_code))
+        return self._fan_mode_converter.to_option_string(self.api.get_erd_value(self.fan_mode_erd_code))
 
     @cached_property
     def fan_modes(self) -> List[str]:
@@ -165,32 +165,33 @@ def fan_modes(self) -> List[str]:
         return self._fan_mode_converter.options
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
-        _LOGGER.debug(f"Setting HVAC mode from {self.hvac_mode} to {hvac_mode}")
+        _LOGGER.debug("Setting HVAC mode from %s to %s", self.hvac_mode, hvac_mode)
         if hvac_mode != self.hvac_mode:
             if hvac_mode == HVACMode.OFF:
-                await self.appliance.async_set_erd_value(self.power_status_erd_code, ErdOnOff.OFF)
+                await self.api.async_set_erd_value(self.power_status_erd_code, ErdOnOff.OFF, optimistic=True)
             else:
+                writes = []
+
                 #if it's not on, turn it on
                 if not self.is_on:
-                    await self.appliance.async_set_erd_value(self.power_status_erd_code, ErdOnOff.ON)
+                    writes.append((self.power_status_erd_code, ErdOnOff.ON))
 
                 #then set the mode
-                await self.appliance.async_set_erd_value(
-                    self.hvac_mode_erd_code, 
-                    self._hvac_mode_converter.from_option_string(hvac_mode)
-                )
+                writes.append((self.hvac_mode_erd_code, self._hvac_mode_converter.from_option_string(hvac_mode)))
+                await self.api.async_set_erd_values(writes, optimistic=True)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
-        _LOGGER.debug(f"Setting Fan mode from {self.fan_mode} to {fan_mode}")
+        _LOGGER.debug("Setting Fan mode from %s to %s", self.fan_mode, fan_mode)
         if fan_mode != self.fan_mode:
             converter = (self._fan_only_fan_mode_converter 
                 if self.hvac_mode == HVACMode.FAN_ONLY
                 else self._fan_mode_converter
             )
 
-            await self.appliance.async_set_erd_value(
+            await self.api.async_set_erd_value(
                 self.fan_mode_erd_code, 
-                converter.from_option_string(fan_mode)
+                converter.from_option_string(fan_mode),
+                optimistic=True
             )
 
     async def async_set_temperature(self, **kwargs) -> None:
@@ -202,15 +203,15 @@ async def async_set_temperature(self, **kwargs) -> None:
         #convert to int (setting can only handle ints)
         temperature = int(temperature)
 
-        _LOGGER.debug(f"Setting temperature from {self.target_temperature} to {temperature}")
+        _LOGGER.debug("Setting temperature from %s to %s", self.target_temperature, temperature)
         if self.target_temperature != temperature:
-            await self.appliance.async_set_erd_value(self.target_temperature_erd_code, temperature)
+            await self.api.async_set_erd_value(self.target_temperature_erd_code, temperature, optimistic=True)
 
     async def async_turn_on(self):
-        await self.appliance.async_set_erd_value(self.power_status_erd_code, ErdOnOff.ON)
+        await self.api.async_set_erd_value(self.power_status_erd_code, ErdOnOff.ON, optimistic=True)
 
     async def async_turn_off(self):
-        await self.appliance.async_set_erd_value(self.power_status_erd_code, ErdOnOff.OFF)
+        await self.api.async_set_erd_value(self.power_status_erd_code, ErdOnOff.OFF, optimistic=True)
 
     def _convert_temp(self, temperature_f: int):
         if self.temperature_unit == UnitOfTemperature.FAHRENHEIT:
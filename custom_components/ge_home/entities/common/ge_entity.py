@@ -66,6 +66,8 @@ def added(self) -> bool:
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         self._added = True
+        #Note - the coordinator type isn't known to the API (see ApplianceApi.available)
+        self.api.coordinator.startup.entity_added() # type: ignore
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
@@ -38,4 +38,4 @@ def device_class(self) -> ButtonDeviceClass | None:
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.appliance.async_set_erd_value(self.erd_code, True)
+        await self.api.async_set_erd_value(self.erd_code, True)
@@ -36,7 +36,7 @@ def supported_features(self) -> FanEntityFeature: # type: ignore
     def is_on(self) -> bool: # type: ignore
         """Return True if fan is on."""
         try:
-            val: Any = self.appliance.get_erd_value(self.erd_code)
+            val: Any = self.api.get_erd_value(self.erd_code)
             return bool(val > 0) if val is not None else False
         except (KeyError, TypeError):
             return False
@@ -45,7 +45,7 @@ def is_on(self) -> bool: # type: ignore
     def percentage(self) -> int: # type: ignore
         """Return the current speed percentage."""
         try:
-            val: Any = self.appliance.get_erd_value(self.erd_code)
+            val: Any = self.api.get_erd_value(self.erd_code)
             return int(val) if val is not None else 0
         except (KeyError, ValueError, TypeError):
             return 0
@@ -62,4 +62,4 @@ async def async_turn_off(self, **kwargs: Any) -> None:
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await self.appliance.async_set_erd_value(self.erd_code, percentage)
+        await self.api.async_set_erd_value(self.erd_code, percentage, optimistic=True)
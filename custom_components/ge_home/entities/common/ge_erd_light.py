@@ -53,25 +53,25 @@ def color_mode(self) -> ColorMode: # type: ignore
     @property
     def brightness(self): # type: ignore
         """Return the brightness of the light."""
-        return to_hass_level(self.appliance.get_erd_value(self.erd_code))        
+        return to_hass_level(self.api.get_erd_value(self.erd_code))        
 
     @property
     def is_on(self) -> bool: # type: ignore
         """Return True if light is on."""
-        return self.appliance.get_erd_value(self.erd_code) > 0
+        return self.api.get_erd_value(self.erd_code) > 0
 
     async def async_turn_on(self, **kwargs):
         """Turn the light on."""
         brightness = kwargs.pop(ATTR_BRIGHTNESS, 255)
 
-        _LOGGER.debug(f"Turning on {self.unique_id}")
+        _LOGGER.debug("Turning on %s", self.unique_id)
         await self._set_brightness(brightness, **kwargs)
 
     async def async_turn_off(self, **kwargs):
         """Turn the light off."""
-        _LOGGER.debug(f"Turning off {self.unique_id}")
+        _LOGGER.debug("Turning off %s", self.unique_id)
         await self._set_brightness(0, **kwargs)
 
     async def _set_brightness(self, brightness, **kwargs):
-        await self.appliance.async_set_erd_value(self.erd_code, to_ge_level(brightness))
+        await self.api.async_set_erd_value(self.erd_code, to_ge_level(brightness), optimistic=True)
 
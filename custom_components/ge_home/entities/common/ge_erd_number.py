@@ -52,7 +52,7 @@ def available(self) -> bool: # type: ignore
     @property
     def native_value(self) -> float | None: # type: ignore
         try:
-            value = self.appliance.get_erd_value(self.erd_code)
+            value = self.api.get_erd_value(self.erd_code)
             return self._convert_value_from_device(value)
         except KeyError:
             return None
@@ -141,6 +141,6 @@ async def async_set_native_value(self, value):
             value = int(round(value))
 
         try:
-            await self.appliance.async_set_erd_value(self.erd_code, value) 
+            await self.api.async_set_erd_value(self.erd_code, value, optimistic=True)
         except:
-            _LOGGER.warning(f"Could not set {self.name} to {value}")
+            _LOGGER.warning("Could not set %s to %s", self.name, value)
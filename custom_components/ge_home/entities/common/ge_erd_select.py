@@ -40,7 +40,7 @@ def available(self) -> bool: # type: ignore
 
     @property
     def current_option(self) -> str | None: # type: ignore
-        return self._converter.to_option_string(self.appliance.get_erd_value(self.erd_code))
+        return self._converter.to_option_string(self.api.get_erd_value(self.erd_code))
 
     @cached_property
     def options(self) -> List[str]:
@@ -48,10 +48,10 @@ def options(self) -> List[str]:
         return self._converter.options
     
     async def async_select_option(self, option: str) -> None:
-        _LOGGER.debug(f"Setting select from {self.current_option} to {option}")
+        _LOGGER.debug("Setting select from %s to %s", self.current_option, option)
         """Change the selected option."""
         if option != self.current_option:
-            await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option))
+            await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option), optimistic=self._control_erd_code is None)
 
     @property
     def _writeable_erd_code(self) -> ErdCodeType:
@@ -202,6 +202,10 @@ def _get_state_class(self) -> Optional[SensorStateClass]:
     async def set_value(self, value):
         """Sets the ERD value, assumes that the data type is correct"""
         try:
-            await self.appliance.async_set_erd_value(self.erd_code, value) 
+            await self.api.async_set_erd_value(self.erd_code, value) 
         except:
-            _LOGGER.warning(f"Could not set {self.name} to {value}")
+            _LOGGER.warning("Could not set %s to %s", self.name, value)
+
+    async def set_value_and_confirm(self, value, timeout: Optional[float] = None):
+        """Sets the ERD value and waits for the appliance to report it back (raises HaCommandNotConfirmed if it doesn't)"""
+        await self.api.async_set_and_confirm(self.erd_code, value, timeout)
@@ -44,7 +44,7 @@ def available(self) -> bool: # type: ignore
     @property
     def is_on(self) -> bool: # type: ignore
         """Return True if switch is on."""
-        return self._converter.boolify(self.appliance.get_erd_value(self.erd_code))
+        return self._converter.boolify(self.api.get_erd_value(self.erd_code))
     
     @cached_property
     def device_class(self) -> SwitchDeviceClass | None:       
@@ -65,14 +65,14 @@ def device_class(self) -> SwitchDeviceClass | None:
     
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        _LOGGER.debug(f"Turning on {self.unique_id}")
+        _LOGGER.debug("Turning on %s", self.unique_id)
 
-        await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.true_value())
+        await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.true_value(), optimistic=self._control_erd_code is None)
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
-        _LOGGER.debug(f"Turning off {self.unique_id}")
-        await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.false_value())
+        _LOGGER.debug("Turning off %s", self.unique_id)
+        await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.false_value(), optimistic=self._control_erd_code is None)
 
     def _get_icon(self):
         if self._icon_on_override and self.is_on:
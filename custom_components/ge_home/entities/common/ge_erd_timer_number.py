@@ -51,6 +51,6 @@ def _convert_value_from_device(self, value) -> Optional[float]:
     async def async_set_native_value(self, value: float) -> None:
         td = timedelta(minutes=int(round(value)))
         try:
-            await self.appliance.async_set_erd_value(self.erd_code, td)
+            await self.api.async_set_erd_value(self.erd_code, td)
         except Exception:
-            _LOGGER.warning(f"Could not set {self.name} to {value} minutes")
+            _LOGGER.warning("Could not set %s to %s minutes", self.name, value)
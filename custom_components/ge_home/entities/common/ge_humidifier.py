@@ -57,7 +57,7 @@ def available(self) -> bool: # type: ignore
 
     @property
     def target_humidity(self) -> int | None: # type: ignore
-        return int(self.appliance.get_erd_value(self._target_humidity_erd_code))
+        return int(self.api.get_erd_value(self._target_humidity_erd_code))
 
     @property
     def current_humidity(self) -> int | None: # type: ignore
@@ -77,7 +77,7 @@ def supported_features(self) -> HumidifierEntityFeature:
 
     @property
     def is_on(self) -> bool: # type: ignore
-        return self.appliance.get_erd_value(self._power_status_erd_code) == ErdOnOff.ON
+        return self.api.get_erd_value(self._power_status_erd_code) == ErdOnOff.ON
 
     @cached_property
     def device_class(self) -> HumidifierDeviceClass | None:
@@ -91,24 +91,24 @@ async def async_set_humidity(self, humidity: int) -> None:
         if self.target_humidity == target:
             return
 
-        _LOGGER.debug(f"Setting Target Humidity from {self.target_humidity} to {target}")
+        _LOGGER.debug("Setting Target Humidity from %s to %s", self.target_humidity, target)
+
+        writes = []
 
         # make sure we're on
         if not self.is_on:
-            await self.async_turn_on()
+            writes.append((self._power_status_erd_code, ErdOnOff.ON))
 
         # set the target humidity
-        await self.appliance.async_set_erd_value(
-            self._target_humidity_erd_code,
-            target,
-        )
+        writes.append((self._target_humidity_erd_code, target))
+        await self.api.async_set_erd_values(writes, optimistic=True)
 
     async def async_turn_on(self, **kwargs: Any):
-        await self.appliance.async_set_erd_value(
-            self._power_status_erd_code, ErdOnOff.ON
+        await self.api.async_set_erd_value(
+            self._power_status_erd_code, ErdOnOff.ON, optimistic=True
         )
 
     async def async_turn_off(self, **kwargs: Any):
-        await self.appliance.async_set_erd_value(
-            self._power_status_erd_code, ErdOnOff.OFF
+        await self.api.async_set_erd_value(
+            self._power_status_erd_code, ErdOnOff.OFF, optimistic=True
         )
\ No newline at end of file
@@ -71,7 +71,7 @@ async def async_set_mode(self, mode: str) -> None:
             raise NotImplementedError()
 
         """Change the selected mode."""
-        _LOGGER.debug(f"Setting mode from {self.mode} to {mode}")
+        _LOGGER.debug("Setting mode from %s to %s", self.mode, mode)
         
         new_state = self._mode_converter.from_option_string(mode)
-        await self.appliance.async_set_erd_value(ErdCode.AC_FAN_SETTING, new_state)
+        await self.api.async_set_erd_value(ErdCode.AC_FAN_SETTING, new_state)
@@ -18,7 +18,7 @@ def from_option_string(self, value: str) -> Any:
                 return ErdAcFanSetting.DEFAULT
             return ErdAcFanSetting[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set fan setting to {value.upper()}")
+            _LOGGER.warning("Could not set fan setting to %s", value.upper())
             return ErdAcFanSetting.DEFAULT
     def to_option_string(self, value: ErdAcFanSetting) -> Optional[str]:
         try:
@@ -23,7 +23,7 @@ def name(self) -> Optional[str]:
     
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.appliance.async_set_erd_value(self.erd_code, self._command)
+        await self.api.async_set_erd_value(self.erd_code, self._command)
 
     def _get_icon(self) -> Optional[str]:
         return {
@@ -41,7 +41,7 @@ def from_option_string(self, value: str) -> Any:
             v = value.split(" ")[0]
             return ErdConvertableDrawerMode[v.upper()]
         except:
-            _LOGGER.warning(f"Could not set drawer mode to {value.upper()}")
+            _LOGGER.warning("Could not set drawer mode to %s", value.upper())
             return ErdConvertableDrawerMode.NA
         
     def to_option_string(self, value: ErdConvertableDrawerMode) -> Optional[str]:
@@ -19,10 +19,12 @@
 
 from ...const import DOMAIN
 from ...devices import ApplianceApi
+from ...log_dedup import DedupLogger
 from ..common import GeAbstractWaterHeater
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
+_DEDUP_LOGGER = DedupLogger(_LOGGER)
 
 class GeAbstractFridge(GeAbstractWaterHeater):
     """Mock a fridge or freezer as a water heater."""
@@ -72,7 +74,7 @@ def name(self) -> Optional[str]:
     @property
     def target_temps(self) -> FridgeSetPoints:
         """Get the current temperature settings tuple."""
-        return self.appliance.get_erd_value(ErdCode.TEMPERATURE_SETTING)
+        return self.api.get_erd_value(ErdCode.TEMPERATURE_SETTING)
 
     @property
     def target_temperature(self) -> int | None: # type: ignore
@@ -86,10 +88,10 @@ def current_temperature(self) -> int | None:  # type: ignore
             current_temps = self.appliance.get_erd_value(ErdCode.CURRENT_TEMPERATURE)
             current_temp = getattr(current_temps, self.heater_type)
             if current_temp is None:
-                _LOGGER.exception(f"{self.name} has None for current_temperature (available: {self.available})!")
+                _DEDUP_LOGGER.warning(self.unique_id, "%s has None for current_temperature (available: %s)!", lambda: (self.name, self.available))
             return current_temp
         except:
-            _LOGGER.debug("Device doesn't report current temperature.")
+            _DEDUP_LOGGER.debug(self.unique_id, "%s doesn't report current temperature.", lambda: (self.name,))
             return None
 
     async def async_set_temperature(self, **kwargs):
@@ -99,14 +101,11 @@ async def async_set_temperature(self, **kwargs):
         if not self.min_temp <= target_temp <= self.max_temp:
             raise ValueError("Tried to set temperature out of device range")
 
-        if self.heater_type == HEATER_TYPE_FRIDGE:
-            new_temp = FridgeSetPoints(fridge=target_temp, freezer=self.target_temps.freezer)
-        elif self.heater_type == HEATER_TYPE_FREEZER:
-            new_temp = FridgeSetPoints(fridge=self.target_temps.fridge, freezer=target_temp)
-        else:
+        if self.heater_type not in (HEATER_TYPE_FRIDGE, HEATER_TYPE_FREEZER):
             raise ValueError("Invalid heater_type")
 
-        await self.appliance.async_set_erd_value(ErdCode.TEMPERATURE_SETTING, new_temp)
+        # only change our own setpoint, the other compartment may have a change in flight
+        await self.api.async_merge_erd_value(ErdCode.TEMPERATURE_SETTING, optimistic=True, **{self.heater_type: target_temp})
 
     @property
     def supported_features(self):
@@ -122,7 +121,7 @@ def min_temp(self):
         try:
             return getattr(self.setpoint_limits, f"{self.heater_type}_min")
         except:
-            _LOGGER.debug("No temperature setpoint limits available. Using hardcoded limits.")
+            _DEDUP_LOGGER.debug(self.unique_id, "%s has no temperature setpoint limits available. Using hardcoded limits.", lambda: (self.name,))
             return TemperatureConverter.convert(self.temp_limits[f"{self.heater_type}_min"], UnitOfTemperature.FAHRENHEIT, self.temperature_unit)
 
     @property
@@ -131,26 +130,26 @@ def max_temp(self):
         try:
             return getattr(self.setpoint_limits, f"{self.heater_type}_max")
         except:
-            _LOGGER.debug("No temperature setpoint limits available. Using hardcoded limits.")
+            _DEDUP_LOGGER.debug(self.unique_id, "%s has no temperature setpoint limits available. Using hardcoded limits.", lambda: (self.name,))
             return TemperatureConverter.convert(self.temp_limits[f"{self.heater_type}_max"], UnitOfTemperature.FAHRENHEIT, self.temperature_unit)
 
     @property
     def current_operation(self) -> str: # type: ignore
         """Get the current operation mode."""
-        if self.appliance.get_erd_value(ErdCode.SABBATH_MODE):
+        if self.api.get_erd_value(ErdCode.SABBATH_MODE):
             return OP_MODE_SABBATH
         try:
-            if self.appliance.get_erd_value(self.turbo_erd_code):
+            if self.api.get_erd_value(self.turbo_erd_code):
                 return self.turbo_mode
         except:
-            _LOGGER.debug("Turbo mode not supported.")
+            _DEDUP_LOGGER.debug(self.unique_id, "%s does not support turbo mode.", lambda: (self.name,))
         return OP_MODE_NORMAL
 
     async def async_set_sabbath_mode(self, sabbath_on: bool = True):
         """Set sabbath mode if it's changed"""
-        if self.appliance.get_erd_value(ErdCode.SABBATH_MODE) == sabbath_on:
+        if self.api.get_erd_value(ErdCode.SABBATH_MODE) == sabbath_on:
             return
-        await self.appliance.async_set_erd_value(ErdCode.SABBATH_MODE, sabbath_on)
+        await self.api.async_set_erd_value(ErdCode.SABBATH_MODE, sabbath_on, optimistic=True)
 
     async def async_set_operation_mode(self, operation_mode):
         """Set the operation mode."""
@@ -159,9 +158,14 @@ async def async_set_operation_mode(self, operation_mode):
         if operation_mode == self.current_operation:
             return
         sabbath_mode = operation_mode == OP_MODE_SABBATH
-        await self.async_set_sabbath_mode(sabbath_mode)
+
+        writes = []
+        if self.api.get_erd_value(ErdCode.SABBATH_MODE) != sabbath_mode:
+            writes.append((ErdCode.SABBATH_MODE, sabbath_mode))
         if not sabbath_mode:
-            await self.appliance.async_set_erd_value(self.turbo_erd_code, operation_mode == self.turbo_mode)
+            writes.append((self.turbo_erd_code, operation_mode == self.turbo_mode))
+        if writes:
+            await self.api.async_set_erd_values(writes, optimistic=True)
 
     @property
     def door_status(self) -> FridgeDoorStatus:
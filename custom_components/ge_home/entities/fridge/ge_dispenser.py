@@ -75,13 +75,13 @@ async def async_set_temperature(self, **kwargs):
         if not self.min_temp <= target_temp <= self.max_temp:
             raise ValueError("Tried to set temperature out of device range")
     
-        await self.appliance.async_set_erd_value(ErdCode.HOT_WATER_SET_TEMP, target_temp)
+        await self.api.async_set_erd_value(ErdCode.HOT_WATER_SET_TEMP, target_temp)
 
     async def async_set_sabbath_mode(self, sabbath_on: bool = True):
         """Set sabbath mode if it's changed"""
         if self.appliance.get_erd_value(ErdCode.SABBATH_MODE) == sabbath_on:
             return
-        await self.appliance.async_set_erd_value(ErdCode.SABBATH_MODE, sabbath_on)
+        await self.api.async_set_erd_value(ErdCode.SABBATH_MODE, sabbath_on)
 
     async def async_set_operation_mode(self, operation_mode):
         """Set the operation mode."""
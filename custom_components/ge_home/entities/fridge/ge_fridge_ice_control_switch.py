@@ -25,7 +25,7 @@ def is_on(self) -> bool:
  
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        _LOGGER.debug(f"Turning on {self.unique_id}")
+        _LOGGER.debug("Turning on %s", self.unique_id)
 
         old_status = self.control_status
         if self._control_type == "fridge":
@@ -33,11 +33,11 @@ async def async_turn_on(self, **kwargs):
         else:
             new_status = IceMakerControlStatus(old_status.status_fridge, ErdOnOff.ON)
 
-        await self.appliance.async_set_erd_value(self.erd_code, new_status)
+        await self.api.async_set_erd_value(self.erd_code, new_status)
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
-        _LOGGER.debug(f"Turning off {self.unique_id}")
+        _LOGGER.debug("Turning off %s", self.unique_id)
 
         old_status = self.control_status
         if self._control_type == "fridge":
@@ -45,4 +45,4 @@ async def async_turn_off(self, **kwargs):
         else:
             new_status = IceMakerControlStatus(old_status.status_fridge, ErdOnOff.OFF)
 
-        await self.appliance.async_set_erd_value(self.erd_code, new_status)
+        await self.api.async_set_erd_value(self.erd_code, new_status)
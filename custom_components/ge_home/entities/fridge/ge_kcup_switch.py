@@ -51,19 +51,19 @@ def is_on(self) -> bool: # type: ignore
             current_set_temp = self.api.try_get_erd_value(ErdCode.HOT_WATER_SET_TEMP)
             return current_set_temp != K_CUP_OFF_TEMP
         except Exception as e:
-            _LOGGER.warning(f"Could not get K-Cup status for {self.unique_id}: {e}")
+            _LOGGER.warning("Could not get K-Cup status for %s: %s", self.unique_id, e)
             return False
 
     async def async_turn_on(self, **kwargs):
         """Turn the K-Cup heater on by setting the target temperature."""
-        _LOGGER.debug(f"Turning on K-Cup heater for {self.unique_id}")
-        await self.api.appliance.async_set_erd_value(
+        _LOGGER.debug("Turning on K-Cup heater for %s", self.unique_id)
+        await self.api.async_set_erd_value(
             ErdCode.HOT_WATER_SET_TEMP, K_CUP_ON_TEMP
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the K-Cup heater off by setting the target temperature to zero."""
-        _LOGGER.debug(f"Turning off K-Cup heater for {self.unique_id}")
-        await self.api.appliance.async_set_erd_value(
+        _LOGGER.debug("Turning off K-Cup heater for %s", self.unique_id)
+        await self.api.async_set_erd_value(
             ErdCode.HOT_WATER_SET_TEMP, K_CUP_OFF_TEMP
         )
\ No newline at end of file
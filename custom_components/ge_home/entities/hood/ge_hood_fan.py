@@ -62,7 +62,7 @@ def percentage(self) -> int:
             speed_index = opts.index(option) + 1
             return (speed_index * 100) // self.speed_count
         except ValueError:
-            _LOGGER.debug(f"Unable to map hood fan speed {option} to percentage")
+            _LOGGER.debug("Unable to map hood fan speed %s to percentage", option)
             return 0
 
     @property
@@ -117,8 +117,8 @@ async def async_set_percentage(self, percentage: int) -> None:
         self._requested_percentage = percentage
         option = self._option_from_percentage(percentage)
         if option != self.current_option:
-            _LOGGER.debug(f"Setting hood fan from {self.current_option} to {option}")
-            await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option))
+            _LOGGER.debug("Setting hood fan from %s to %s", self.current_option, option)
+            await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option))
 
     async def async_turn_on(self, percentage: int | None = None, preset_mode: str | None = None, **kwargs: Any) -> None:
         """Turn the hood fan on."""
@@ -137,8 +137,8 @@ async def async_set_preset_mode(self, preset_mode: str) -> None:
 
         self._requested_percentage = 100
         if self.current_option.lower() != self._boost_option.lower():
-            _LOGGER.debug(f"Setting hood fan from {self.current_option} to {self._boost_option}")
-            await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(self._boost_option))
+            _LOGGER.debug("Setting hood fan from %s to %s", self.current_option, self._boost_option)
+            await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(self._boost_option))
 
     def _option_from_percentage(self, percentage: int) -> str:
         if percentage <= 0 or self.speed_count == 0:
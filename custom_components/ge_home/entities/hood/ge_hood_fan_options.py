@@ -30,7 +30,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdHoodFanSpeed[value.upper()]
         except Exception:
-            _LOGGER.warning(f"Could not set hood fan speed to {value.upper()}")
+            _LOGGER.warning("Could not set hood fan speed to %s", value.upper())
             return ErdHoodFanSpeed.OFF
 
     def to_option_string(self, value: Any) -> Optional[str]:
@@ -43,7 +43,7 @@ def brightness(self) -> int:
             level_index = opts.index(option) + 1
             return round((level_index * 255) / len(opts))
         except ValueError:
-            _LOGGER.debug(f"Unable to map hood light level {option} to brightness")
+            _LOGGER.debug("Unable to map hood light level %s to brightness", option)
             return 0
 
     @property
@@ -86,14 +86,14 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         brightness: int = kwargs.pop(ATTR_BRIGHTNESS, self.brightness or 255)
         option = self._option_from_brightness(brightness)
         if option != self._current_option:
-            _LOGGER.debug(f"Setting hood light from {self._current_option} to {option}")
-            await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option))
+            _LOGGER.debug("Setting hood light from %s to %s", self._current_option, option)
+            await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(option))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
         if self._current_option != self._off_option:
-            _LOGGER.debug(f"Turning off {self.unique_id}")
-            await self.appliance.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(self._off_option))
+            _LOGGER.debug("Turning off %s", self.unique_id)
+            await self.api.async_set_erd_value(self._writeable_erd_code, self._converter.from_option_string(self._off_option))
 
     def _option_from_brightness(self, brightness: int) -> str:
         opts = self._light_options
@@ -28,7 +28,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdHoodLightLevel[value.upper()]
         except Exception:
-            _LOGGER.warning(f"Could not set hood light level to {value.upper()}")
+            _LOGGER.warning("Could not set hood light level to %s", value.upper())
             return ErdHoodLightLevel.OFF
 
     def to_option_string(self, value: Any) -> Optional[str]:
@@ -61,7 +61,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdHoodLightLevelNew[value.upper()]
         except Exception:
-            _LOGGER.warning(f"Could not set hood light level to {value.upper()}")
+            _LOGGER.warning("Could not set hood light level to %s", value.upper())
             return ErdHoodLightLevelNew.OFF
 
     def to_option_string(self, value: Any) -> Optional[str]:
@@ -0,0 +1 @@
+from .ge_hub_metric_sensor import GeHubMetricSensor, HUB_METRIC_SENSORS
@@ -0,0 +1,59 @@
+from typing import Any, NamedTuple, Optional
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from ...const import DOMAIN
+
+class HubMetric(NamedTuple):
+    key: str
+    name: str
+    uom: Optional[str] = None
+    device_class: Optional[SensorDeviceClass] = None
+    state_class: Optional[SensorStateClass] = SensorStateClass.MEASUREMENT
+    icon: Optional[str] = None
+
+HUB_METRIC_SENSORS = (
+    HubMetric("messages_per_second", "Messages Received", "msg/s", icon="mdi:message-arrow-left"),
+    HubMetric("state_writes_per_second", "State Writes", "writes/s", icon="mdi:database-arrow-right"),
+    HubMetric("writes_skipped", "State Writes Skipped", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:database-remove"),
+    HubMetric("polls_sent", "Poll Requests Sent", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:refresh"),
+    HubMetric("polls_failed", "Poll Requests Failed", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:refresh-circle"),
+    HubMetric("reconnects", "Reconnects", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:lan-pending"),
+    HubMetric("callback_violations", "Callback Budget Violations", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:timer-alert"),
+    HubMetric("updates_coalesced", "Updates Coalesced", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:call-merge"),
+    HubMetric("erd_values_shed", "Stale Values Shed", state_class=SensorStateClass.TOTAL_INCREASING, icon="mdi:delete-sweep"),
+    HubMetric("backoff", "Reconnect Backoff", UnitOfTime.SECONDS, SensorDeviceClass.DURATION),
+    HubMetric("update_latency_p50_ms", "Update Latency (p50)", UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION),
+    HubMetric("update_latency_p95_ms", "Update Latency (p95)", UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION),
+)
+
+class GeHubMetricSensor(SensorEntity):
+    """Diagnostic sensor for one of the coordinator's performance metrics"""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # most users never look at these, so don't record their history unless asked to
+    _attr_entity_registry_enabled_default = False
+    # polled on the normal sensor interval rather than pushed, so these never add to the update path
+    _attr_should_poll = True
+
+    def __init__(self, coordinator: DataUpdateCoordinator, metric: HubMetric):
+        self._coordinator = coordinator
+        self._metric = metric
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.hub_id}_{metric.key}" # type: ignore
+        self._attr_name = f"GE Home {metric.name}"
+        self._attr_native_unit_of_measurement = metric.uom
+        self._attr_device_class = metric.device_class
+        self._attr_state_class = metric.state_class
+        self._attr_icon = metric.icon
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        #Note - see ApplianceApi.available re: the coordinator type hints
+        return self._coordinator.hub_device_info # type: ignore
+
+    @property
+    def native_value(self) -> Any:
+        return self._coordinator.metrics.get(self._metric.key) # type: ignore
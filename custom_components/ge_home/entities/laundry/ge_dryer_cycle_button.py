@@ -38,8 +38,8 @@ def available(self) -> bool:
 
     async def async_press(self) -> None:
         """Send the start command by setting the delay time to zero."""
-        _LOGGER.debug(f"Sending START command to {self.unique_id}")
-        await self.appliance.async_set_erd_value(
+        _LOGGER.debug("Sending START command to %s", self.unique_id)
+        await self.api.async_set_erd_value(
             ErdCode.LAUNDRY_REMOTE_DELAY_CONTROL, 
             timedelta(seconds=0)
         )
\ No newline at end of file
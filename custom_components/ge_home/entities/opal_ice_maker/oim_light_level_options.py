@@ -15,7 +15,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdOimLightLevel[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set hood light level to {value.upper()}")
+            _LOGGER.warning("Could not set hood light level to %s", value.upper())
             return ErdOimLightLevel.OFF
     def to_option_string(self, value: ErdOimLightLevel) -> Optional[str]:
         try:
@@ -98,7 +98,7 @@ def current_operation(self) -> str | None: # type: ignore
         try:
             return COOK_MODE_OP_MAP[current_state]
         except KeyError:
-            _LOGGER.debug(f"Unable to map {current_state} to an operation mode")
+            _LOGGER.debug("Unable to map %s to an operation mode", current_state)
             return OP_MODE_COOK_UNK
 
     @cached_property
@@ -106,19 +106,19 @@ def operation_list(self) -> List[str]:
         #lookup all the available cook modes
         erd_code = self.get_erd_code("AVAILABLE_COOK_MODES")
         cook_modes: Set[ErdOvenCookMode] = self.appliance.get_erd_value(erd_code)
-        _LOGGER.debug(f"Available Cook Modes: {cook_modes}")
+        _LOGGER.debug("Available Cook Modes: %s", cook_modes)
 
         #get the extended cook modes and add them to the list
         ext_erd_code = self.get_erd_code("EXTENDED_COOK_MODES")
         ext_cook_modes: Set[ErdOvenCookMode] | None = self.api.try_get_erd_value(ext_erd_code)
-        _LOGGER.debug(f"Extended Cook Modes: {ext_cook_modes}")
+        _LOGGER.debug("Extended Cook Modes: %s", ext_cook_modes)
         if ext_cook_modes:
             cook_modes = cook_modes.union(ext_cook_modes)
 
         #make sure that we limit them to the list of known codes
         cook_modes = cook_modes.intersection(COOK_MODE_OP_MAP.keys())
         
-        _LOGGER.debug(f"Final Cook Modes: {cook_modes}")
+        _LOGGER.debug("Final Cook Modes: %s", cook_modes)
         op_modes = [o for o in (COOK_MODE_OP_MAP[c] for c in cook_modes) if o]
         op_modes = [OP_MODE_OFF] + op_modes
         return op_modes
@@ -166,7 +166,7 @@ async def async_set_operation_mode(self, operation_mode: str):
 
         new_cook_mode = OvenCookSetting(OVEN_COOK_MODE_MAP[erd_cook_mode], target_temp)
         erd_code = self.get_erd_code("COOK_MODE")
-        await self.appliance.async_set_erd_value(erd_code, new_cook_mode)
+        await self.api.async_set_erd_value(erd_code, new_cook_mode)
 
     async def async_set_temperature(self, **kwargs):
         """Set the cook temperature"""
@@ -183,7 +183,7 @@ async def async_set_temperature(self, **kwargs):
 
         new_cook_mode = OvenCookSetting(OVEN_COOK_MODE_MAP[erd_cook_mode], target_temp)
         erd_code = self.get_erd_code("COOK_MODE")
-        await self.appliance.async_set_erd_value(erd_code, new_cook_mode)
+        await self.api.async_set_erd_value(erd_code, new_cook_mode)
 
     def get_erd_value(self, suffix: str) -> Any:
         erd_code = self.get_erd_code(suffix)
@@ -16,7 +16,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdOvenWarmingState[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set Oven warming state to {value.upper()}")
+            _LOGGER.warning("Could not set Oven warming state to %s", value.upper())
             return ErdOvenWarmingState.OFF
     def to_option_string(self, value: ErdOvenWarmingState) -> Optional[str]:
         try:
@@ -49,9 +49,9 @@ def current_option(self):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        _LOGGER.debug(f"Setting select from {self.current_option} to {option}")
+        _LOGGER.debug("Setting select from %s to %s", self.current_option, option)
         
         new_state: ErdOvenWarmingState = self._converter.from_option_string(option)
-        await self.appliance.async_set_erd_value(self.erd_code, new_state)
+        await self.api.async_set_erd_value(self.erd_code, new_state)
         self._assumed_state = new_state
         
\ No newline at end of file
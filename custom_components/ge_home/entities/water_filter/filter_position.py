@@ -16,7 +16,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdWaterFilterPosition[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set filter position to {value.upper()}")
+            _LOGGER.warning("Could not set filter position to %s", value.upper())
             return ErdWaterFilterPosition.UNKNOWN
     def to_option_string(self, value: Any) -> Optional[str]:
         try:
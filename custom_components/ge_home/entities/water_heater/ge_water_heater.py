@@ -45,7 +45,7 @@ def current_temperature(self) -> int | None: # type: ignore
 
     @property
     def current_operation(self) -> str | None: # type: ignore
-        erd_mode = self.appliance.get_erd_value(ErdCode.WH_HEATER_MODE)
+        erd_mode = self.api.get_erd_value(ErdCode.WH_HEATER_MODE)
         return self._modes_converter.to_option_string(erd_mode)
 
     @cached_property
@@ -55,7 +55,7 @@ def operation_list(self) -> List[str]:
     @property
     def target_temperature(self) -> int | None: # type: ignore
         """Return the temperature we try to reach."""
-        return self.appliance.get_erd_value(ErdCode.WH_HEATER_TARGET_TEMPERATURE)
+        return self.api.get_erd_value(ErdCode.WH_HEATER_TARGET_TEMPERATURE)
 
     @property
     def min_temp(self) -> int:
@@ -75,7 +75,7 @@ async def async_set_operation_mode(self, operation_mode: str):
         erd_mode = self._modes_converter.from_option_string(operation_mode)
 
         if (erd_mode != ErdWaterHeaterMode.UNKNOWN):
-            await self.appliance.async_set_erd_value(ErdCode.WH_HEATER_MODE, erd_mode)
+            await self.api.async_set_erd_value(ErdCode.WH_HEATER_MODE, erd_mode, optimistic=True)
 
     async def async_set_temperature(self, **kwargs):
         """Set the water temperature"""
@@ -84,4 +84,4 @@ async def async_set_temperature(self, **kwargs):
         if target_temp is None:
             return
 
-        await self.appliance.async_set_erd_value(ErdCode.WH_HEATER_TARGET_TEMPERATURE, target_temp)
+        await self.api.async_set_erd_value(ErdCode.WH_HEATER_TARGET_TEMPERATURE, target_temp, optimistic=True)
@@ -93,7 +93,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdWaterHeaterMode[enum_val]
         except:
-            _LOGGER.warning(f"Could not convert heater mode from {value}")
+            _LOGGER.warning("Could not convert heater mode from %s", value)
             return ErdWaterHeaterMode.UNKNOWN
     
     def to_option_string(self, value: ErdWaterHeaterMode) -> Optional[str]:
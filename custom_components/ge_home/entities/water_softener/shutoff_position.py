@@ -18,7 +18,7 @@ def from_option_string(self, value: str) -> Any:
         try:
             return ErdWaterSoftenerShutoffValveState[value.upper()]
         except:
-            _LOGGER.warning(f"Could not set filter position to {value.upper()}")
+            _LOGGER.warning("Could not set filter position to %s", value.upper())
             return ErdWaterSoftenerShutoffValveState.UNKNOWN
     def to_option_string(self, value: Any) -> Optional[str]:
         try:
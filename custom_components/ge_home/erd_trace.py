@@ -0,0 +1,126 @@
+"""Incremental tracing of ERD value changes (replaces the full appliance dumps)"""
+
+import logging
+import time
+from typing import Any, Dict, Iterable, Set, Tuple
+
+from gehomesdk import ErdCodeType, GeAppliance
+
+from .const import ERD_TRACE_BURST, ERD_TRACE_RATE
+
+# separate logger, so tracing can be turned on without the rest of the integration's debug logging
+_LOGGER = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Allows bursts of up to capacity events, refilled at rate per second"""
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def consume(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+def _erd_name(erd_code: ErdCodeType) -> str:
+    return getattr(erd_code, "name", str(erd_code))
+
+class ErdChangeTracer:
+    """
+    Logs the ERDs that changed in each update (old and new value) at debug level.
+
+    Only does any work when debug logging is enabled for this module.  Can be limited
+    to certain appliances and ERDs, and lines beyond the rate limit are dropped (and
+    counted in the next line that makes it through).
+    """
+
+    def __init__(self, rate: float = ERD_TRACE_RATE, burst: float = ERD_TRACE_BURST):
+        self._bucket = TokenBucket(rate, burst)
+        self._last: Dict[Tuple[str, ErdCodeType], Any] = {}
+        self._appliances: Set[str] = set()
+        self._erds: Set[str] = set()
+        self._dropped = 0
+
+    def set_filter(self, appliances: Iterable[str] = (), erds: Iterable[str] = ()) -> None:
+        """Only trace these appliances (MAC addresses) and ERDs (names or codes); empty means all."""
+        self._appliances = set(a.upper() for a in appliances)
+        self._erds = set(e.upper() for e in erds)
+        self._last.clear()
+
+    def seed(self, appliance: GeAppliance) -> None:
+        """Remember the current values of an appliance without logging them."""
+        if not self._is_traced(appliance):
+            return
+
+        mac_addr = appliance.mac_addr
+        for erd_code, value in appliance._property_cache.items():
+            if self._is_erd_traced(erd_code):
+                self._last[(mac_addr, erd_code)] = value
+        _LOGGER.debug("Tracing %s (%s), %d ERDs", mac_addr, appliance.appliance_type, len(appliance._property_cache))
+
+    def trace_update(self, appliance: GeAppliance, update_data: Dict[ErdCodeType, Any]) -> None:
+        """Log the ERDs in an update whose value changed."""
+        if not self._is_traced(appliance):
+            return
+
+        mac_addr = appliance.mac_addr
+        for raw_code in update_data:
+            erd_code = appliance.translate_erd_code(raw_code)
+            if not self._is_erd_traced(erd_code):
+                continue
+
+            key = (mac_addr, erd_code)
+            new = appliance._property_cache.get(erd_code)
+            old = self._last.get(key)
+            if key in self._last and old == new:
+                continue
+            self._last[key] = new
+
+            if not self._bucket.consume():
+                self._dropped += 1
+                continue
+            if self._dropped:
+                _LOGGER.debug("(%d ERD trace lines dropped by the rate limit)", self._dropped)
+                self._dropped = 0
+            _LOGGER.debug("%s %s: %s -> %s", mac_addr, _erd_name(erd_code), old, new)
+
+    def _is_traced(self, appliance: GeAppliance) -> bool:
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return False
+        return not self._appliances or appliance.mac_addr.upper() in self._appliances
+
+    def _is_erd_traced(self, erd_code: ErdCodeType) -> bool:
+        if not self._erds:
+            return True
+        return _erd_name(erd_code).upper() in self._erds or str(getattr(erd_code, "value", erd_code)).upper() in self._erds
+
+def dump_appliance(appliance: GeAppliance) -> Dict[str, Any]:
+    """Everything we know about an appliance, for the dump_appliance service."""
+    appliance_data: Dict[str, Any] = {}
+    # dir() gets all attrs, including properties and methods
+    for attr_name in dir(appliance):
+        # skip "magic" methods and "private" attributes to reduce noise
+        if attr_name.startswith('_'):
+            continue
+        try:
+            value = getattr(appliance, attr_name)
+            # for now skip methods - we only want data
+            if callable(value):
+                continue
+            appliance_data[attr_name] = str(value)
+        except Exception:
+            # some props might fail if called out of context
+            appliance_data[attr_name] = "Error: Could not read attribute"
+
+    # add the internal property cache (i.e. current values)
+    appliance_data["property_cache"] = {
+        _erd_name(erd_code): str(value) for erd_code, value in appliance._property_cache.items()
+    }
+    return appliance_data
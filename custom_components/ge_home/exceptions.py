@@ -13,4 +13,6 @@ class HaTermsRequired(ha_exc.HomeAssistantError):
 class HaAlreadyConfigured(ha_exc.HomeAssistantError):
     """Error to indicate that the account is already configured"""
 class HaInvalidOperation(ha_exc.HomeAssistantError):
-    """Error to indcate that an invalid operation was attempted"""
\ No newline at end of file
+    """Error to indcate that an invalid operation was attempted"""
+class HaCommandNotConfirmed(ha_exc.HomeAssistantError):
+    """Error to indicate that an appliance did not confirm a command"""
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""Ingest stage between the client's update events and entity rendering"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from gehomesdk import ErdCode, ErdCodeType, GeAppliance
+
+from .metrics import CoordinatorMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# ERDs that are never coalesced away: a transient alert has to reach HA even if a
+# later update clears it before we get to it
+URGENT_ERDS = (
+    ErdCode.WH_FILTER_FLOW_ALERT,
+    ErdCode.WH_FILTER_LEAK_VALIDITY,
+    ErdCode.WH_SOFTENER_ERROR_CODE,
+    ErdCode.WH_SOFTENER_SHUTOFF_VALVE_STATE,
+    ErdCode.WH_HEATER_SHUTOFF_WATER_VALVE_STATE,
+    ErdCode.UPPER_OVEN_CURRENT_STATE,
+    ErdCode.LOWER_OVEN_CURRENT_STATE,
+    ErdCode.LAUNDRY_DRYER_BLOCKED_VENT_FAULT,
+)
+
+UpdateHandler = Callable[[Tuple[GeAppliance, Dict[ErdCodeType, Any]], Optional[float]], Awaitable[None]]
+
+def _raw_code(code: ErdCodeType) -> str:
+    return str(getattr(code, "value", code)).lower()
+
+class _PendingUpdate:
+    """The ERD values received for an appliance that haven't been processed yet"""
+
+    __slots__ = ("appliance", "updates", "received")
+
+    def __init__(self, appliance: GeAppliance, updates: Dict[ErdCodeType, Any], received: Optional[float]):
+        self.appliance = appliance
+        self.updates = dict(updates)
+        self.received = received
+
+class UpdateIngestQueue:
+    """
+    Hands appliance updates to the coordinator one at a time, from a single worker.
+
+    Updates wait in at most one entry per appliance, holding the latest value of each
+    ERD, so the queue is bounded by the fleet rather than by the message rate.  While
+    the worker keeps up, each update is processed on its own; when it falls behind
+    (a resync flood, say), further updates for a waiting appliance are merged into its
+    entry and the values they replace are shed.  Updates that change the value of an
+    urgent ERD skip the queue, along with anything already waiting for their appliance.
+    """
+
+    def __init__(
+        self,
+        hass: Any,
+        handler: UpdateHandler,
+        metrics: CoordinatorMetrics,
+        urgent_erds: Iterable[ErdCodeType] = URGENT_ERDS
+    ):
+        self._hass = hass
+        self._handler = handler
+        self._metrics = metrics
+        self._urgent: FrozenSet[str] = frozenset(_raw_code(code) for code in urgent_erds)
+        self._pending: "OrderedDict[str, _PendingUpdate]" = OrderedDict()
+        self._urgent_values: Dict[Tuple[str, str], Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._max_depth = 0
+        self._last_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of appliances with updates waiting"""
+        return len(self._pending)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_depth": self._max_depth,
+            "waiting_erds": sum(len(p.updates) for p in self._pending.values()),
+            "last_wait_ms": round(self._last_wait * 1000, 1),
+            "coalesced": self._metrics.updates_coalesced,
+            "shed": self._metrics.erd_values_shed,
+            "bypassed": self._metrics.updates_bypassed,
+        }
+
+    async def async_put(self, appliance: GeAppliance, updates: Dict[ErdCodeType, Any], received: Optional[float] = None) -> None:
+        """Queue an update as the client delivered it (received is when it arrived)."""
+        mac_addr = appliance.mac_addr
+        if self._has_urgent_change(mac_addr, updates):
+            self._metrics.updates_bypassed += 1
+            pending = self._pending.pop(mac_addr, None)
+            if pending is not None:
+                pending.updates.update(updates)
+                updates, received = pending.updates, pending.received
+            await self._handler((appliance, updates), received)
+            return
+
+        pending = self._pending.get(mac_addr)
+        if pending is None:
+            self._pending[mac_addr] = _PendingUpdate(appliance, updates, received)
+            if len(self._pending) > self._max_depth:
+                self._max_depth = len(self._pending)
+            self._ensure_worker()
+            return
+
+        # the worker is behind, only the latest value of each ERD is worth rendering
+        self._metrics.updates_coalesced += 1
+        self._metrics.erd_values_shed += sum(1 for code in updates if code in pending.updates)
+        pending.appliance = appliance
+        pending.updates.update(updates)
+
+    async def async_stop(self) -> None:
+        """Stop the worker and drop anything still waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._pending.clear()
+        self._urgent_values.clear()
+
+    def _has_urgent_change(self, mac_addr: str, updates: Dict[ErdCodeType, Any]) -> bool:
+        """Whether the update changes an urgent ERD (full state resends mostly don't)."""
+        changed = False
+        for code, value in updates.items():
+            raw = _raw_code(code)
+            if raw in self._urgent and self._urgent_values.get((mac_addr, raw)) != value:
+                self._urgent_values[(mac_addr, raw)] = value
+                changed = True
+        return changed
+
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = self._hass.loop.create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        try:
+            while self._pending:
+                # a round takes what was waiting when it started, anything arriving
+                # meanwhile waits for the next round (and can be merged)
+                for _ in range(len(self._pending)):
+                    if not self._pending:
+                        break
+                    _, pending = self._pending.popitem(last=False)
+                    if pending.received is not None:
+                        self._last_wait = time.monotonic() - pending.received
+                    try:
+                        await self._handler((pending.appliance, pending.updates), pending.received)
+                    except Exception:
+                        _LOGGER.exception("Error processing update for %s", pending.appliance.mac_addr)
+                # let the client deliver what's arrived meanwhile
+                await asyncio.sleep(0)
+        finally:
+            self._task = None
@@ -0,0 +1,117 @@
+"""Deduplication of log messages that would otherwise repeat on every state write"""
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .const import LOG_DEDUP_INTERVAL, LOG_DEDUP_MAX_KEYS
+
+LogArgs = Callable[[], Tuple[Any, ...]]
+
+_INSTANCES: "weakref.WeakSet[DedupLogger]" = weakref.WeakSet()
+
+def flush_dedup_loggers() -> None:
+    """Log the pending suppression counts of every DedupLogger (on shutdown)."""
+    for dedup in list(_INSTANCES):
+        dedup.flush()
+
+class _SeenMessage:
+    """When a message was last logged, and what's been suppressed since"""
+
+    __slots__ = ("level", "logged", "suppressed", "first_suppressed", "args", "handle")
+
+    def __init__(self, level: int, logged: float):
+        self.level = level
+        self.logged = logged
+        self.suppressed = 0
+        self.first_suppressed = 0.0
+        self.args: Optional[LogArgs] = None
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+class DedupLogger:
+    """
+    Logs a message the first time it's seen for a key (usually the entity), then at
+    most once per interval: repeats within the interval are counted, and the count is
+    logged with the latest repeat when the interval ends.  Messages are identified by
+    the key and the message template, not the arguments.
+
+    The arguments are passed as a callable returning them, so they're only evaluated
+    for messages that actually get logged.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = LOG_DEDUP_INTERVAL):
+        self._logger = logger
+        self._interval = interval
+        self._seen: Dict[Tuple[Hashable, str], _SeenMessage] = {}
+        _INSTANCES.add(self)
+
+    def debug(self, key: Hashable, msg: str, args: Optional[LogArgs] = None) -> None:
+        self.log(logging.DEBUG, key, msg, args)
+
+    def info(self, key: Hashable, msg: str, args: Optional[LogArgs] = None) -> None:
+        self.log(logging.INFO, key, msg, args)
+
+    def warning(self, key: Hashable, msg: str, args: Optional[LogArgs] = None) -> None:
+        self.log(logging.WARNING, key, msg, args)
+
+    def log(self, level: int, key: Hashable, msg: str, args: Optional[LogArgs] = None) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+
+        now = time.monotonic()
+        seen = self._seen.get((key, msg))
+        if seen is None:
+            if len(self._seen) >= LOG_DEDUP_MAX_KEYS:
+                self.flush()
+                self._seen.clear()
+            self._seen[(key, msg)] = _SeenMessage(level, now)
+            self._emit(level, msg, args)
+            return
+
+        if now - seen.logged < self._interval:
+            # suppressed, so the arguments aren't even evaluated
+            if not seen.suppressed:
+                seen.first_suppressed = now
+                seen.handle = _call_later(seen.logged + self._interval - now, self._flush_message, key, msg)
+            seen.suppressed += 1
+            seen.level, seen.args = level, args
+            return
+
+        if seen.suppressed:
+            # the flush timer couldn't run (no event loop), report the count now
+            self._flush_message(key, msg)
+        seen.logged = now
+        self._emit(level, msg, args)
+
+    def flush(self) -> None:
+        """Log the suppression counts that are still pending."""
+        for key, msg in [k for k, seen in self._seen.items() if seen.suppressed]:
+            self._flush_message(key, msg)
+
+    def _flush_message(self, key: Hashable, msg: str) -> None:
+        seen = self._seen.get((key, msg))
+        if seen is None or not seen.suppressed:
+            return
+        if seen.handle is not None:
+            seen.handle.cancel()
+            seen.handle = None
+
+        now = time.monotonic()
+        suppressed, elapsed = seen.suppressed, now - seen.first_suppressed
+        seen.logged, seen.suppressed = now, 0
+        if self._logger.isEnabledFor(seen.level):
+            args = seen.args() if seen.args is not None else ()
+            self._logger.log(seen.level, msg + " (suppressed %d times in the last %.1fs)", *args, suppressed, elapsed)
+        seen.args = None
+
+    def _emit(self, level: int, msg: str, args: Optional[LogArgs]) -> None:
+        self._logger.log(level, msg, *(args() if args is not None else ()))
+
+def _call_later(delay: float, callback: Callable[..., None], *args: Any) -> Optional[asyncio.TimerHandle]:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return loop.call_later(delay, callback, *args)
@@ -0,0 +1,335 @@
+"""Lightweight, fixed-size performance metrics for GE Home"""
+
+import hashlib
+import secrets
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+class LatencyHistogram:
+    """Histogram of latencies over fixed buckets (in milliseconds)"""
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self._bounds = tuple(buckets_ms)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._timeouts = 0
+        self._failures = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def timeouts(self) -> int:
+        return self._timeouts
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        self._counts[bisect_left(self._bounds, ms)] += 1
+        self._count += 1
+        self._total_ms += ms
+        if ms > self._max_ms:
+            self._max_ms = ms
+
+    def record_timeout(self) -> None:
+        self._timeouts += 1
+
+    def record_failure(self) -> None:
+        self._failures += 1
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (upper bound of the bucket it falls in)."""
+        if self._count == 0:
+            return 0.0
+
+        rank = pct / 100.0 * self._count
+        seen = 0
+        for idx, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return float(self._bounds[idx]) if idx < len(self._bounds) else self._max_ms
+        return self._max_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"<={b}ms" for b in self._bounds] + [f">{self._bounds[-1]}ms"]
+        return {
+            "count": self._count,
+            "timeouts": self._timeouts,
+            "failures": self._failures,
+            "mean_ms": round(self._total_ms / self._count, 1) if self._count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self._max_ms, 1),
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+class RateCounter:
+    """Events per second over a rolling window, kept in one bucket per second"""
+
+    def __init__(self, window: int = 60):
+        self._window = window
+        self._buckets = [0] * window
+        self._last_sec = int(time.monotonic())
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def rate(self) -> float:
+        self._advance(int(time.monotonic()))
+        return sum(self._buckets) / self._window
+
+    def increment(self, count: int = 1) -> None:
+        sec = int(time.monotonic())
+        self._advance(sec)
+        self._buckets[sec % self._window] += count
+        self._total += count
+
+    def _advance(self, sec: int) -> None:
+        # clear the buckets for any seconds that passed without events
+        for s in range(max(self._last_sec + 1, sec - self._window + 1), sec + 1):
+            self._buckets[s % self._window] = 0
+        if sec > self._last_sec:
+            self._last_sec = sec
+
+class RollingSamples:
+    """The most recent samples of a value in a ring buffer, for rolling percentiles"""
+
+    def __init__(self, size: int = 256):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def record(self, value: float) -> None:
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))]
+
+class CoordinatorMetrics:
+    """Counters for the coordinator's hot path (all fixed size)"""
+
+    def __init__(self):
+        self.messages = RateCounter()
+        self.state_writes = RateCounter()
+        self.update_latency = RollingSamples()
+        self.writes_skipped = 0
+        self.polls_sent = 0
+        self.polls_failed = 0
+        self.reconnects = 0
+        self.backoff = 0.0
+        self.callback_violations = 0
+        self.updates_coalesced = 0
+        self.erd_values_shed = 0
+        self.updates_bypassed = 0
+
+    def get(self, key: str) -> Any:
+        """Current value of a metric by key (see as_dict), computing only that one."""
+        return _COORDINATOR_METRICS[key](self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getter(self) for key, getter in _COORDINATOR_METRICS.items()}
+
+    def _latency_ms(self, pct: float) -> Optional[float]:
+        value = self.update_latency.percentile(pct)
+        return round(value * 1000, 1) if value is not None else None
+
+_COORDINATOR_METRICS: Dict[str, Callable[[CoordinatorMetrics], Any]] = {
+    "messages_per_second": lambda m: round(m.messages.rate, 2),
+    "messages_total": lambda m: m.messages.total,
+    "state_writes_per_second": lambda m: round(m.state_writes.rate, 2),
+    "state_writes_total": lambda m: m.state_writes.total,
+    "writes_skipped": lambda m: m.writes_skipped,
+    "polls_sent": lambda m: m.polls_sent,
+    "polls_failed": lambda m: m.polls_failed,
+    "reconnects": lambda m: m.reconnects,
+    "backoff": lambda m: round(m.backoff, 1),
+    "callback_violations": lambda m: m.callback_violations,
+    "updates_coalesced": lambda m: m.updates_coalesced,
+    "erd_values_shed": lambda m: m.erd_values_shed,
+    "updates_bypassed": lambda m: m.updates_bypassed,
+    "update_latency_p50_ms": lambda m: m._latency_ms(50),
+    "update_latency_p95_ms": lambda m: m._latency_ms(95),
+}
+
+class TopK:
+    """
+    Accumulated time per key, keeping at most capacity keys (the space-saving
+    algorithm).  When full, a new key takes the place of the one with the least
+    accumulated time and inherits that time as its possible error, so keys that
+    keep coming back can still climb the ranking.  A key's total is an upper bound
+    on its real total, and total minus error is a lower bound.  With no capacity,
+    every key is kept and the totals are exact.
+    """
+
+    def __init__(self, capacity: Optional[int] = 50):
+        self._capacity = capacity
+        # key -> [count, total, max, error]
+        self._stats: Dict[str, List[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        stats = self._stats.get(key)
+        if stats is None:
+            error = 0.0
+            if self._capacity is not None and len(self._stats) >= self._capacity:
+                evicted = min(self._stats, key=lambda k: self._stats[k][1])
+                error = self._stats.pop(evicted)[1]
+            self._stats[key] = [1, error + seconds, seconds, error]
+            return
+        stats[0] += 1
+        stats[1] += seconds
+        if seconds > stats[2]:
+            stats[2] = seconds
+
+    def clear(self) -> None:
+        self._stats.clear()
+
+    def top(self, count: int = 10) -> List[Dict[str, Any]]:
+        ranked = sorted(self._stats.items(), key=lambda i: i[1][1], reverse=True)[:count]
+        return [
+            {
+                "key": key,
+                "count": stats[0],
+                "total_ms": round(stats[1] * 1000, 2),
+                "error_ms": round(stats[3] * 1000, 2),
+                # the mean of the renders seen since the key was (last) added
+                "mean_ms": round((stats[1] - stats[3]) / stats[0] * 1000, 3),
+                "max_ms": round(stats[2] * 1000, 3),
+            }
+            for key, stats in ranked
+        ]
+
+class RenderCosts:
+    """
+    Opt-in accounting of the time spent rendering entity state (HA collecting the
+    entity's properties and writing the state), by entity, entity class and ERD.
+    """
+
+    def __init__(self, capacity: int = 50):
+        self.enabled = False
+        self._salt = secrets.token_hex(8)
+        # one entry per entity at most, so every entity is kept and ranked exactly
+        self.by_entity = TopK(None)
+        self.by_class = TopK(capacity)
+        self.by_erd = TopK(capacity)
+
+    def record(self, entity: Any, seconds: float) -> None:
+        self.by_entity.record(entity.entity_id, seconds)
+        self.by_class.record(type(entity).__name__, seconds)
+        erd_code = getattr(entity, "erd_code", None)
+        if erd_code is not None:
+            self.by_erd.record(getattr(erd_code, "name", str(erd_code)), seconds)
+
+    def _pseudonym(self, entity_id: str) -> str:
+        domain = entity_id.partition(".")[0]
+        digest = hashlib.sha256((self._salt + entity_id).encode()).hexdigest()
+        return f"{domain}.entity_{digest[:10]}"
+
+    def clear(self) -> None:
+        self.by_entity.clear()
+        self.by_class.clear()
+        self.by_erd.clear()
+
+    def as_dict(self, count: int = 10, redact: bool = False) -> Dict[str, Any]:
+        """
+        The top entries of each breakdown.  Entity ids contain the appliance's serial
+        number or MAC address, so redact replaces them with pseudonyms (stable for as
+        long as HA runs) for output that may be shared.
+        """
+        by_entity = self.by_entity.top(count)
+        if redact:
+            for entry in by_entity:
+                entry["key"] = self._pseudonym(entry["key"])
+        return {
+            "enabled": self.enabled,
+            "by_entity": by_entity,
+            "by_class": self.by_class.top(count),
+            "by_erd": self.by_erd.top(count),
+        }
+
+STARTUP_PHASES = (
+    "platforms",
+    "credentials",
+    "connected",
+    "roster",
+    "first_initial_update",
+    "all_initial_updates",
+    "ready_dispatched",
+    "entities_added",
+)
+
+class StartupTimer:
+    """
+    When each phase of the startup critical path (see STARTUP_PHASES) first finished,
+    relative to the start of setup.  Entity adds keep moving the last phase until the
+    coordinator calls finish, once they've settled.
+    """
+
+    def __init__(self):
+        self._started = time.monotonic()
+        self._marks: Dict[str, float] = {}
+        self._entities = 0
+        self._complete = False
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    @property
+    def entities(self) -> int:
+        return self._entities
+
+    def start(self) -> None:
+        self._started = time.monotonic()
+        self._marks.clear()
+        self._entities = 0
+        self._complete = False
+
+    def mark(self, phase: str) -> None:
+        if phase not in self._marks and not self._complete:
+            self._marks[phase] = time.monotonic() - self._started
+
+    def entity_added(self) -> None:
+        if not self._complete:
+            self._entities += 1
+            self._marks["entities_added"] = time.monotonic() - self._started
+
+    def finish(self) -> None:
+        self._complete = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        # each phase takes from the end of the ones before it, or no time if it overlapped them
+        # (the client's events are handled concurrently, and entities are mostly added while
+        # the ready signal is dispatched)
+        phases: Dict[str, Optional[float]] = {}
+        previous = 0.0
+        for phase in STARTUP_PHASES:
+            at = self._marks.get(phase)
+            if at is None:
+                phases[phase] = None
+                continue
+            phases[phase] = round(max(at - previous, 0.0), 3)
+            previous = max(at, previous)
+        return {
+            "complete": self._complete,
+            "total_s": round(max(self._marks.values(), default=0.0), 3),
+            "entities": self._entities,
+            "phases_s": phases,
+        }
@@ -0,0 +1,133 @@
+"""On-demand profiling of the integration's own code paths"""
+
+import asyncio
+import cProfile
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Coroutine, Optional, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T", bound=Callable[..., Any])
+
+class IntegrationProfiler:
+    """
+    Deterministic (cProfile) profiler that only runs inside functions marked with
+    @profiled, so the results show GE Home's share of the event loop rather than
+    everything else HA was doing.  There's only one per process, since only one
+    profiler can be active at a time.
+    """
+
+    def __init__(self):
+        self._profile: Optional[cProfile.Profile] = None
+        self._depth = 0
+        self._started = 0.0
+        self._stop_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def start(self, hass: HomeAssistant, duration: float) -> None:
+        """Start profiling, stopping automatically (and saving the results) after the duration."""
+        if self.active:
+            raise HomeAssistantError("GE Home profiling is already running")
+
+        self._profile = cProfile.Profile()
+        self._started = time.monotonic()
+        self._stop_handle = hass.loop.call_later(
+            duration, lambda: hass.async_create_task(self.async_stop(hass))
+        )
+        _LOGGER.info("Started profiling GE Home for up to %.0fs", duration)
+
+    async def async_stop(self, hass: HomeAssistant) -> Optional[str]:
+        """Stop profiling and write the stats to the config directory, returning the file name."""
+        profile = self._profile
+        if profile is None:
+            return None
+
+        self._profile = None
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        path = hass.config.path(f"ge_home_profile_{int(time.time())}.pstats")
+        await hass.async_add_executor_job(profile.dump_stats, path)
+        _LOGGER.info("Stopped profiling GE Home after %.0fs, results saved to %s", time.monotonic() - self._started, path)
+        return path
+
+    @contextmanager
+    def section(self):
+        """Profile the code run within this block (nesting is fine)."""
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+
+        self._depth += 1
+        if self._depth == 1:
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiler (e.g. HA's own) is already running
+                pass
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                profile.disable()
+
+class SteppedCoroutine:
+    """
+    Drives a coroutine one step (the code run between two awaits) at a time, with
+    each step run inside step_context(), so the time spent suspended is left out.
+    Used by @profiled, and by the watchdog's @watched.
+    """
+
+    def __init__(self, coro: Coroutine, step_context: Callable[[], ContextManager[Any]]):
+        self._coro = coro
+        self._step_context = step_context
+
+    def __await__(self):
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            with self._step_context():
+                try:
+                    if error is not None:
+                        future = self._coro.throw(error)
+                    else:
+                        future = self._coro.send(value)
+                except StopIteration as stop:
+                    return stop.value
+            try:
+                value, error = (yield future), None
+            except BaseException as err:
+                value, error = None, err
+
+PROFILER = IntegrationProfiler()
+
+def profiled(func: _T) -> _T:
+    """Include a function (sync or async) in the integration's profiles."""
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not PROFILER.active:
+                return await func(*args, **kwargs)
+            # profile the coroutine's steps, not the time it spends suspended
+            return await SteppedCoroutine(func(*args, **kwargs), PROFILER.section)
+        return async_wrapper # type: ignore
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not PROFILER.active:
+            return func(*args, **kwargs)
+        with PROFILER.section():
+            return func(*args, **kwargs)
+    return wrapper # type: ignore
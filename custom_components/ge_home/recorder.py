@@ -0,0 +1,160 @@
+"""Recording of the client event stream the coordinator receives, for replaying in benchmarks"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from gehomesdk import (
+    EVENT_APPLIANCE_UPDATE_RECEIVED,
+    EVENT_CONNECTED,
+    EVENT_DISCONNECTED,
+    EVENT_GOT_APPLIANCE_LIST,
+    ErdCode,
+    ErdCodeType,
+    GeAppliance,
+    GeBaseClient,
+)
+
+from .const import RECORDING_MAX_EVENTS, RECORDING_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_ROSTER = "roster"
+RECORD_UPDATE = "update"
+RECORD_CONNECTED = "connected"
+RECORD_DISCONNECTED = "disconnected"
+
+class TrafficRecorder:
+    """
+    Records what the client tells the coordinator (the roster, raw ERD updates, connects
+    and disconnects) with its timing, to a gzipped JSON lines file in the config directory.
+    MAC addresses and serial numbers are swapped for pseudonyms as they're recorded.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._events: Optional[List[list]] = None
+        self._started = 0.0
+        self._salt = ""
+        self._pseudonyms: Dict[str, str] = {}
+        self._stop_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def active(self) -> bool:
+        return self._events is not None
+
+    def start(self, duration: float, client: Optional[GeBaseClient] = None) -> None:
+        """Start recording, stopping automatically (and saving) after the duration."""
+        if self.active:
+            raise HomeAssistantError("GE Home is already recording")
+
+        self._events = []
+        self._started = time.monotonic()
+        self._salt = secrets.token_hex(8)
+        self._pseudonyms.clear()
+        self._stop_handle = self._hass.loop.call_later(
+            duration, lambda: self._hass.async_create_task(self.async_stop())
+        )
+        if client is not None:
+            self._record_snapshot(client)
+            self.attach(client)
+        _LOGGER.info("Started recording GE Home traffic for up to %.0fs", duration)
+
+    def attach(self, client: GeBaseClient) -> None:
+        """Listen to a client's events (the coordinator calls this for every client it creates)."""
+        if not self.active:
+            return
+        client.add_event_handler(EVENT_GOT_APPLIANCE_LIST, self._on_appliance_list)
+        client.add_event_handler(EVENT_APPLIANCE_UPDATE_RECEIVED, self._on_update)
+        client.add_event_handler(EVENT_CONNECTED, self._on_connected)
+        client.add_event_handler(EVENT_DISCONNECTED, self._on_disconnected)
+
+    async def async_stop(self) -> Optional[str]:
+        """Stop recording and write it to the config directory, returning the file name."""
+        events = self._events
+        if events is None:
+            return None
+
+        self._events = None
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        header = {
+            "version": RECORDING_VERSION,
+            "recorded": datetime.now(timezone.utc).isoformat(),
+            "duration": round(time.monotonic() - self._started, 3),
+            "events": len(events),
+        }
+        path = self._hass.config.path(f"ge_home_recording_{int(time.time())}.jsonl.gz")
+        await self._hass.async_add_executor_job(_write_recording, path, header, events)
+        _LOGGER.info("Stopped recording GE Home traffic, %d events saved to %s", len(events), path)
+        return path
+
+    def _record(self, kind: str, *payload: Any) -> None:
+        events = self._events
+        if events is None:
+            return
+        events.append([round(time.monotonic() - self._started, 4), kind, *payload])
+        if len(events) == RECORDING_MAX_EVENTS:
+            _LOGGER.warning("GE Home recording reached %d events, stopping", RECORDING_MAX_EVENTS)
+            self._hass.async_create_task(self.async_stop())
+
+    def _record_snapshot(self, client: GeBaseClient) -> None:
+        """Start with the roster and state so far, so a recording started mid-session replays on its own."""
+        appliances = list(client.appliances.values())
+        if not appliances:
+            return
+        self._record(RECORD_ROSTER, [[self._pseudonym(a.mac_addr), a.available] for a in appliances])
+        for appliance in appliances:
+            raw = {code: appliance.get_raw_erd_value(code) for code in appliance.known_properties}
+            self._record_update(appliance, {code: value for code, value in raw.items() if value is not None})
+
+    def _pseudonym(self, mac_addr: str) -> str:
+        pseudonym = self._pseudonyms.get(mac_addr)
+        if pseudonym is None:
+            digest = hashlib.sha256((self._salt + mac_addr).encode()).hexdigest()
+            pseudonym = self._pseudonyms[mac_addr] = "F0" + digest[:10].upper()
+        return pseudonym
+
+    async def _on_appliance_list(self, items: List[Dict[str, Any]]) -> None:
+        self._record(RECORD_ROSTER, [
+            [self._pseudonym(item["applianceId"].upper()), item.get("online", "").upper() == "ONLINE"]
+            for item in items
+        ])
+
+    async def _on_update(self, data: Tuple[GeAppliance, Dict[ErdCodeType, Any]]) -> None:
+        self._record_update(*data)
+
+    def _record_update(self, appliance: GeAppliance, updates: Dict[ErdCodeType, Any]) -> None:
+        pseudonym = self._pseudonym(appliance.mac_addr)
+        erds = {}
+        for code, value in updates.items():
+            code = str(getattr(code, "value", code)).lower()
+            if code == ErdCode.SERIAL_NUMBER.value and isinstance(value, str):
+                value = ("0" + pseudonym).encode().hex().ljust(len(value), "0")
+            erds[code] = value
+        self._record(RECORD_UPDATE, pseudonym, erds)
+
+    async def _on_connected(self, _) -> None:
+        self._record(RECORD_CONNECTED)
+
+    async def _on_disconnected(self, _) -> None:
+        self._record(RECORD_DISCONNECTED)
+
+def _write_recording(path: str, header: Dict[str, Any], events: List[list]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps(header))
+        f.write("\n")
+        for event in events:
+            f.write(json.dumps(event, separators=(",", ":")))
+            f.write("\n")
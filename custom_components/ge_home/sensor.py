@@ -10,19 +10,23 @@
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers import entity_registry as er
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN, 
     SERVICE_SET_TIMER, 
     SERVICE_CLEAR_TIMER, 
-    SERVICE_SET_INT_VALUE
+    SERVICE_SET_INT_VALUE,
+    COMMAND_CONFIRM_TIMEOUT
 )
-from .entities import GeErdSensor
+from .entities import GeErdSensor, GeHubMetricSensor, HUB_METRIC_SENSORS
 from .devices import ApplianceApi
 from .update_coordinator import GeHomeUpdateCoordinator
 
 ATTR_DURATION = "duration"
 ATTR_VALUE = "value"
+ATTR_WAIT_FOR_CONFIRMATION = "wait_for_confirmation"
+ATTR_TIMEOUT = "timeout"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +39,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     # Get the platform
     platform = entity_platform.async_get_current_platform()
 
+    # the coordinator's own metrics live on the account hub device
+    async_add_entities([GeHubMetricSensor(coordinator, metric) for metric in HUB_METRIC_SENSORS])
+
     @callback
     def async_devices_discovered(apis: Collection[ApplianceApi]):
         _LOGGER.debug(f'Found {len(apis):d} appliance APIs')
@@ -77,6 +84,10 @@ def async_devices_discovered(apis: Collection[ApplianceApi]):
     {
         vol.Required(ATTR_VALUE): vol.All(
             vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_WAIT_FOR_CONFIRMATION, default=False): cv.boolean,
+        vol.Optional(ATTR_TIMEOUT, default=COMMAND_CONFIRM_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=120)
         )
     },
     set_int_value)    
@@ -86,4 +97,8 @@ async def set_timer(entity, service_call):
     await entity.set_timer(ts)
 
 async def set_int_value(entity, service_call):
-    await entity.set_value(int(service_call.data['value']))
\ No newline at end of file
+    value = int(service_call.data[ATTR_VALUE])
+    if service_call.data[ATTR_WAIT_FOR_CONFIRMATION]:
+        await entity.set_value_and_confirm(value, service_call.data[ATTR_TIMEOUT])
+    else:
+        await entity.set_value(value)
\ No newline at end of file
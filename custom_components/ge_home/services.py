@@ -0,0 +1,169 @@
+"""Integration-wide (non-entity) services for GE Home"""
+
+import logging
+import time
+import voluptuous as vol
+from typing import List
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SERVICE_START_PROFILING,
+    SERVICE_STOP_PROFILING,
+    SERVICE_SET_RENDER_TIMING,
+    SERVICE_GET_RENDER_COSTS,
+    SERVICE_SET_ERD_TRACE,
+    SERVICE_DUMP_APPLIANCE,
+    SERVICE_EXPORT_CAPTURE,
+    SERVICE_START_RECORDING,
+    SERVICE_STOP_RECORDING,
+    PROFILING_DEFAULT_DURATION,
+    PROFILING_MAX_DURATION,
+    RECORDING_DEFAULT_DURATION,
+    RECORDING_MAX_DURATION
+)
+from .erd_trace import dump_appliance
+from .profiling import PROFILER
+
+ATTR_DURATION = "duration"
+ATTR_ENABLED = "enabled"
+ATTR_RESET = "reset"
+ATTR_COUNT = "count"
+ATTR_APPLIANCES = "appliances"
+ATTR_ERD_CODES = "erd_codes"
+ATTR_MAC_ADDR = "mac_addr"
+
+_LOGGER = logging.getLogger(__name__)
+
+START_PROFILING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DURATION, default=PROFILING_DEFAULT_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=PROFILING_MAX_DURATION)
+    )
+})
+
+SET_RENDER_TIMING_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENABLED): cv.boolean,
+    vol.Optional(ATTR_RESET, default=False): cv.boolean,
+})
+
+GET_RENDER_COSTS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_COUNT, default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=50))
+})
+
+SET_ERD_TRACE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_APPLIANCES, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_ERD_CODES, default=[]): vol.All(cv.ensure_list, [cv.string]),
+})
+
+DUMP_APPLIANCE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_MAC_ADDR): cv.string,
+})
+
+EXPORT_CAPTURE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_MAC_ADDR): cv.string,
+})
+
+START_RECORDING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DURATION, default=RECORDING_DEFAULT_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=RECORDING_MAX_DURATION)
+    )
+})
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services (once, regardless of the number of accounts)."""
+
+    async def start_profiling(call: ServiceCall) -> None:
+        PROFILER.start(hass, call.data[ATTR_DURATION])
+
+    async def stop_profiling(call: ServiceCall) -> ServiceResponse:
+        path = await PROFILER.async_stop(hass)
+        return {"path": path}
+
+    hass.services.async_register(DOMAIN, SERVICE_START_PROFILING, start_profiling, schema=START_PROFILING_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PROFILING, stop_profiling, schema=vol.Schema({}),
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def set_render_timing(call: ServiceCall) -> None:
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if call.data[ATTR_RESET]:
+                coordinator.render_costs.clear()
+            coordinator.render_costs.enabled = call.data[ATTR_ENABLED]
+
+    async def get_render_costs(call: ServiceCall) -> ServiceResponse:
+        return {
+            entry_id: coordinator.render_costs.as_dict(call.data[ATTR_COUNT])
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        }
+
+    hass.services.async_register(DOMAIN, SERVICE_SET_RENDER_TIMING, set_render_timing, schema=SET_RENDER_TIMING_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_RENDER_COSTS, get_render_costs, schema=GET_RENDER_COSTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY
+    )
+
+    async def set_erd_trace(call: ServiceCall) -> None:
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            coordinator.erd_tracer.set_filter(call.data[ATTR_APPLIANCES], call.data[ATTR_ERD_CODES])
+
+    async def dump_appliances(call: ServiceCall) -> ServiceResponse:
+        mac_addr = call.data.get(ATTR_MAC_ADDR)
+        dumps = {
+            appliance.mac_addr: dump_appliance(appliance)
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            for appliance in coordinator.appliances
+            if mac_addr is None or appliance.mac_addr.upper() == mac_addr.upper()
+        }
+        for mac, dump in dumps.items():
+            _LOGGER.info("Dump for appliance %s: %s", mac, dump)
+        return dumps
+
+    hass.services.async_register(DOMAIN, SERVICE_SET_ERD_TRACE, set_erd_trace, schema=SET_ERD_TRACE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_DUMP_APPLIANCE, dump_appliances, schema=DUMP_APPLIANCE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def export_capture(call: ServiceCall) -> ServiceResponse:
+        mac_addr = call.data.get(ATTR_MAC_ADDR)
+        timestamp = int(time.time())
+        paths = {}
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            for api in coordinator.appliance_apis.values():
+                if mac_addr is not None and api.mac_addr.upper() != mac_addr.upper():
+                    continue
+                path = hass.config.path(f"ge_home_capture_{api.mac_addr.replace(':', '')}_{timestamp}.jsonl")
+                await hass.async_add_executor_job(_write_lines, path, api.capture.to_jsonl())
+                paths[api.mac_addr] = path
+                _LOGGER.info("Exported %d captured messages for %s to %s", len(api.capture), api.mac_addr, path)
+        return paths
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT_CAPTURE, export_capture, schema=EXPORT_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+    async def start_recording(call: ServiceCall) -> None:
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            coordinator.start_recording(call.data[ATTR_DURATION])
+
+    async def stop_recording(call: ServiceCall) -> ServiceResponse:
+        return {
+            entry_id: await coordinator.recorder.async_stop()
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        }
+
+    hass.services.async_register(DOMAIN, SERVICE_START_RECORDING, start_recording, schema=START_RECORDING_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_RECORDING, stop_recording, schema=vol.Schema({}),
+        supports_response=SupportsResponse.OPTIONAL
+    )
+
+def _write_lines(path: str, lines: List[str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
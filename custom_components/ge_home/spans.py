@@ -0,0 +1,132 @@
+"""Sampled tracing spans for the update pipeline, exported in Chrome trace-event format"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import TRACE_FILE_NAME, TRACE_FILE_MAX_BYTES, TRACE_FLUSH_EVENTS, TRACE_FLUSH_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+class Trace:
+    """One sampled pass through the pipeline; spans are recorded as complete ("X") events"""
+
+    def __init__(self, tracer: "SpanTracer", name: str, tid: int, start: float, args: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._tid = tid
+        self._start = start
+        self._args = args
+
+    @contextmanager
+    def span(self, name: str, **args: Any):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._tracer.add_event(name, self._tid, start, time.monotonic(), args)
+
+    def record(self, name: str, start: float, end: float, **args: Any) -> None:
+        """Add a span that was timed elsewhere (with time.monotonic)."""
+        self._tracer.add_event(name, self._tid, start, end, args)
+
+    def finish(self) -> None:
+        self._tracer.add_event(self._name, self._tid, self._start, time.monotonic(), self._args)
+
+class _NullTrace:
+    """Stands in for a trace that wasn't sampled"""
+
+    def span(self, name: str, **args: Any):
+        return nullcontext()
+
+    def record(self, name: str, start: float, end: float, **args: Any) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+NULL_TRACE = _NullTrace()
+
+class SpanTracer:
+    """
+    Samples a fraction of pipeline passes and writes their spans to a rotating file
+    in the config directory, in Chrome trace-event format (open it in Perfetto or
+    chrome://tracing).  Each appliance gets its own track.
+    """
+
+    def __init__(self, hass: HomeAssistant, sample_rate: float):
+        self._hass = hass
+        self.sample_rate = sample_rate
+        self._events: List[Dict[str, Any]] = []
+        self._tids: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._path = hass.config.path(TRACE_FILE_NAME)
+        # writes (and rotation) go one at a time, with at most one flush scheduled
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def start(self, name: str, appliance: str, start: Optional[float] = None, **args: Any):
+        """Start a trace (or return NULL_TRACE if this pass isn't sampled)."""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return NULL_TRACE
+
+        tid = self._tids.get(appliance)
+        if tid is None:
+            tid = self._tids[appliance] = len(self._tids) + 1
+        return Trace(self, name, tid, start if start is not None else time.monotonic(), args)
+
+    def add_event(self, name: str, tid: int, start: float, end: float, args: Dict[str, Any]) -> None:
+        self._events.append({
+            "name": name,
+            "ph": "X",
+            "pid": 1,
+            "tid": tid,
+            "ts": round(start * 1_000_000),
+            "dur": round((end - start) * 1_000_000),
+            "args": args,
+        })
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        if len(self._events) >= TRACE_FLUSH_EVENTS or time.monotonic() - self._last_flush > TRACE_FLUSH_INTERVAL:
+            self._flush_task = self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write out the buffered events."""
+        async with self._write_lock:
+            await self._async_write()
+
+    async def _async_write(self) -> None:
+        if not self._events:
+            return
+        events, self._events = self._events, []
+        self._last_flush = time.monotonic()
+
+        # name the tracks in every batch, so they're still named after the file rotates
+        events[:0] = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": appliance}}
+            for appliance, tid in self._tids.items()
+        ]
+        try:
+            await self._hass.async_add_executor_job(_write_events, self._path, events)
+        except OSError as err:
+            _LOGGER.warning("Could not write GE Home trace to %s: %s", self._path, err)
+
+def _write_events(path: str, events: List[Dict[str, Any]]) -> None:
+    # the JSON array format allows the closing bracket to be left off, so events can just be appended
+    if os.path.exists(path) and os.path.getsize(path) > TRACE_FILE_MAX_BYTES:
+        os.replace(path, f"{path}.1")
+
+    new_file = not os.path.exists(path)
+    with open(path, "a", encoding="utf-8") as f:
+        if new_file:
+            f.write("[\n")
+        for event in events:
+            f.write(json.dumps(event, default=str))
+            f.write(",\n")
@@ -0,0 +1,241 @@
+"""Supervised background tasks, one per appliance and job"""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .const import (
+    APPLIANCE_TASK_MAX_BACKOFF,
+    APPLIANCE_TASK_MAX_FAILURES,
+    APPLIANCE_TASK_MAX_RESTARTS,
+    APPLIANCE_TASK_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TASK_RUNNING = "running"
+TASK_BACKING_OFF = "backing_off"
+TASK_FAILED = "failed"
+TASK_STOPPED = "stopped"
+
+class _SupervisedJob:
+    """A periodic job for one appliance, and how it's been doing"""
+
+    __slots__ = (
+        "mac_addr", "name", "step", "on_timeout", "interval", "timeout", "task", "state", "runs", "errors",
+        "timeouts", "consecutive_failures", "restarts", "last_error", "last_success", "last_duration"
+    )
+
+    def __init__(self, mac_addr: str, name: str, step: Callable[[], Awaitable[Any]], interval: float, timeout: float):
+        self.mac_addr = mac_addr
+        self.name = name
+        self.step = step
+        self.on_timeout: Optional[Callable[[], Awaitable[Any]]] = None
+        self.interval = interval
+        self.timeout = timeout
+        self.task: Optional[asyncio.Task] = None
+        self.state = TASK_STOPPED
+        self.runs = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.consecutive_failures = 0
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.last_success: Optional[float] = None
+        self.last_duration: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def as_dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "state": self.state,
+            "interval": self.interval,
+            "runs": self.runs,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "consecutive_failures": self.consecutive_failures,
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+            "last_success_age": round(now - self.last_success, 1) if self.last_success else None,
+            "last_duration_ms": round(self.last_duration * 1000, 1) if self.last_duration is not None else None,
+        }
+
+class ApplianceTaskSupervisor:
+    """
+    Runs each appliance's background jobs in tasks of their own, so one appliance
+    that hangs or keeps failing can't hold up the rest of the fleet.
+
+    Each run of a job is limited to a timeout.  A job that fails or times out backs
+    off (doubling its interval up to a limit) until it succeeds again.  After too many
+    failures in a row its task ends, and is restarted after the longest backoff; once
+    it has been restarted too often without a success, the job is left failed.
+    Stopping keeps the jobs' health, removing an appliance forgets it.
+    """
+
+    def __init__(
+        self,
+        hass: Any,
+        timeout: float = APPLIANCE_TASK_TIMEOUT,
+        max_backoff: float = APPLIANCE_TASK_MAX_BACKOFF,
+        max_failures: int = APPLIANCE_TASK_MAX_FAILURES,
+        max_restarts: int = APPLIANCE_TASK_MAX_RESTARTS
+    ):
+        self._hass = hass
+        self._timeout = timeout
+        self._max_backoff = max_backoff
+        self._max_failures = max_failures
+        self._max_restarts = max_restarts
+        self._jobs: Dict[Tuple[str, str], _SupervisedJob] = {}
+
+    @property
+    def running(self) -> int:
+        """Number of jobs with a live task"""
+        return sum(1 for job in self._jobs.values() if job.running)
+
+    @property
+    def last_success(self) -> Optional[float]:
+        """When any job last completed a run"""
+        return max((job.last_success for job in self._jobs.values() if job.last_success), default=None)
+
+    def health(self, mac_addr: str) -> Dict[str, Dict[str, Any]]:
+        """Health of an appliance's jobs, by job name."""
+        return {name: job.as_dict() for (mac, name), job in self._jobs.items() if mac == mac_addr}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """A summary across appliances (per appliance health is in health)."""
+        states: Dict[str, int] = {}
+        for job in self._jobs.values():
+            states[job.state] = states.get(job.state, 0) + 1
+        return {
+            "jobs": len(self._jobs),
+            "states": states,
+            "errors": sum(job.errors for job in self._jobs.values()),
+            "timeouts": sum(job.timeouts for job in self._jobs.values()),
+            "restarts": sum(job.restarts for job in self._jobs.values()),
+        }
+
+    def start(
+        self,
+        mac_addr: str,
+        name: str,
+        step: Callable[[], Awaitable[Any]],
+        interval: float,
+        on_timeout: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> None:
+        """
+        Run step every interval for the appliance, unless that job is already running.
+        on_timeout is awaited after a run times out, to clean up whatever it was stuck on.
+        """
+        job = self._jobs.get((mac_addr, name))
+        if job is None:
+            job = self._jobs[(mac_addr, name)] = _SupervisedJob(mac_addr, name, step, interval, self._timeout)
+        elif job.running:
+            return
+        job.step = step
+        job.on_timeout = on_timeout
+        job.interval = interval
+        job.consecutive_failures = 0
+        job.restarts = 0
+        self._spawn(job, interval)
+
+    async def async_stop(self, mac_addr: Optional[str] = None) -> None:
+        """Cancel the jobs of one appliance, or of all of them."""
+        jobs = [job for job in self._jobs.values() if mac_addr is None or job.mac_addr == mac_addr]
+        await self._async_cancel(jobs)
+
+    async def async_remove(self, mac_addr: str) -> None:
+        """Cancel an appliance's jobs and forget them."""
+        await self.async_stop(mac_addr)
+        for key in [key for key in self._jobs if key[0] == mac_addr]:
+            del self._jobs[key]
+
+    async def async_clear(self) -> None:
+        await self.async_stop()
+        self._jobs.clear()
+
+    async def _async_cancel(self, jobs: List[_SupervisedJob]) -> None:
+        tasks = []
+        for job in jobs:
+            job.state = TASK_STOPPED
+            if job.task is not None:
+                job.task.cancel()
+                tasks.append(job.task)
+                job.task = None
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def _spawn(self, job: _SupervisedJob, delay: float) -> None:
+        job.state = TASK_RUNNING
+        job.task = self._hass.loop.create_task(self._async_run(job, delay))
+        job.task.add_done_callback(lambda task: self._on_done(job, task))
+
+    def _on_done(self, job: _SupervisedJob, task: asyncio.Task) -> None:
+        if task.cancelled() or task is not job.task:
+            return
+        err = task.exception()
+        if err is None:
+            return
+
+        if job.restarts >= self._max_restarts:
+            job.state = TASK_FAILED
+            job.task = None
+            _LOGGER.warning("Giving up on %s for %s after %d restarts: %s", job.name, job.mac_addr, job.restarts, job.last_error)
+            return
+        job.restarts += 1
+        job.consecutive_failures = 0
+        _LOGGER.debug("Restarting %s for %s (%d): %s", job.name, job.mac_addr, job.restarts, err)
+        self._spawn(job, self._max_backoff)
+        job.state = TASK_BACKING_OFF
+
+    async def _async_run(self, job: _SupervisedJob, delay: float) -> None:
+        while True:
+            await asyncio.sleep(delay)
+            started = time.monotonic()
+            failure: Optional[Exception] = None
+            try:
+                await asyncio.wait_for(job.step(), job.timeout)
+            except asyncio.TimeoutError as err:
+                failure = err
+                job.timeouts += 1
+                job.last_error = f"timed out after {job.timeout}s"
+                _LOGGER.debug("%s for %s timed out", job.name, job.mac_addr)
+                await self._async_on_timeout(job)
+            except Exception as err:
+                failure = err
+                job.errors += 1
+                job.last_error = repr(err)
+                _LOGGER.debug("%s for %s failed: %s", job.name, job.mac_addr, err)
+            else:
+                job.consecutive_failures = 0
+                job.restarts = 0
+                job.last_success = time.monotonic()
+            job.runs += 1
+            job.last_duration = time.monotonic() - started
+
+            if failure is not None:
+                job.consecutive_failures += 1
+                if job.consecutive_failures >= self._max_failures:
+                    # end the task, _on_done decides whether it gets another go
+                    raise failure
+
+            # back off an appliance that keeps failing rather than hammering it
+            if job.consecutive_failures:
+                job.state = TASK_BACKING_OFF
+                delay = min(job.interval * 2 ** min(job.consecutive_failures, 16), self._max_backoff)
+            else:
+                job.state = TASK_RUNNING
+                delay = job.interval
+
+    async def _async_on_timeout(self, job: _SupervisedJob) -> None:
+        if job.on_timeout is None:
+            return
+        try:
+            await asyncio.wait_for(job.on_timeout(), job.timeout)
+        except Exception as err:
+            _LOGGER.debug("Cleaning up after %s for %s timed out failed: %s", job.name, job.mac_addr, err)
@@ -5,7 +5,7 @@
 import random
 import logging
 import time
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, List
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, List
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
@@ -16,6 +16,7 @@
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.util.ssl import get_default_context 
 
 from gehomesdk import (
@@ -32,9 +33,19 @@
 )
 from gehomesdk import GeAuthFailedError, GeGeneralServerError, GeNotAuthenticatedError
 
+from .base_url_client import GeBaseUrlWebsocketClient
 from .const import *
 from .devices import ApplianceApi, get_appliance_api_type
+from .erd_trace import ErdChangeTracer
 from .exceptions import HaAuthError, HaCannotConnect
+from .ingest import UpdateIngestQueue
+from .log_dedup import flush_dedup_loggers
+from .metrics import CoordinatorMetrics, LatencyHistogram, RenderCosts, StartupTimer
+from .profiling import profiled
+from .recorder import TrafficRecorder
+from .spans import NULL_TRACE, SpanTracer
+from .supervisor import ApplianceTaskSupervisor
+from .watchdog import CallbackWatchdog, watched
 
 PLATFORMS = [
     "binary_sensor", 
@@ -59,6 +70,7 @@ def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         super().__init__(hass, _LOGGER, name=DOMAIN)
 
         self._client : GeWebsocketClient | None = None
+        self._client_task: asyncio.Task | None = None
         self._config_entry = config_entry
         self._username = config_entry.data[CONF_USERNAME]
         self._password = config_entry.data[CONF_PASSWORD]
@@ -69,11 +81,29 @@ def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         self._init_done = False
         self._all_initial_updates_received = asyncio.Event()
 
-        self._updater_task: asyncio.Task | None = None
+        self._supervisor = ApplianceTaskSupervisor(hass)
+        self._polling = False
         self._reconnect_task: asyncio.Task | None = None
         self._last_persistent_log: float = 0.0
         self._retry_count: int = 0
         self._last_ha_refresh: float = 0.0
+        self._command_latency: Dict[str, LatencyHistogram] = {}
+        self._metrics = CoordinatorMetrics()
+        self._startup = StartupTimer()
+        self._startup_task: asyncio.Task | None = None
+        self._replay_tasks: Dict[str, asyncio.Task] = {}
+        self._watchdog = CallbackWatchdog(
+            self._metrics,
+            config_entry.options.get(CONF_CALLBACK_BUDGET, DEFAULT_CALLBACK_BUDGET) / 1000.0
+        )
+        self._render_costs = RenderCosts()
+        self._ingest = UpdateIngestQueue(hass, self._on_device_update, self._metrics)
+        self._erd_tracer = ErdChangeTracer()
+        self._recorder = TrafficRecorder(hass)
+        self._span_tracer = SpanTracer(
+            hass,
+            config_entry.options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE)
+        )
 
         self._reset_sync_state()
 
@@ -90,10 +120,77 @@ def appliances(self) -> Iterable[GeAppliance]:
     def appliance_apis(self) -> Dict[str, ApplianceApi]:
         return self._appliance_apis
     
+    @property
+    def command_latency(self) -> Dict[str, LatencyHistogram]:
+        """Time from sending a command to the appliance confirming it, per appliance type"""
+        return self._command_latency
+
+    @property
+    def metrics(self) -> CoordinatorMetrics:
+        return self._metrics
+
+    @property
+    def startup(self) -> StartupTimer:
+        return self._startup
+
+    @property
+    def watchdog(self) -> CallbackWatchdog:
+        return self._watchdog
+
+    @property
+    def erd_tracer(self) -> ErdChangeTracer:
+        return self._erd_tracer
+
+    @property
+    def recorder(self) -> TrafficRecorder:
+        return self._recorder
+
+    @property
+    def ingest(self) -> UpdateIngestQueue:
+        return self._ingest
+
+    @property
+    def render_costs(self) -> RenderCosts:
+        return self._render_costs
+
+    @property
+    def supervisor(self) -> ApplianceTaskSupervisor:
+        return self._supervisor
+
+    @property
+    def polling_schedule(self) -> Dict[str, Any]:
+        last_poll = self._supervisor.last_success
+        return {
+            "interval": STATE_UPDATE_INTERVAL,
+            "running": self._polling,
+            "last_poll_age": round(time.monotonic() - last_poll, 1) if last_poll else None,
+            "appliance_tasks": self._supervisor.as_dict(),
+        }
+
+    @property
+    def hub_id(self) -> str:
+        """Identifier of the per-account device that the coordinator's own entities belong to"""
+        return f"hub_{self._config_entry.entry_id}"
+
+    @property
+    def hub_device_info(self) -> DeviceInfo:
+        return {
+            "identifiers": {(DOMAIN, self.hub_id)},
+            "name": f"GE Home ({self._username})",
+            "manufacturer": "GE Appliances",
+            "model": "SmartHQ Account",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
     @property
     def all_appliances_updated(self) -> bool:
         """True if all appliances have had an initial update."""
-        return all([a.initialized for a in self.appliances])
+        # the client marks an appliance initialized before our initial update handler has run,
+        # which never builds an API for an invalid appliance, so those can't be waited for
+        return all(
+            a.initialized and (a.mac_addr in self._appliance_apis or not self._is_appliance_valid(a))
+            for a in self.appliances
+        )
 
     @property
     def signal_ready(self) -> str:
@@ -133,13 +230,19 @@ def available(self) -> bool:
     def add_signal_remove_callback(self, cb: Callable):
         self._signal_remove_callbacks.append(cb)
 
+    def start_recording(self, duration: float) -> None:
+        """Record the client's event stream (including across reconnects) for replaying later."""
+        self._recorder.start(duration, self._client)
+
     async def async_setup(self):
         """Setup a new coordinator"""
         _LOGGER.debug("Setting up the coordinator")
+        self._startup.start()
 
         await self.hass.config_entries.async_forward_entry_setups(
             self._config_entry, PLATFORMS
         )
+        self._startup.mark("platforms")
 
         try:
             await self._async_start_client()
@@ -159,6 +262,10 @@ async def async_reset(self) -> bool:
 
         # stop the client
         await self._async_stop_client()
+        await self._ingest.async_stop()
+        await self._span_tracer.async_flush()
+        await self._recorder.async_stop()
+        flush_dedup_loggers()
         
         # remove all the callbacks for this coordinator
         for c in self._signal_remove_callbacks:
@@ -166,7 +273,11 @@ async def async_reset(self) -> bool:
         self._signal_remove_callbacks.clear()
         
         # clear the appliances (moved from _reset_sync_state to ensure proper cleanup on unload)
+        for mac_addr, api in self._appliance_apis.items():
+            await self._async_cancel_offline_replay(mac_addr)
+            await api.async_shutdown()
         self._appliance_apis.clear()
+        await self._supervisor.async_clear()
 
         # cancel the notification
         try:
@@ -187,6 +298,7 @@ def shutdown(self, event) -> None:
         Used as an argument to EventBus.async_listen_once.
         """
         _LOGGER.info("ge_home shutting down")
+        flush_dedup_loggers()
 
         #stop the client and existing background tasks
         self.hass.loop.create_task(self._async_stop_client())
@@ -206,18 +318,31 @@ def _create_ge_client(
         :param event_loop: Event loop
         :return: GeWebsocketClient
         """
-        client = GeWebsocketClient(
-            self._username,
-            self._password,
-            self._region,
-            event_loop=event_loop,
-            ssl_context=get_default_context()
-        )
+        base_url = self._config_entry.data.get(CONF_API_BASE_URL)
+        if base_url:
+            _LOGGER.warning("Connecting to %s instead of SmartHQ", base_url)
+            client = GeBaseUrlWebsocketClient(
+                self._username,
+                self._password,
+                self._region,
+                base_url,
+                event_loop=event_loop,
+                ssl_context=get_default_context()
+            )
+        else:
+            client = GeWebsocketClient(
+                self._username,
+                self._password,
+                self._region,
+                event_loop=event_loop,
+                ssl_context=get_default_context()
+            )
         client.add_event_handler(EVENT_APPLIANCE_INITIAL_UPDATE, self._on_device_initial_update)
-        client.add_event_handler(EVENT_APPLIANCE_UPDATE_RECEIVED, self._on_device_update)
+        client.add_event_handler(EVENT_APPLIANCE_UPDATE_RECEIVED, self._on_device_update_received)
         client.add_event_handler(EVENT_GOT_APPLIANCE_LIST, self._on_appliance_list)
         client.add_event_handler(EVENT_DISCONNECTED, self._on_disconnect)
         client.add_event_handler(EVENT_CONNECTED, self._on_connect)
+        self._recorder.attach(client)
         return client
     
     async def _async_start_client(self) -> None:
@@ -233,13 +358,16 @@ async def _async_start_client(self) -> None:
             self._client = self._create_ge_client(event_loop=self.hass.loop)
             session = async_get_clientsession(self.hass)
             await self._client.async_get_credentials(session)
+            self._startup.mark("credentials")
         except Exception as err:
-            _LOGGER.error(f"could not start the client: {err}")
+            _LOGGER.error("could not start the client: %s", err)
             self._client = None
             raise
 
         # Start the client run loop
-        self.hass.loop.create_task(self._client.async_run_client())
+        self._client_task = self._config_entry.async_create_background_task(
+            self.hass, self._client.async_run_client(), "ge_home client"
+        )
         _LOGGER.debug("Scheduled the client for execution.")
 
     async def _async_stop_client(self):
@@ -253,6 +381,16 @@ async def _async_stop_client(self):
             finally:
                 self._client = None
 
+        # the run loop ends once the client has disconnected, make sure it does
+        # rather than leaving it (and the client) behind on every reconnect
+        if self._client_task:
+            if not self._client_task.done():
+                await asyncio.wait({self._client_task}, timeout=CLIENT_STOP_TIMEOUT)
+            if not self._client_task.done():
+                _LOGGER.warning("Client did not stop within %ss, cancelling it", CLIENT_STOP_TIMEOUT)
+                self._client_task.cancel()
+            self._client_task = None
+
         # Reset asynchronous and synchronous states
         await self._async_reset_state()
         self._reset_sync_state()
@@ -315,20 +453,22 @@ async def _reconnect_worker(self) -> None:
                 self._retry_count += 1
                 sleep_time = self._get_retry_delay()
 
-                _LOGGER.info(f"Retrying in {sleep_time:.1f}s (attempt {self._retry_count})")
+                self._metrics.backoff = sleep_time
+                _LOGGER.info("Retrying in %.1fs (attempt %s)", sleep_time, self._retry_count)
                 await asyncio.sleep(sleep_time)
 
                 if self._client and self._client.state != GeClientState.DISCONNECTED:
                     _LOGGER.debug("Client became healthy before retry, exiting")
                     return
 
+                self._metrics.reconnects += 1
                 try:
                     await self._async_start_client()
                 except (GeNotAuthenticatedError, GeAuthFailedError):
                     self._show_persistent_notification("Authentication failure: please re-authenticate the GE Home integration.")
                     return
                 except Exception as err:
-                    _LOGGER.warning(f"Reconnect attempt failed: {err}")
+                    _LOGGER.warning("Reconnect attempt failed: %s", err)
 
                 if self._client and self._client.state != GeClientState.DISCONNECTED:
                     return
@@ -371,32 +511,63 @@ def _show_notification_once_per_interval(self, title: str, message: str, interva
 
     #region Client Event Handlers
 
-    async def _on_device_update(self, data: Tuple[GeAppliance, Dict[ErdCodeType, Any]]):
+    def _on_device_update_received(self, data: Tuple[GeAppliance, Dict[ErdCodeType, Any]]) -> Awaitable[None]:
+        """
+        Called by the client as soon as an update arrives.  The client only schedules the
+        returned coroutine, so this is where the time of receipt can be taken.  The update
+        is processed by the ingest queue, which sheds stale values when it falls behind.
+        """
+        self._metrics.messages.increment()
+        appliance, update_data = data
+        return self._ingest.async_put(appliance, update_data, time.monotonic())
+
+    @watched("device update")
+    @profiled
+    async def _on_device_update(self, data: Tuple[GeAppliance, Dict[ErdCodeType, Any]], received: Optional[float] = None):
         """Let HA know there's new state."""
         self.last_update_success = True
         appliance, update_data = data
 
-        self._dump_appliance(appliance, update_data)
+        trace = self._span_tracer.start("device update", appliance.mac_addr, received, erds=len(update_data))
+        if received is not None:
+            trace.record("dispatch", received, time.monotonic())
+
+        self._erd_tracer.trace_update(appliance, update_data)
         
-        if not self._is_appliance_valid(appliance):
-            _LOGGER.debug(f"on_device_update: skipping invalid appliance {appliance.mac_addr}")
+        with trace.span("validity check"):
+            valid = self._is_appliance_valid(appliance)
+        if not valid:
+            _LOGGER.debug("on_device_update: skipping invalid appliance %s", appliance.mac_addr)
+            trace.finish()
             return
 
-        self._ensure_appliance_available(appliance)
+        with trace.span("availability check"):
+            self._ensure_appliance_available(appliance)
 
-        try:
-            api = self.appliance_apis[appliance.mac_addr]
-        except KeyError:
-            _LOGGER.info(f"Could not find appliance {appliance.mac_addr} in known device list.")
+        with trace.span("entity lookup"):
+            api = self.appliance_apis.get(appliance.mac_addr)
+        if api is None:
+            _LOGGER.info("Could not find appliance %s in known device list.", appliance.mac_addr)
+            trace.finish()
             return
-        
-        self._update_entity_state(api.entities)
 
+        with trace.span("api update"):
+            api.on_device_update(update_data)
+        with trace.span("render", entities=len(api.entities)):
+            self._update_entity_state(api.entities, trace)
+        trace.finish()
+
+        if received is not None:
+            self._metrics.update_latency.record(time.monotonic() - received)
+        self._schedule_offline_replay(api)
+
+    @watched("appliance list")
     async def _on_appliance_list(self, _):
         """When we get an appliance list, mark it and maybe trigger all ready."""
 
         _LOGGER.debug("Got roster update")
         self.last_update_success = True
+        self._startup.mark("roster")
         if not self._got_roster:
             self._got_roster = True
 
@@ -411,38 +582,77 @@ async def _on_appliance_list(self, _):
             # Trigger all-ready signal            
             await self._async_maybe_trigger_all_ready(True)
 
+    @watched("initial update")
+    @profiled
     async def _on_device_initial_update(self, appliance: GeAppliance):
         """When an appliance first becomes ready, let the system know and schedule periodic updates."""
 
-        self._dump_appliance(appliance)
+        self._erd_tracer.seed(appliance)
 
         if not self._is_appliance_valid(appliance):
-            _LOGGER.debug(f"on_device_initial_update: skipping invalid appliance {appliance.mac_addr}")
+            _LOGGER.debug("on_device_initial_update: skipping invalid appliance %s", appliance.mac_addr)
             return
 
-        _LOGGER.debug(f"Got initial update for {appliance.mac_addr}")
+        _LOGGER.debug("Got initial update for %s", appliance.mac_addr)
+        self._startup.mark("first_initial_update")
 
         self.last_update_success = True
         self._ensure_appliance_available(appliance)
         self._maybe_add_appliance_api(appliance)
         await self._async_maybe_trigger_all_ready()
         await self._start_periodic_updates()
+        self._schedule_offline_replay(self.appliance_apis[appliance.mac_addr])
 
+    @watched("disconnect")
     async def _on_disconnect(self, _):
         """Handle disconnection."""
-        _LOGGER.debug(f"Client has been disconnected, starting reconnection attempts.")
+        _LOGGER.debug("Client has been disconnected, starting reconnection attempts.")
         self.last_update_success = False
         await self._start_reconnect_worker()
 
+    @watched("connect")
     async def _on_connect(self, _):
         """Set state upon connection."""
         self.last_update_success = True
+        self._startup.mark("connected")
+        self._metrics.backoff = 0.0
         await self._stop_reconnect_worker()
 
+        # anything queued for appliances that are already available can go out now,
+        # the rest is replayed once their initial update arrives
+        for api in list(self.appliance_apis.values()):
+            self._schedule_offline_replay(api)
+
     #endregion  
 
     #region Appliance Management
 
+    def _schedule_offline_replay(self, api: ApplianceApi) -> None:
+        """
+        Send an appliance's held commands in a task of its own, so a slow appliance
+        doesn't hold up the others (or whatever handler found it ready).
+        """
+        mac_addr = api.mac_addr
+        if not api.offline_queue.depth or mac_addr in self._replay_tasks:
+            return
+
+        task = self._config_entry.async_create_background_task(
+            self.hass, api.async_replay_offline_commands(), f"ge_home offline replay {mac_addr}"
+        )
+        self._replay_tasks[mac_addr] = task
+        task.add_done_callback(lambda t: self._on_offline_replay_done(mac_addr, t))
+
+    def _on_offline_replay_done(self, mac_addr: str, task: asyncio.Task) -> None:
+        if self._replay_tasks.get(mac_addr) is task:
+            del self._replay_tasks[mac_addr]
+
+    async def _async_cancel_offline_replay(self, mac_addr: str) -> None:
+        task = self._replay_tasks.pop(mac_addr, None)
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
     def _is_appliance_valid(self, appliance: GeAppliance) -> bool:
         return appliance.appliance_type is not None
 
@@ -461,19 +671,18 @@ def _get_appliance_api(self, appliance: GeAppliance) -> ApplianceApi:
         if appliance is None:
             return None
 
-        self._dump_appliance(appliance)
         api_type = get_appliance_api_type(appliance.appliance_type or ErdApplianceType.UNKNOWN)
         return api_type(self, appliance)
 
     def _maybe_add_appliance_api(self, appliance: GeAppliance) -> None:
         mac_addr = appliance.mac_addr
         if mac_addr not in self.appliance_apis:
-            _LOGGER.debug(f"Adding appliance api for appliance {mac_addr} ({appliance.appliance_type})")
+            _LOGGER.debug("Adding appliance api for appliance %s (%s)", mac_addr, appliance.appliance_type)
             api = self._get_appliance_api(appliance)
             api.build_entities_list()
             self.appliance_apis[mac_addr] = api
         else:
-            _LOGGER.debug(f"Already have appliance {mac_addr} ({appliance.appliance_type}), switching reference.")
+            _LOGGER.debug("Already have appliance %s (%s), switching reference.", mac_addr, appliance.appliance_type)
             # if we already have the API, switch out its appliance reference for this one
             api = self.appliance_apis[mac_addr]
             api.appliance = appliance
@@ -494,12 +703,31 @@ async def _async_maybe_trigger_all_ready(self, force: bool = False) -> None:
             _LOGGER.debug("Ready to go, sending ready signal!")
             self._init_done = True
             self._all_initial_updates_received.set()
+            self._startup.mark("all_initial_updates")
 
             await self._client.async_event(EVENT_ALL_APPLIANCES_READY, None)
-            async_dispatcher_send(
-                self.hass, 
-                self.signal_ready, 
-                list(self.appliance_apis.values()))
+            with self._watchdog.measure("ready dispatch"):
+                async_dispatcher_send(
+                    self.hass, 
+                    self.signal_ready, 
+                    list(self.appliance_apis.values()))
+            self._startup.mark("ready_dispatched")
+            # the ready signal is sent again after every reconnect, only the first is startup
+            if self._startup_task is None:
+                self._startup_task = self._config_entry.async_create_background_task(
+                    self.hass, self._async_finish_startup(), "ge_home startup timing"
+                )
+
+    async def _async_finish_startup(self) -> None:
+        """The platforms add entities in the background after the ready signal, wait until they've settled."""
+        deadline = time.monotonic() + STARTUP_SETTLE_TIMEOUT
+        entities = -1
+        while self._startup.entities != entities and time.monotonic() < deadline:
+            entities = self._startup.entities
+            await asyncio.sleep(STARTUP_SETTLE_INTERVAL)
+        self._startup.finish()
+        startup = self._startup.as_dict()
+        _LOGGER.debug("Startup took %.2fs: %s", startup["total_s"], startup["phases_s"])
             
     async def _async_remove_stale_devices(self):
         """Remove devices/entities from HA that no longer exist in the cloud."""
@@ -520,8 +748,10 @@ async def _async_remove_stale_devices(self):
         # Remove stale appliance APIs from our internal list
         for mac in list(self._appliance_apis.keys()):
             if mac not in valid_macs:
-                _LOGGER.info(f"Removing stale appliance API {mac}")
-                self._appliance_apis.pop(mac)
+                _LOGGER.info("Removing stale appliance API %s", mac)
+                await self._supervisor.async_remove(mac)
+                await self._async_cancel_offline_replay(mac)
+                await self._appliance_apis.pop(mac).async_shutdown()
 
         # Update current macs for HA registry cleanup
         current_macs = valid_macs
@@ -539,8 +769,11 @@ async def _async_remove_stale_devices(self):
                     device_mac = ident[1]
                     break
 
+            if device_mac == self.hub_id:
+                continue
+
             if device_mac and device_mac not in current_macs:
-                _LOGGER.info(f"Removing stale device {device_entry.name} ({device_mac}) from HA registry")
+                _LOGGER.info("Removing stale device %s (%s) from HA registry", device_entry.name, device_mac)
 
                 # Remove all entities linked to this device
                 for entity_entry in list(entity_registry.entities.values()):
@@ -555,55 +788,42 @@ async def _async_remove_stale_devices(self):
     #region Background Updates
 
     async def _start_periodic_updates(self):
-
-        if self._updater_task is not None and not self._updater_task.done():
-            _LOGGER.debug("Polling already started, ignoring scheduling request.")
-            return
-
-        self._updater_task = self.hass.loop.create_task(self._request_periodic_updates())
-        _LOGGER.debug("Scheduled background updater for execution.")
+        """Poll each appliance on the update interval, in its own supervised task."""
+        if not self._polling:
+            _LOGGER.debug("Start requesting periodic updates.")
+        self._polling = True
+
+        # idempotent per appliance, so this picks up appliances added since
+        for mac_addr, api in self.appliance_apis.items():
+            # a poll that times out is stuck, so drop it rather than queueing the next one behind it
+            self._supervisor.start(
+                mac_addr, "poll", lambda api=api: self._async_poll_appliance(api), STATE_UPDATE_INTERVAL,
+                on_timeout=api.command_queue.async_abandon_poll
+            )
 
     async def _stop_periodic_updates(self) -> None:
-        if self._updater_task:
-            self._updater_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._updater_task
-            self._updater_task = None        
-
-    async def _request_periodic_updates(self):
-        """Periodic update loop."""
-
-        _LOGGER.debug("Start requesting periodic updates.")
+        if self._polling:
+            _LOGGER.debug("Stopped requesting periodic updates.")
+        self._polling = False
+        await self._supervisor.async_stop()
+
+    @profiled
+    async def _async_poll_appliance(self, api: ApplianceApi):
+        """Request a state update from an appliance."""
+        if self._client is None or not self.connected or not self._client.available:
+            _LOGGER.debug(
+                "Connection issue, cannot get update (client: %s, connected: %s, available: %s)",
+                self._client is None, self.connected, self.available
+            )
+            return
 
         try:
-            while self.connected:
-                await asyncio.sleep(STATE_UPDATE_INTERVAL)
-
-                if (self._client is None or not self.connected or not self._client.available):
-                    _LOGGER.debug(
-                        f"Connection issue, cannot get update ("
-                        f"client: { self._client is None },"
-                        f"connected: { self.connected },"
-                        f"available: { self.available }"
-                    )
-                    continue
-
-                for api in self.appliance_apis.values():
-                    try:
-                        if api.appliance is None:
-                            _LOGGER.debug(f"Appliance {api} is not valid, skipping update.")
-                            continue
-
-                        _LOGGER.debug(f"Requesting update for {api.appliance.mac_addr}")
-                        await api.appliance.async_request_update()
-                    except Exception as err:
-                        _LOGGER.debug(f"Poll update failed for [{api.appliance.mac_addr}]: {err}")
-
-        except asyncio.CancelledError:
-            # Normal exit when shutting down
-            pass
-
-        _LOGGER.debug("Stopped requesting periodic updates.")         
+            _LOGGER.debug("Requesting update for %s", api.mac_addr)
+            await api.async_request_update()
+            self._metrics.polls_sent += 1
+        except Exception:
+            self._metrics.polls_failed += 1
+            raise
 
     #endregion
 
@@ -617,24 +837,48 @@ async def _refresh_ha_state(self):
 
         self._update_entity_state(entities)
 
-    def _update_entity_state(self, entities: List[Entity]):
+    @profiled
+    def _update_entity_state(self, entities: List[Entity], trace: Any = NULL_TRACE):
         """ Performs a refresh of the state for a list of entities """
 
         from .entities import GeEntity
+        written = skipped = 0
+        timed = self._render_costs.enabled
+        traced = trace is not NULL_TRACE
+        # checked once per pass; the debug lines below would otherwise render each entity's state twice
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         for entity in entities:
             # if this is a GeEntity, check if it's been added
             #if not, don't try to refresh this entity
             if isinstance(entity, GeEntity):
                 gee: GeEntity = entity
                 if not gee.added:
-                    _LOGGER.debug(f"Entity {entity} ({entity.unique_id}, {entity.entity_id}) not yet added, skipping update...")
+                    if debug:
+                        _LOGGER.debug("Entity %s (%s, %s) not yet added, skipping update...", entity, entity.unique_id, entity.entity_id)
+                    skipped += 1
                     continue
             if entity.enabled:
                 try:
-                    _LOGGER.debug(f"Refreshing state for {entity} ({entity.unique_id}, {entity.entity_id}), state: {entity.state}")
-                    entity.async_write_ha_state()
+                    if debug:
+                        _LOGGER.debug("Refreshing state for %s (%s, %s), state: %s", entity, entity.unique_id, entity.entity_id, entity.state)
+                    if timed or traced:
+                        start = time.monotonic()
+                        entity.async_write_ha_state()
+                        end = time.monotonic()
+                        if timed:
+                            self._render_costs.record(entity, end - start)
+                        if traced:
+                            trace.record("write", start, end, entity=entity.entity_id)
+                    else:
+                        entity.async_write_ha_state()
+                    written += 1
                 except:
-                    _LOGGER.warning(f"Could not refresh state for {entity} ({entity.unique_id}, {entity.entity_id}", exc_info=True)
+                    _LOGGER.warning("Could not refresh state for %s (%s, %s", entity, entity.unique_id, entity.entity_id, exc_info=True)
+            else:
+                skipped += 1
+
+        self._metrics.state_writes.increment(written)
+        self._metrics.writes_skipped += skipped
 
     async def _throttled_refresh_ha_state(self):
         now = time.time()
@@ -648,44 +892,5 @@ async def _throttled_refresh_ha_state(self):
 
     #endregion
 
-    #region Debugging
-
-    def _dump_appliance(self, appliance: GeAppliance, update_data: Optional[Dict[ErdCodeType, Any]] = None) -> None:
-        if not _LOGGER.isEnabledFor(logging.DEBUG):
-            return
-
-        import pprint
-        try:
-            _LOGGER.debug(f"--- COMPREHENSIVE DUMP FOR APPLIANCE: {appliance.mac_addr} ---")
-            appliance_data = {}            
-            # dir() gets all attrs, including properties and methods
-            for attr_name in dir(appliance):
-                # skip "magic" methods and "private" attributes to reduce noise
-                if attr_name.startswith('_'):
-                    continue                
-                try:
-                    value = getattr(appliance, attr_name)
-                    # for now skip methods - we only want data
-                    if callable(value):
-                        continue
-                    appliance_data[attr_name] = value
-                except Exception:
-                    # some props might fail if called out of context
-                    appliance_data[attr_name] = "Error: Could not read attribute"
-            
-            # add the internal property cache (i.e. current values)
-            appliance_data["property_cache"] = appliance._property_cache
-
-            # add the update data if available
-            if update_data is not None:
-                appliance_data["update_data"] = update_data
-            
-            _LOGGER.debug(pprint.pformat(appliance_data))
-            _LOGGER.debug("--- END OF COMPREHENSIVE DUMP ---")
-        except Exception as e:
-            _LOGGER.error(f"Could not dump appliance {appliance}: {e}")
-
-    #endregion
-
     #endregion
     
@@ -0,0 +1,107 @@
+"""Watchdog for coordinator callbacks that hold up the event loop"""
+
+import asyncio
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Optional, TypeVar
+
+from gehomesdk import GeAppliance
+
+from .const import WATCHDOG_WARNING_INTERVAL
+from .metrics import CoordinatorMetrics
+from .profiling import SteppedCoroutine
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T", bound=Callable[..., Any])
+
+class CallbackWatchdog:
+    """
+    Checks how long coordinator callbacks block the event loop against a budget.
+
+    For coroutines, each step (the code run between two awaits) is checked separately,
+    since the time spent suspended doesn't block anything.  Violations are counted per
+    phase, and warnings are logged at most once per interval per phase.
+    """
+
+    def __init__(self, metrics: CoordinatorMetrics, budget: float):
+        self._metrics = metrics
+        self.budget = budget
+        self._violations: Dict[str, int] = {}
+        self._worst: Dict[str, float] = {}
+        self._last_warning: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    @property
+    def violations(self) -> int:
+        return sum(self._violations.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_ms": round(self.budget * 1000, 1),
+            "violations": dict(self._violations),
+            "worst_ms": {phase: round(worst * 1000, 1) for phase, worst in self._worst.items()},
+        }
+
+    @contextmanager
+    def measure(self, phase: str, appliance: Optional[str] = None):
+        """Check the time taken by a synchronous block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.check(phase, appliance, time.perf_counter() - start)
+
+    async def async_watch(self, phase: str, appliance: Optional[str], coro: Coroutine) -> Any:
+        """Run a coroutine, checking each of its steps."""
+        return await SteppedCoroutine(coro, lambda: self.measure(phase, appliance))
+
+    def check(self, phase: str, appliance: Optional[str], elapsed: float) -> None:
+        if elapsed <= self.budget:
+            return
+
+        self._violations[phase] = self._violations.get(phase, 0) + 1
+        self._metrics.callback_violations += 1
+        if elapsed > self._worst.get(phase, 0.0):
+            self._worst[phase] = elapsed
+
+        now = time.monotonic()
+        if now - self._last_warning.get(phase, 0.0) < WATCHDOG_WARNING_INTERVAL:
+            self._suppressed[phase] = self._suppressed.get(phase, 0) + 1
+            return
+
+        self._last_warning[phase] = now
+        _LOGGER.warning(
+            "GE Home %s%s blocked the event loop for %.0f ms (budget %.0f ms, %d similar warnings suppressed)",
+            phase, f" for {appliance}" if appliance else "", elapsed * 1000, self.budget * 1000,
+            self._suppressed.pop(phase, 0)
+        )
+
+def _get_appliance_id(args) -> Optional[str]:
+    """Find the appliance a client event is about (the argument is the appliance or (appliance, data))."""
+    for arg in args:
+        if isinstance(arg, (tuple, list)) and arg:
+            arg = arg[0]
+        if isinstance(arg, GeAppliance):
+            return arg.mac_addr
+    return None
+
+def watched(phase: str) -> Callable[[_T], _T]:
+    """Check a coordinator callback (sync or async) against the coordinator's watchdog."""
+
+    def decorator(func: _T) -> _T:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                return await self.watchdog.async_watch(phase, _get_appliance_id(args), func(self, *args, **kwargs))
+            return async_wrapper # type: ignore
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.watchdog.measure(phase, _get_appliance_id(args)):
+                return func(self, *args, **kwargs)
+        return wrapper # type: ignore
+
+    return decorator